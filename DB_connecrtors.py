@@ -1,125 +1,691 @@
-import mysql.connector
-from mysql.connector import Error, pooling
-import getpass
-
-# Global connection pool
-connection_pool = None
-db_config = None
-
-def initialize_connection_pool():
-    """Initialize the connection pool once at startup"""
-    global connection_pool, db_config
-    
-    if connection_pool is not None:
-        return True
-    
-    try:
-        password = getpass.getpass("Enter MySQL password for root: ")
-        
-        db_config = {
-            "host": "localhost",
-            "user": "root",
-            "password": password,
-            "database": "vehicle_workshop_management"
-        }
-        
-        # Create connection pool with 5-10 connections
-        connection_pool = pooling.MySQLConnectionPool(
-            pool_name="workshop_pool",
-            pool_size=5,
-            pool_reset_session=True,
-            **db_config
-        )
-        
-        print("✓ Connected to MySQL database!")
-        print("✓ Connection pool initialized")
-        return True
-        
-    except Error as e:
-        print(f"✗ Error while connecting to MySQL: {e}")
-        return False
-
-def get_connection():
-    """Get a connection from the pool"""
-    global connection_pool
-    
-    if connection_pool is None:
-        if not initialize_connection_pool():
-            return None
-    
-    try:
-        return connection_pool.get_connection()
-    except Error as e:
-        print(f"Error getting connection from pool: {e}")
-        return None
-
-def run_query(query, params=None, fetch=False):
-    """
-    Generic query runner with connection pooling
-    
-    Args:
-        query: SQL query string
-        params: Query parameters (tuple or None)
-        fetch: If True, returns result set; if False, commits transaction
-    
-    Returns:
-        - List of dict rows if fetch=True and successful
-        - True if fetch=False and successful
-        - Error string if failed
-        - None if connection failed
-    """
-    conn = get_connection()
-    if not conn:
-        return "Failed to connect to database"
-
-    cursor = None
-    try:
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute(query, params)
-        
-        if fetch:
-            result = cursor.fetchall()
-            return result
-        else:
-            conn.commit()
-            return True
-            
-    except Error as e:
-        # Rollback on error
-        if conn:
-            conn.rollback()
-        print(f"Query Error: {e}")
-        return str(e)
-        
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
-
-def test_connection():
-    """Test database connection and return status"""
-    try:
-        conn = get_connection()
-        if conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            conn.close()
-            return True, "Connection successful"
-        return False, "Failed to get connection"
-    except Error as e:
-        return False, str(e)
-
-def close_pool():
-    """Close all connections in the pool (call on app exit)"""
-    global connection_pool
-    if connection_pool:
-        try:
-            # Connection pools don't have a direct close method
-            # Connections are closed when they're returned to the pool
-            connection_pool = None
-            print("Connection pool closed")
-        except Exception as e:
+import mysql.connector
+from mysql.connector import Error
+from connection_pool import ConnectionPool
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import OrderedDict
+import threading
+import getpass
+import time
+import query_log
+import sys
+import os
+import re
+
+# Global connection pool
+connection_pool = None
+db_config = None
+
+# Backend selection. Unset means the MySQL server (password prompt);
+# "sqlite:" / "sqlite::memory:" is a private in-memory database and
+# "sqlite:path/to/file.db" a database file, both created from Commands.sql
+# when empty. Overridden by passing url= to initialize_connection_pool.
+DATABASE_URL_ENV = "WORKSHOP_DB"
+
+# Apply pending migrations/*.sql when a SQLite database is opened (MySQL is
+# migrated explicitly with migrate.py)
+SQLITE_AUTO_MIGRATE = True
+
+# SQL dialect of the active backend ("mysql" or "sqlite")
+dialect = "mysql"
+sqlite_database = None
+
+# Guards pool creation so two threads can't both prompt/create it
+_pool_lock = threading.RLock()
+
+# Pool sizing: enough for several desks at peak without holding idle
+# connections all day. Callers wait up to POOL_WAIT_TIMEOUT seconds for a
+# free connection before get_connection gives up.
+POOL_MIN_SIZE = 2
+POOL_MAX_SIZE = 10
+POOL_MAX_WAITERS = 20
+POOL_WAIT_TIMEOUT = 5.0
+POOL_IDLE_TIMEOUT = 300.0
+POOL_PRE_PING_AFTER = 30.0
+# "none" keeps query_registry's prepared statements; see connection_pool.RESET_MODES
+POOL_RESET = "none"
+
+# Rows fetched per round trip by stream_query
+STREAM_CHUNK_SIZE = 500
+
+# Opt-in read-through result cache (see QueryCache)
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_ENTRIES = 256
+CACHE_MAX_BYTES = 8 * 1024 * 1024
+
+# Background executor used by the GUI so queries don't block the Tk main thread
+QUERY_WORKERS = 5
+_executor = None
+_executor_lock = threading.Lock()
+
+def initialize_connection_pool(url=None, **pool_options):
+    """
+    Initialize the connection pool once at startup (main thread only)
+    
+    Args:
+        url: Backend to use (see DATABASE_URL_ENV); defaults to that
+             environment variable, then MySQL
+        pool_options: Override the POOL_* defaults: min_size, max_size,
+                      max_waiters, wait_timeout, idle_timeout, pre_ping_after, reset
+    """
+    with _pool_lock:
+        if connection_pool is not None:
+            return True
+        
+        url = url or os.environ.get(DATABASE_URL_ENV, "")
+        if url.startswith("sqlite:"):
+            return _create_sqlite_pool(url[len("sqlite:"):], pool_options)
+        
+        # Never prompt for a password from a worker thread - the pool must be
+        # created by the main thread before any background queries run
+        if threading.current_thread() is not threading.main_thread():
+            print("✗ Connection pool not initialized (must be created on the main thread)")
+            return False
+        
+        return _create_pool(pool_options)
+
+def _pool_options(pool_options):
+    """POOL_* defaults with caller overrides applied"""
+    options = {
+        "min_size": POOL_MIN_SIZE,
+        "max_size": POOL_MAX_SIZE,
+        "max_waiters": POOL_MAX_WAITERS,
+        "wait_timeout": POOL_WAIT_TIMEOUT,
+        "idle_timeout": POOL_IDLE_TIMEOUT,
+        "pre_ping_after": POOL_PRE_PING_AFTER,
+        "reset": POOL_RESET,
+    }
+    options.update(pool_options)
+    return options
+
+def _create_sqlite_pool(path, pool_options):
+    """Open (and if needed create) a SQLite database and pool it (caller holds _pool_lock)"""
+    global connection_pool, dialect, sqlite_database
+    import sqlite_backend
+    
+    try:
+        path = path[2:] if path.startswith("//") else path
+        database = sqlite_backend.SQLiteDatabase(path or ":memory:")
+        if not database.has_schema():
+            skipped = database.load_schema()
+            if skipped:
+                print(f"SQLite schema: skipped {', '.join(skipped)} (no SQLite equivalent)")
+        if SQLITE_AUTO_MIGRATE:
+            import migrate
+            conn = database.connect()
+            try:
+                migrate.apply_migrations(conn, verbose=False)
+            finally:
+                conn.close()
+        
+        options = _pool_options(pool_options)
+        options["max_size"] = min(options["max_size"], database.max_connections)
+        options["min_size"] = min(options["min_size"], options["max_size"])
+        connection_pool = ConnectionPool(connect=database.connect, **options)
+        sqlite_database = database
+        dialect = sqlite_backend.DIALECT
+        
+        print(f"✓ Using SQLite database {database.path or ':memory:'}")
+        return True
+        
+    except (Error, OSError) as e:
+        print(f"✗ Error while opening SQLite database: {e}")
+        return False
+
+def _create_pool(pool_options):
+    """Prompt for credentials and create the pool (caller holds _pool_lock)"""
+    global connection_pool, db_config
+    
+    try:
+        password = getpass.getpass("Enter MySQL password for root: ")
+        
+        db_config = {
+            "host": "localhost",
+            "user": "root",
+            "password": password,
+            "database": "vehicle_workshop_management"
+        }
+        
+        options = _pool_options(pool_options)
+        
+        # Opens min_size connections now, the rest on demand.
+        # No session reset on return by default: COM_RESET_CONNECTION would
+        # deallocate the statements prepared by query_registry. Autocommit
+        # keeps plain reads from holding a stale snapshot open on an idle
+        # pooled connection; multi-statement writes open an explicit
+        # transaction instead.
+        connection_pool = ConnectionPool(autocommit=True, **options, **db_config)
+        
+        print("✓ Connected to MySQL database!")
+        print("✓ Connection pool initialized")
+        return True
+        
+    except Error as e:
+        print(f"✗ Error while connecting to MySQL: {e}")
+        return False
+
+def get_connection():
+    """Get a connection from the pool"""
+    pool = connection_pool
+    
+    if pool is None:
+        if not initialize_connection_pool():
+            return None
+        pool = connection_pool
+    
+    try:
+        return pool.get_connection()
+    except Error as e:
+        print(f"Error getting connection from pool: {e}")
+        return None
+
+def pool_stats():
+    """Live metrics of the connection pool (empty dict before it exists)"""
+    pool = connection_pool
+    return pool.stats() if pool else {}
+
+# ---------- result cache ----------
+
+# Tables whose rows change when another table is written (ON DELETE CASCADE,
+# or triggers such as the parts_total ones)
+_CASCADES = {
+    "customers": {"vehicle"},
+    "parts": {"service_job"},
+}
+
+_READ_TABLES = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.IGNORECASE)
+_WRITE_TABLE = re.compile(
+    r"^\s*(?:INSERT\s+(?:IGNORE\s+)?INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM|TRUNCATE(?:\s+TABLE)?)\s+`?(\w+)`?",
+    re.IGNORECASE
+)
+
+def read_tables(query):
+    """Lower-cased names of the tables a SELECT reads"""
+    return frozenset(t.lower() for t in _READ_TABLES.findall(query))
+
+def written_tables(query):
+    """
+    Lower-cased names of the tables a statement may change
+    
+    Returns None when that can't be told from the text (CALL, DDL, ...), which
+    callers treat as "anything may have changed".
+    """
+    match = _WRITE_TABLE.match(query)
+    if not match:
+        if re.match(r"^\s*(?:SELECT|WITH|SHOW|EXPLAIN)\b", query, re.IGNORECASE):
+            return frozenset()
+        return None
+    table = match.group(1).lower()
+    return frozenset({table} | _CASCADES.get(table, set()))
+
+def _estimate_size(rows):
+    """Rough in-memory size of a result set in bytes"""
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row.values():
+            size += sys.getsizeof(value)
+    return size
+
+class QueryCache:
+    """
+    LRU + TTL cache of SELECT results, tagged with the tables they read
+    
+    Writes call invalidate() with the tables they touched, which drops every
+    entry tagged with one of them. Each table also has a generation counter:
+    a read that raced with a write on its tables is not stored, so a stale
+    result can never be cached after the invalidation.
+    """
+
+    def __init__(self, ttl=CACHE_TTL_SECONDS, max_entries=CACHE_MAX_ENTRIES,
+                 max_bytes=CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()   # key -> (expires, tables, rows, size)
+        self._generations = {}          # table -> write counter
+        self._global_generation = 0     # bumped by writes to unknown tables
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def snapshot(self, tables):
+        """Generation stamp to pass to put() - take it before running the query"""
+        with self._lock:
+            return (self._global_generation,
+                    tuple(self._generations.get(t, 0) for t in sorted(tables)))
+
+    def get(self, key):
+        """Cached rows for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[2])
+
+    def put(self, key, tables, rows, stamp, ttl=None):
+        """Store rows unless a write hit their tables since stamp was taken"""
+        size = _estimate_size(rows)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            current = (self._global_generation,
+                       tuple(self._generations.get(t, 0) for t in sorted(tables)))
+            if current != stamp:
+                return
+            if key in self._entries:
+                self._drop(key)
+            expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+            self._entries[key] = (expires, tables, list(rows), size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries
+                                     or self._bytes > self.max_bytes):
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, tables):
+        """Drop entries reading any of tables (None = drop everything)"""
+        with self._lock:
+            if tables is None:
+                self._global_generation += 1
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return
+            for t in tables:
+                self._generations[t] = self._generations.get(t, 0) + 1
+            stale = [k for k, e in self._entries.items() if e[1] & tables]
+            for k in stale:
+                self._drop(k)
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """Empty the cache (counters are kept)"""
+        self.invalidate(None)
+
+    def stats(self):
+        """Hit/miss counters and current footprint"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry[3]
+
+query_cache = QueryCache()
+
+def note_write(query):
+    """Invalidate cached results affected by a successful write statement"""
+    tables = written_tables(query)
+    if tables is None or tables:
+        query_cache.invalidate(tables)
+
+def cached_fetch(key, query, fetch_rows, ttl=None):
+    """
+    Read-through helper shared by run_query and query_registry.run_named
+    
+    fetch_rows() runs the query and returns rows or an error string; errors
+    are passed through and never cached.
+    """
+    cached = query_cache.get(key)
+    if cached is not None:
+        return cached
+    tables = read_tables(query)
+    stamp = query_cache.snapshot(tables)
+    rows = fetch_rows()
+    if not isinstance(rows, str):
+        query_cache.put(key, tables, rows, stamp, ttl)
+    return rows
+
+def cache_stats():
+    """Statistics of the shared result cache"""
+    return query_cache.stats()
+
+def run_query(query, params=None, fetch=False, cache=False, ttl=None):
+    """
+    Generic query runner with connection pooling
+    
+    Args:
+        query: SQL query string
+        params: Query parameters (tuple or None)
+        fetch: If True, returns result set; if False, commits transaction
+        cache: If True (fetch only), serve repeat reads from the result cache
+        ttl: Cache lifetime in seconds for this result (default CACHE_TTL_SECONDS)
+    
+    Returns:
+        - List of dict rows if fetch=True and successful
+        - True if fetch=False and successful
+        - Error string if failed
+        - None if connection failed
+    """
+    if fetch and cache:
+        key = ("sql", query, tuple(params) if params else ())
+        return cached_fetch(key, query, lambda: run_query(query, params, fetch=True), ttl)
+
+    conn = get_connection()
+    if not conn:
+        return "Failed to connect to database"
+
+    cursor = None
+    try:
+        cursor = conn.cursor(dictionary=True)
+        started = time.perf_counter()
+        cursor.execute(query, params)
+        
+        if fetch:
+            result = cursor.fetchall()
+            query_log.record(query, params, time.perf_counter() - started, len(result), conn)
+            return result
+        else:
+            conn.commit()
+            query_log.record(query, params, time.perf_counter() - started, cursor.rowcount, conn)
+            note_write(query)
+            return True
+            
+    except Error as e:
+        # Rollback on error
+        if conn:
+            conn.rollback()
+        print(f"Query Error: {e}")
+        return str(e)
+        
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def run_many(query, rows):
+    """
+    Bulk query runner - executes one statement for many parameter rows
+    
+    Uses executemany on a single pooled connection, so an INSERT ... VALUES
+    is rewritten into one multi-row INSERT and committed in one transaction.
+    Either every row is written or none are.
+    
+    Args:
+        query: SQL statement with %s placeholders
+        rows: List of parameter tuples
+    
+    Returns:
+        - True if all rows were written
+        - Error string if failed (nothing is committed)
+    """
+    if not rows:
+        return True
+    
+    conn = get_connection()
+    if not conn:
+        return "Failed to connect to database"
+
+    cursor = None
+    try:
+        conn.start_transaction()
+        cursor = conn.cursor()
+        started = time.perf_counter()
+        cursor.executemany(query, rows)
+        conn.commit()
+        # Plans are per row, so only the first row's is captured
+        query_log.record(query, rows[0], time.perf_counter() - started, cursor.rowcount, conn)
+        note_write(query)
+        return True
+            
+    except Error as e:
+        conn.rollback()
+        print(f"Bulk Query Error: {e}")
+        return str(e)
+        
+    finally:
+        if cursor:
+            cursor.close()
+        conn.close()
+
+def stream_query(query, params=None, chunk_size=STREAM_CHUNK_SIZE, columns=None):
+    """
+    Generator yielding result rows (dicts) one at a time
+    
+    Uses an unbuffered cursor so the server streams the result set and only
+    chunk_size rows are held in memory at once (fetched with fetchmany). The
+    pooled connection is held until the generator is exhausted or closed.
+    
+    If columns (a list) is given, the result's column names are appended to
+    it once the query has run - before the first row, so they are known even
+    when no rows come back.
+    
+    Raises mysql.connector.Error on failure - a generator can't return an
+    error string like run_query does.
+    """
+    conn = get_connection()
+    if not conn:
+        raise Error("Failed to connect to database")
+
+    cursor = None
+    finished = False
+    try:
+        cursor = conn.cursor(dictionary=True, buffered=False)
+        cursor.execute(query, params)
+        if columns is not None and cursor.description:
+            columns.extend(d[0] for d in cursor.description)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
+        finished = True
+        
+    finally:
+        if finished:
+            cursor.close()
+        else:
+            # Abandoned or failed mid-stream. Draining the rest could mean
+            # reading millions of rows, so drop the session instead; the pool
+            # opens a fresh connection when one is next needed.
+            try:
+                conn.disconnect()
+            except Error:
+                pass
+        conn.close()
+
+class Transaction:
+    """
+    Unit of work bound to one pooled connection (create via transaction())
+    
+    Statements run on the same connection and are committed together when the
+    with-block exits. Errors are raised rather than returned as strings so the
+    block is aborted and rolled back.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.cursor = conn.cursor(dictionary=True)
+        self._savepoint_seq = 0
+        # Tables written so far (None once an unclassifiable statement ran);
+        # the cache is invalidated for them after commit
+        self.written = frozenset()
+
+    def _track(self, query):
+        tables = written_tables(query)
+        if self.written is not None:
+            self.written = None if tables is None else self.written | tables
+
+    def execute(self, query, params=None, fetch=False):
+        """
+        Run one statement inside the transaction
+        
+        Returns:
+            - List of dict rows if fetch=True
+            - Affected row count otherwise
+        """
+        started = time.perf_counter()
+        self.cursor.execute(query, params)
+        if fetch:
+            rows = self.cursor.fetchall()
+            query_log.record(query, params, time.perf_counter() - started, len(rows), self.conn)
+            return rows
+        query_log.record(query, params, time.perf_counter() - started, self.cursor.rowcount, self.conn)
+        self._track(query)
+        return self.cursor.rowcount
+
+    def execute_many(self, query, rows):
+        """Run one statement for many parameter rows, returns affected row count"""
+        if not rows:
+            return 0
+        started = time.perf_counter()
+        self.cursor.executemany(query, rows)
+        query_log.record(query, rows[0], time.perf_counter() - started, self.cursor.rowcount, self.conn)
+        self._track(query)
+        return self.cursor.rowcount
+
+    def savepoint(self, name=None):
+        """Create a savepoint and return its name"""
+        if name is None:
+            self._savepoint_seq += 1
+            name = f"sp_{self._savepoint_seq}"
+        self.cursor.execute(f"SAVEPOINT {name}")
+        return name
+
+    def rollback_to(self, name):
+        """Undo everything done since the savepoint (the savepoint is kept)"""
+        self.cursor.execute(f"ROLLBACK TO SAVEPOINT {name}")
+
+    def release(self, name):
+        """Forget a savepoint, keeping its changes"""
+        self.cursor.execute(f"RELEASE SAVEPOINT {name}")
+
+    @contextmanager
+    def nested(self):
+        """
+        Savepoint block - on error only the block's changes are undone
+        
+        The exception is re-raised; catch it inside the outer transaction to
+        carry on with the rest of the unit of work.
+        """
+        name = self.savepoint()
+        try:
+            yield self
+        except Exception:
+            self.rollback_to(name)
+            raise
+        else:
+            self.release(name)
+
+    def close(self):
+        """Close the cursor (the connection is returned by transaction())"""
+        self.cursor.close()
+
+@contextmanager
+def transaction():
+    """
+    Run several statements on one pooled connection with a single commit
+    
+    Usage:
+        with transaction() as tx:
+            tx.execute("INSERT ...", params)
+            tx.execute("INSERT ...", params)
+    
+    Commits when the block finishes, rolls back and re-raises on any error.
+    Raises mysql.connector.Error if no connection is available.
+    """
+    conn = get_connection()
+    if not conn:
+        raise Error("Failed to connect to database")
+
+    tx = None
+    try:
+        conn.start_transaction()
+        tx = Transaction(conn)
+        yield tx
+        conn.commit()
+        if tx.written is None or tx.written:
+            query_cache.invalidate(tx.written)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if tx:
+            tx.close()
+        conn.close()
+
+def get_executor():
+    """Get (or lazily create) the background query executor"""
+    global _executor
+    
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=QUERY_WORKERS,
+                thread_name_prefix="db_worker"
+            )
+        return _executor
+
+def submit_call(func, *args, **kwargs):
+    """
+    Run any data-access function on the background executor
+    
+    Returns:
+        concurrent.futures.Future resolving to func's return value
+    """
+    return get_executor().submit(func, *args, **kwargs)
+
+def submit_query(query, params=None, fetch=False):
+    """
+    Non-blocking variant of run_query
+    
+    Returns:
+        concurrent.futures.Future resolving to whatever run_query returns
+    """
+    return submit_call(run_query, query, params, fetch)
+
+def test_connection():
+    """Test database connection and return status"""
+    try:
+        conn = get_connection()
+        if conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            conn.close()
+            return True, "Connection successful"
+        return False, "Failed to get connection"
+    except Error as e:
+        return False, str(e)
+
+def close_pool():
+    """Close all connections in the pool (call on app exit)"""
+    global connection_pool, sqlite_database, _executor
+    
+    with _executor_lock:
+        if _executor is not None:
+            # Drop queued work; running queries finish on their own
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+    
+    if connection_pool:
+        try:
+            # Idle connections close now, checked-out ones when returned
+            connection_pool.close()
+            connection_pool = None
+            if sqlite_database is not None:
+                sqlite_database.close()
+                sqlite_database = None
+            print("Connection pool closed")
+        except Exception as e:
             print(f"Error closing pool: {e}")
\ No newline at end of file
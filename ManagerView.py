@@ -1,163 +1,224 @@
-from DB_connecrtors import run_query
-
-def add_new_technician(tech_id, fname, lname, trained_for, specialization, yoe):
-    """
-    Add a new service technician
-    Returns (success: bool, message: str)
-    """
-    query = """
-    INSERT INTO service_technician (technician_ID, Fname, Name, Trained_For, Specialization, YOE)
-    VALUES (%s, %s, %s, %s, %s, %s)
-    """
-    
-    try:
-        # Validate inputs
-        if not all([tech_id, fname, lname, trained_for, specialization, yoe]):
-            return False, "All fields are required"
-        
-        yoe_int = int(yoe)
-        if yoe_int < 0:
-            return False, "Years of Experience must be non-negative"
-        
-        result = run_query(query, (tech_id, fname, lname, trained_for, specialization, yoe_int))
-        
-        if result is True:
-            return True, f"Technician {fname} {lname} added successfully!"
-        else:
-            return False, f"Error: {result}"
-            
-    except ValueError:
-        return False, "Years of Experience must be a valid number"
-    except Exception as e:
-        return False, f"Error: {str(e)}"
-
-def add_new_customer_rep(emp_id, name, phone, yoe):
-    """
-    Add a new customer representative
-    Returns (success: bool, message: str)
-    """
-    query = """
-    INSERT INTO customer_reps (Employee_ID, Name, Phone_Number, YOE)
-    VALUES (%s, %s, %s, %s)
-    """
-    
-    try:
-        # Validate inputs
-        if not all([emp_id, name, phone, yoe]):
-            return False, "All fields are required"
-        
-        phone_int = int(phone)
-        yoe_int = int(yoe)
-        
-        if yoe_int < 0:
-            return False, "Years of Experience must be non-negative"
-        
-        result = run_query(query, (emp_id, name, phone_int, yoe_int))
-        
-        if result is True:
-            return True, f"Customer Representative {name} added successfully!"
-        else:
-            return False, f"Error: {result}"
-            
-    except ValueError:
-        return False, "Phone and YOE must be valid numbers"
-    except Exception as e:
-        return False, f"Error: {str(e)}"
-
-def get_all_technicians():
-    """
-    Get all service technicians
-    Returns list of technician dictionaries
-    """
-    query = """
-    SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE
-    FROM service_technician
-    ORDER BY Fname, Name
-    """
-    
-    try:
-        results = run_query(query, fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching technicians: {e}")
-        return []
-
-def get_all_customer_reps():
-    """
-    Get all customer representatives
-    Returns list of customer rep dictionaries
-    """
-    query = """
-    SELECT Employee_ID, Name, Phone_Number, YOE
-    FROM customer_reps
-    ORDER BY Name
-    """
-    
-    try:
-        results = run_query(query, fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching customer reps: {e}")
-        return []
-
-def delete_technician(tech_id):
-    """
-    Delete a technician
-    Returns (success: bool, message: str)
-    """
-    try:
-        delete_query = "DELETE FROM service_technician WHERE technician_ID = %s"
-        result = run_query(delete_query, (tech_id,))
-        
-        if result is True:
-            return True, "Technician deleted successfully"
-        else:
-            return False, f"Error: {result}"
-            
-    except Exception as e:
-        return False, f"Error: {str(e)}"
-
-def delete_customer_rep(emp_id):
-    """
-    Delete a customer representative
-    Returns (success: bool, message: str)
-    """
-    try:
-        delete_query = "DELETE FROM customer_reps WHERE Employee_ID = %s"
-        result = run_query(delete_query, (emp_id,))
-        
-        if result is True:
-            return True, "Customer representative deleted successfully"
-        else:
-            return False, f"Error: {result}"
-            
-    except Exception as e:
-        return False, f"Error: {str(e)}"
-
-def get_techs_by_part(part_no):
-    """
-    Get technicians who worked on jobs using a specific part (Nested Query)
-    """
-    query = """
-    SELECT 
-        st.technician_ID, 
-        st.Fname, 
-        st.Name
-    FROM service_technician st
-    WHERE st.technician_ID IN (
-        SELECT db.TechID
-        FROM Done_By db
-        WHERE db.JobID IN (
-            SELECT p.JobID
-            FROM parts p
-            WHERE p.Part_No = %s
-        )
-    )
-    """
-    
-    try:
-        results = run_query(query, (part_no,), fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching techs by part: {e}")
-        return []
+import DB_connecrtors
+from DB_connecrtors import stream_query
+from query_registry import run_named, sql, PART_LIST_SIZES
+from rollups import refresh_rollups
+from events import publish, TechnicianAdded, TechnicianDeleted, CustomerRepAdded, CustomerRepDeleted
+
+# Analytics breakdowns -> registered rollup query
+ANALYTICS_QUERIES = {
+    "technician": "analytics_by_technician",
+    "service_type": "analytics_by_service_type",
+    "month": "analytics_by_month",
+}
+
+def add_new_technician(tech_id, fname, lname, trained_for, specialization, yoe):
+    """
+    Add a new service technician
+    Returns (success: bool, message: str)
+    """
+    try:
+        # Validate inputs
+        if not all([tech_id, fname, lname, trained_for, specialization, yoe]):
+            return False, "All fields are required"
+        
+        yoe_int = int(yoe)
+        if yoe_int < 0:
+            return False, "Years of Experience must be non-negative"
+        
+        result = run_named("add_new_technician", (tech_id, fname, lname, trained_for, specialization, yoe_int))
+        
+        if result is True:
+            publish(TechnicianAdded({
+                "technician_ID": tech_id, "Fname": fname, "Name": lname,
+                "Trained_For": trained_for, "Specialization": specialization, "YOE": yoe_int,
+            }))
+            return True, f"Technician {fname} {lname} added successfully!"
+        else:
+            return False, f"Error: {result}"
+            
+    except ValueError:
+        return False, "Years of Experience must be a valid number"
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+
+def add_new_customer_rep(emp_id, name, phone, yoe):
+    """
+    Add a new customer representative
+    Returns (success: bool, message: str)
+    """
+    try:
+        # Validate inputs
+        if not all([emp_id, name, phone, yoe]):
+            return False, "All fields are required"
+        
+        phone_int = int(phone)
+        yoe_int = int(yoe)
+        
+        if yoe_int < 0:
+            return False, "Years of Experience must be non-negative"
+        
+        result = run_named("add_new_customer_rep", (emp_id, name, phone_int, yoe_int))
+        
+        if result is True:
+            publish(CustomerRepAdded({"Employee_ID": emp_id, "Name": name, "Phone_Number": phone_int, "YOE": yoe_int}))
+            return True, f"Customer Representative {name} added successfully!"
+        else:
+            return False, f"Error: {result}"
+            
+    except ValueError:
+        return False, "Phone and YOE must be valid numbers"
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+
+def get_all_technicians():
+    """
+    Get all service technicians
+    Returns list of technician dictionaries
+    """
+    try:
+        results = run_named("get_all_technicians", fetch=True, cache=True)
+        return results if results else []
+    except Exception as e:
+        print(f"Error fetching technicians: {e}")
+        return []
+
+def get_all_customer_reps():
+    """
+    Get all customer representatives
+    Returns list of customer rep dictionaries
+    """
+    try:
+        results = run_named("get_all_customer_reps", fetch=True, cache=True)
+        return results if results else []
+    except Exception as e:
+        print(f"Error fetching customer reps: {e}")
+        return []
+
+def iter_all_technicians():
+    """
+    Stream all service technicians without loading the whole table
+    Returns a generator of technician dictionaries (raises on DB error)
+    """
+    return stream_query(sql("get_all_technicians"))
+
+def iter_all_customer_reps():
+    """
+    Stream all customer representatives without loading the whole table
+    Returns a generator of customer rep dictionaries (raises on DB error)
+    """
+    return stream_query(sql("get_all_customer_reps"))
+
+def delete_technician(tech_id):
+    """
+    Delete a technician
+    Returns (success: bool, message: str)
+    """
+    try:
+        result = run_named("delete_technician", (tech_id,))
+        
+        if result is True:
+            publish(TechnicianDeleted(tech_id))
+            return True, "Technician deleted successfully"
+        else:
+            return False, f"Error: {result}"
+            
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+
+def delete_customer_rep(emp_id):
+    """
+    Delete a customer representative
+    Returns (success: bool, message: str)
+    """
+    try:
+        result = run_named("delete_customer_rep", (emp_id,))
+        
+        if result is True:
+            publish(CustomerRepDeleted(emp_id))
+            return True, "Customer representative deleted successfully"
+        else:
+            return False, f"Error: {result}"
+            
+    except Exception as e:
+        return False, f"Error: {str(e)}"
+
+def _part_prefix_query(pattern):
+    """
+    Query name and params for a part number pattern; * is accepted for %
+
+    "BRKPAD-%" -> ("techs_by_part_prefix", ("BRKPAD-%",)) on MySQL, and on
+    SQLite ("techs_by_part_prefix_sqlite", ("BRKPAD-", "BRKPAD.", "BRKPAD-%"))
+    """
+    pattern = pattern.replace("*", "%")
+    like = "".join("!" + ch if ch in "!_" else ch for ch in pattern)
+    if DB_connecrtors.dialect != "sqlite":
+        return "techs_by_part_prefix", (like,)
+    # BINARY order is code point order, so the successor bound is exact
+    prefix = pattern.split("%", 1)[0]
+    return "techs_by_part_prefix_sqlite", (prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1), like)
+
+def get_techs_by_part(parts):
+    """
+    Get technicians who used any of some parts on their jobs, with usage
+
+    Args:
+        parts: A part number, a list of them (or one comma separated
+               string), or a prefix pattern such as "BRKPAD-%"
+    Returns list of dictionaries: technician_ID, Fname, Name, jobs (jobs
+    that used the parts), quantity, last_used (latest job start date)
+    """
+    try:
+        if isinstance(parts, str):
+            parts = parts.split(",")
+        # Part numbers are conventionally upper case. MySQL's default collation
+        # matches any case; SQLite compares BINARY, so there only the stored
+        # case matches
+        parts = list(dict.fromkeys(p.strip().upper() for p in parts if p.strip()))
+        if not parts:
+            return []
+
+        if len(parts) == 1 and ("%" in parts[0] or "*" in parts[0]):
+            if parts[0][0] in "%*":
+                print("Error fetching techs by part: a pattern must start with at least one character")
+                return []
+            name, params = _part_prefix_query(parts[0])
+            results = run_named(name, params, fetch=True)
+        else:
+            size = next((n for n in PART_LIST_SIZES if n >= len(parts)), None)
+            if size is None:
+                print(f"Error fetching techs by part: at most {PART_LIST_SIZES[-1]} part numbers")
+                return []
+            # Pad with the last part so the statement for this size is reused
+            padded = parts + [parts[-1]] * (size - len(parts))
+            results = run_named(f"techs_by_parts_{size}", tuple(padded), fetch=True)
+
+        return results if isinstance(results, list) else []
+    except Exception as e:
+        print(f"Error fetching techs by part: {e}")
+        return []
+
+def get_analytics(breakdown, from_month, to_month, refresh=True):
+    """
+    Revenue, job count and average predicted job duration from the rollups
+
+    Args:
+        breakdown: "technician", "service_type" or "month"
+        from_month, to_month: First-of-month dates, both inclusive
+        refresh: Fold in jobs changed since the last refresh first
+    Returns list of dictionaries (avg_duration_days is None when no job in
+    the group has a predicted end date)
+    """
+    try:
+        if refresh:
+            refresh_rollups()
+        results = run_named(ANALYTICS_QUERIES[breakdown], (from_month, to_month), fetch=True)
+        if not isinstance(results, list):
+            print(f"Error fetching analytics: {results}")
+            return []
+        for row in results:
+            timed = row["timed_jobs"] or 0
+            row["avg_duration_days"] = row["duration_days"] / timed if timed else None
+        return results
+    except Exception as e:
+        print(f"Error fetching analytics: {e}")
+        return []
@@ -1,304 +1,361 @@
-import customtkinter as ctk
-from ManagerView import (
-    add_new_technician,
-    add_new_customer_rep,
-    get_all_technicians,
-    get_all_customer_reps,
-    delete_technician,
-    delete_customer_rep,
-    get_techs_by_part  # Imported new function
-)
-
-class ManagerViewGUI(ctk.CTkFrame):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.pack(fill="both", expand=True)
-        self.build_ui()
-
-    def build_ui(self):
-        # Title
-        title = ctk.CTkLabel(self, text="Manager Dashboard", font=("", 18, "bold"))
-        title.pack(pady=10)
-
-        # Button Section
-        btn_frame = ctk.CTkFrame(self)
-        btn_frame.pack(pady=10)
-
-        # Row 1
-        ctk.CTkButton(btn_frame, text="Add Technician", command=self.add_technician).grid(row=0, column=0, padx=5, pady=5)
-        ctk.CTkButton(btn_frame, text="Add Customer Rep", command=self.add_customer_rep).grid(row=0, column=1, padx=5, pady=5)
-        ctk.CTkButton(btn_frame, text="View Technicians", command=self.show_technicians).grid(row=0, column=2, padx=5, pady=5)
-        ctk.CTkButton(btn_frame, text="View Customer Reps", command=self.show_customer_reps).grid(row=0, column=3, padx=5, pady=5)
-        
-        # Row 2
-        ctk.CTkButton(btn_frame, text="Delete Technician", command=self.delete_tech_popup).grid(row=1, column=0, padx=5, pady=5)
-        ctk.CTkButton(btn_frame, text="Delete Customer Rep", command=self.delete_rep_popup).grid(row=1, column=1, padx=5, pady=5)
-        
-        # Row 2 - New Button for Nested Query Feature
-        ctk.CTkButton(btn_frame, text="Find Techs by Part Used", command=self.find_techs_by_part_popup, fg_color="#E67E22", hover_color="#D35400").grid(row=1, column=2, padx=5, pady=5)
-
-        # Output Section
-        self.output = ctk.CTkTextbox(self, width=900, height=450)
-        self.output.pack(pady=20)
-
-    def show_technicians(self):
-        """Display all service technicians"""
-        try:
-            data = get_all_technicians()
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error fetching technicians: {e}\n")
-            return
-
-        self.output.delete("1.0", "end")
-        
-        if not data:
-            self.output.insert("end", "No technicians found.\n")
-            return
-
-        self.output.insert("end", "=== ALL SERVICE TECHNICIANS ===\n\n")
-        
-        for d in data:
-            # Handle both dict and other formats
-            if isinstance(d, dict):
-                tid = d.get('technician_ID', '')
-                fname = d.get('Fname', '')
-                lname = d.get('Name', '')
-                trained = d.get('Trained_For', '')
-                spec = d.get('Specialization', '')
-                yoe = d.get('YOE', '')
-                
-                self.output.insert("end", f"ID: {tid} | {fname} {lname}\n")
-                self.output.insert("end", f"  Trained For: {trained}\n")
-                self.output.insert("end", f"  Specialization: {spec}\n")
-                self.output.insert("end", f"  Experience: {yoe} years\n\n")
-            else:
-                self.output.insert("end", f"{d}\n")
-
-    def show_customer_reps(self):
-        """Display all customer representatives"""
-        try:
-            data = get_all_customer_reps()
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error fetching customer reps: {e}\n")
-            return
-
-        self.output.delete("1.0", "end")
-        
-        if not data:
-            self.output.insert("end", "No customer representatives found.\n")
-            return
-
-        self.output.insert("end", "=== ALL CUSTOMER REPRESENTATIVES ===\n\n")
-        
-        for c in data:
-            # Handle both dict and other formats
-            if isinstance(c, dict):
-                emp_id = c.get('Employee_ID', '')
-                name = c.get('Name', '')
-                phone = c.get('Phone_Number', '')
-                yoe = c.get('YOE', '')
-                
-                self.output.insert("end", f"Employee ID: {emp_id}\n")
-                self.output.insert("end", f"  Name: {name}\n")
-                self.output.insert("end", f"  Phone: {phone}\n")
-                self.output.insert("end", f"  Experience: {yoe} years\n\n")
-            else:
-                self.output.insert("end", f"{c}\n")
-
-    def add_technician(self):
-        """Popup to add a new technician"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Add New Technician")
-        popup.geometry("450x550")
-
-        labels = ["Technician ID", "First Name", "Last Name", "Trained For", "Specialization", "Years of Experience"]
-        entries = {}
-
-        for label in labels:
-            ctk.CTkLabel(popup, text=label).pack(pady=5)
-            entries[label] = ctk.CTkEntry(popup, width=350)
-            entries[label].pack(pady=5)
-
-        def submit():
-            try:
-                tech_id = entries["Technician ID"].get().strip()
-                fname = entries["First Name"].get().strip()
-                lname = entries["Last Name"].get().strip()
-                trained = entries["Trained For"].get().strip()
-                spec = entries["Specialization"].get().strip()
-                yoe = entries["Years of Experience"].get().strip()
-
-                success, msg = add_new_technician(tech_id, fname, lname, trained, spec, yoe)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if success:
-                    self.output.insert("end", f"✓ {msg}\n")
-                else:
-                    self.output.insert("end", f"✗ {msg}\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Add Technician", command=submit).pack(pady=20)
-
-    def add_customer_rep(self):
-        """Popup to add a new customer representative"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Add Customer Representative")
-        popup.geometry("450x400")
-
-        labels = ["Employee ID", "Name", "Phone Number", "Years of Experience"]
-        entries = {}
-
-        for label in labels:
-            ctk.CTkLabel(popup, text=label).pack(pady=5)
-            entries[label] = ctk.CTkEntry(popup, width=350)
-            entries[label].pack(pady=5)
-
-        def submit():
-            try:
-                emp_id = entries["Employee ID"].get().strip()
-                name = entries["Name"].get().strip()
-                phone = entries["Phone Number"].get().strip()
-                yoe = entries["Years of Experience"].get().strip()
-
-                success, msg = add_new_customer_rep(emp_id, name, phone, yoe)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if success:
-                    self.output.insert("end", f"✓ {msg}\n")
-                else:
-                    self.output.insert("end", f"✗ {msg}\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Add Representative", command=submit).pack(pady=20)
-
-    def delete_tech_popup(self):
-        """Popup to delete a technician"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Delete Technician")
-        popup.geometry("450x200")
-
-        ctk.CTkLabel(popup, text="⚠️ Warning: This will permanently delete the technician", 
-                     text_color="orange").pack(pady=10)
-        
-        ctk.CTkLabel(popup, text="Technician ID:").pack(pady=5)
-        tech_entry = ctk.CTkEntry(popup, width=350)
-        tech_entry.pack(pady=5)
-
-        def submit():
-            tech_id = tech_entry.get().strip()
-            
-            if not tech_id:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Technician ID is required!\n")
-                return
-
-            try:
-                success, msg = delete_technician(tech_id)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if success:
-                    self.output.insert("end", f"✓ {msg}\n")
-                else:
-                    self.output.insert("end", f"✗ {msg}\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Delete", command=submit, fg_color="red", hover_color="darkred").pack(pady=15)
-
-    def delete_rep_popup(self):
-        """Popup to delete a customer representative"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Delete Customer Representative")
-        popup.geometry("450x200")
-
-        ctk.CTkLabel(popup, text="⚠️ Warning: This will permanently delete the representative", 
-                     text_color="orange").pack(pady=10)
-        
-        ctk.CTkLabel(popup, text="Employee ID:").pack(pady=5)
-        emp_entry = ctk.CTkEntry(popup, width=350)
-        emp_entry.pack(pady=5)
-
-        def submit():
-            emp_id = emp_entry.get().strip()
-            
-            if not emp_id:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Employee ID is required!\n")
-                return
-
-            try:
-                success, msg = delete_customer_rep(emp_id)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if success:
-                    self.output.insert("end", f"✓ {msg}\n")
-                else:
-                    self.output.insert("end", f"✗ {msg}\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Delete", command=submit, fg_color="red", hover_color="darkred").pack(pady=15)
-
-    def find_techs_by_part_popup(self):
-        """Popup to find technicians by part number (Nested Query Feature)"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Find Technicians by Part")
-        popup.geometry("450x200")
-
-        ctk.CTkLabel(popup, text="Enter Part Number:", font=("", 14)).pack(pady=10)
-        ctk.CTkLabel(popup, text="(e.g. P001, P002)", text_color="gray").pack()
-        
-        part_entry = ctk.CTkEntry(popup, width=300)
-        part_entry.pack(pady=5)
-
-        def submit():
-            part_no = part_entry.get().strip()
-            
-            if not part_no:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Part Number is required!\n")
-                return
-
-            try:
-                results = get_techs_by_part(part_no)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if results:
-                    self.output.insert("end", f"=== TECHNICIANS WHO USED PART: {part_no} ===\n\n")
-                    for r in results:
-                        self.output.insert("end", f"ID: {r['technician_ID']} | Name: {r['Fname']} {r['Name']}\n")
-                else:
-                    self.output.insert("end", f"No technicians found who used part {part_no}.\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Search", command=submit).pack(pady=15)
+import customtkinter as ctk
+from datetime import date
+from ManagerView import (
+    add_new_technician,
+    add_new_customer_rep,
+    delete_technician,
+    delete_customer_rep,
+    get_techs_by_part,  # Imported new function
+    get_analytics
+)
+from async_ui import AsyncViewMixin
+from paged_view import PagedListMixin
+from export_view import ExportMixin
+from DB_connecrtors import stream_query
+from query_registry import sql
+from data_table import DataTable
+from events import TechnicianAdded, TechnicianDeleted, CustomerRepAdded, CustomerRepDeleted
+
+TECHS_BY_PART_COLUMNS = [
+    ("technician_ID", "ID", 110),
+    ("Fname", "First Name", 130),
+    ("Name", "Last Name", 130),
+    ("jobs", "Jobs", 80),
+    ("quantity", "Quantity", 90),
+    ("last_used", "Last Used", 130),
+]
+
+# Labels of the whole-table exports (query_registry.EXPORT_QUERIES)
+EXPORT_DATASETS = {
+    "All jobs": "jobs",
+    "Parts usage": "parts_usage",
+    "Complaints": "complaints",
+    "Customers": "customers",
+    "Vehicles": "vehicles",
+    "Technicians": "technicians",
+    "Customer reps": "customer_reps",
+}
+
+class ManagerViewGUI(PagedListMixin, ExportMixin, AsyncViewMixin, ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.pack(fill="both", expand=True)
+        self.init_async()
+        self.init_paging()
+        self.build_ui()
+
+        # Staff pages on screen follow adds / deletes without being fetched again
+        self.subscribe_event(TechnicianAdded, lambda e: self.patch_page(
+            ("technicians_by_name",), "technician_ID", e.row["technician_ID"], e.row))
+        self.subscribe_event(TechnicianDeleted, lambda e: self.patch_page(
+            ("technicians_by_name",), "technician_ID", e.tech_id))
+        self.subscribe_event(CustomerRepAdded, lambda e: self.patch_page(
+            ("customer_reps_by_name",), "Employee_ID", e.row["Employee_ID"], e.row))
+        self.subscribe_event(CustomerRepDeleted, lambda e: self.patch_page(
+            ("customer_reps_by_name",), "Employee_ID", e.emp_id))
+
+    def build_ui(self):
+        # Title
+        title = ctk.CTkLabel(self, text="Manager Dashboard", font=("", 18, "bold"))
+        title.pack(pady=10)
+
+        # Button Section
+        btn_frame = ctk.CTkFrame(self)
+        btn_frame.pack(pady=10)
+
+        # Row 1
+        ctk.CTkButton(btn_frame, text="Add Technician", command=self.add_technician).grid(row=0, column=0, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="Add Customer Rep", command=self.add_customer_rep).grid(row=0, column=1, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="View Technicians", command=self.show_technicians).grid(row=0, column=2, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="View Customer Reps", command=self.show_customer_reps).grid(row=0, column=3, padx=5, pady=5)
+        
+        # Row 2
+        ctk.CTkButton(btn_frame, text="Delete Technician", command=self.delete_tech_popup).grid(row=1, column=0, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="Delete Customer Rep", command=self.delete_rep_popup).grid(row=1, column=1, padx=5, pady=5)
+        
+        # Row 2 - New Button for Nested Query Feature
+        ctk.CTkButton(btn_frame, text="Find Techs by Part Used", command=self.find_techs_by_part_popup, fg_color="#E67E22", hover_color="#D35400").grid(row=1, column=2, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="Analytics", command=self.analytics_popup).grid(row=1, column=3, padx=5, pady=5)
+        ctk.CTkButton(btn_frame, text="Export Data...", command=self.export_data_popup).grid(row=2, column=0, columnspan=4, pady=5)
+
+        self.build_busy_bar(self).pack(pady=2)
+        self.build_pager_bar(self).pack(pady=2)
+
+        # Output Section - messages above, result rows in the table below
+        self.output = ctk.CTkTextbox(self, width=900, height=70)
+        self.output.pack(pady=(10, 5))
+
+        self.table = DataTable(self, actions=[("Delete...", self._delete_selected)],
+                               tools=[("Export...", self.export_current)], height=300)
+        self.table.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+    def _show_result(self, result):
+        """Render a (success, message) result from a ManagerView call"""
+        success, msg = result
+        self.output.delete("1.0", "end")
+        
+        if success:
+            self.output.insert("end", f"✓ {msg}\n")
+        else:
+            self.output.insert("end", f"✗ {msg}\n")
+
+    def show_technicians(self):
+        """Display all service technicians, a page at a time"""
+        self.open_listing("technicians_by_name", "ALL SERVICE TECHNICIANS")
+
+    def show_customer_reps(self):
+        """Display all customer representatives, a page at a time"""
+        self.open_listing("customer_reps_by_name", "ALL CUSTOMER REPRESENTATIVES")
+
+    def _delete_selected(self, row):
+        """Open the delete popup for the selected technician / rep"""
+        if "technician_ID" in row:
+            self.delete_tech_popup(row["technician_ID"])
+        elif "Employee_ID" in row:
+            self.delete_rep_popup(row["Employee_ID"])
+
+    def add_technician(self):
+        """Popup to add a new technician"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Add New Technician")
+        popup.geometry("450x550")
+
+        labels = ["Technician ID", "First Name", "Last Name", "Trained For", "Specialization", "Years of Experience"]
+        entries = {}
+
+        for label in labels:
+            ctk.CTkLabel(popup, text=label).pack(pady=5)
+            entries[label] = ctk.CTkEntry(popup, width=350)
+            entries[label].pack(pady=5)
+
+        def submit():
+            try:
+                tech_id = entries["Technician ID"].get().strip()
+                fname = entries["First Name"].get().strip()
+                lname = entries["Last Name"].get().strip()
+                trained = entries["Trained For"].get().strip()
+                spec = entries["Specialization"].get().strip()
+                yoe = entries["Years of Experience"].get().strip()
+
+                popup.destroy()
+                self.run_async("add_technician", add_new_technician, tech_id, fname, lname, trained, spec, yoe,
+                               on_done=self._show_result, busy_text="Saving technician...")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+                popup.destroy()
+
+        ctk.CTkButton(popup, text="Add Technician", command=submit).pack(pady=20)
+
+    def add_customer_rep(self):
+        """Popup to add a new customer representative"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Add Customer Representative")
+        popup.geometry("450x400")
+
+        labels = ["Employee ID", "Name", "Phone Number", "Years of Experience"]
+        entries = {}
+
+        for label in labels:
+            ctk.CTkLabel(popup, text=label).pack(pady=5)
+            entries[label] = ctk.CTkEntry(popup, width=350)
+            entries[label].pack(pady=5)
+
+        def submit():
+            try:
+                emp_id = entries["Employee ID"].get().strip()
+                name = entries["Name"].get().strip()
+                phone = entries["Phone Number"].get().strip()
+                yoe = entries["Years of Experience"].get().strip()
+
+                popup.destroy()
+                self.run_async("add_customer_rep", add_new_customer_rep, emp_id, name, phone, yoe,
+                               on_done=self._show_result, busy_text="Saving customer rep...")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+                popup.destroy()
+
+        ctk.CTkButton(popup, text="Add Representative", command=submit).pack(pady=20)
+
+    def delete_tech_popup(self, tech_id=None):
+        """Popup to delete a technician (optionally prefilled)"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Delete Technician")
+        popup.geometry("450x200")
+
+        ctk.CTkLabel(popup, text="⚠️ Warning: This will permanently delete the technician", 
+                     text_color="orange").pack(pady=10)
+        
+        ctk.CTkLabel(popup, text="Technician ID:").pack(pady=5)
+        tech_entry = ctk.CTkEntry(popup, width=350)
+        tech_entry.pack(pady=5)
+        if tech_id:
+            tech_entry.insert(0, tech_id)
+
+        def submit():
+            tech_id = tech_entry.get().strip()
+            
+            if not tech_id:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Technician ID is required!\n")
+                return
+
+            try:
+                popup.destroy()
+                self.run_async("delete_technician", delete_technician, tech_id,
+                               on_done=self._show_result, busy_text="Deleting technician...")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+                popup.destroy()
+
+        ctk.CTkButton(popup, text="Delete", command=submit, fg_color="red", hover_color="darkred").pack(pady=15)
+
+    def delete_rep_popup(self, emp_id=None):
+        """Popup to delete a customer representative (optionally prefilled)"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Delete Customer Representative")
+        popup.geometry("450x200")
+
+        ctk.CTkLabel(popup, text="⚠️ Warning: This will permanently delete the representative", 
+                     text_color="orange").pack(pady=10)
+        
+        ctk.CTkLabel(popup, text="Employee ID:").pack(pady=5)
+        emp_entry = ctk.CTkEntry(popup, width=350)
+        emp_entry.pack(pady=5)
+        if emp_id:
+            emp_entry.insert(0, emp_id)
+
+        def submit():
+            emp_id = emp_entry.get().strip()
+            
+            if not emp_id:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Employee ID is required!\n")
+                return
+
+            try:
+                popup.destroy()
+                self.run_async("delete_customer_rep", delete_customer_rep, emp_id,
+                               on_done=self._show_result, busy_text="Deleting customer rep...")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+                popup.destroy()
+
+        ctk.CTkButton(popup, text="Delete", command=submit, fg_color="red", hover_color="darkred").pack(pady=15)
+
+    def find_techs_by_part_popup(self):
+        """Popup to find technicians by part numbers or a part number prefix"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Find Technicians by Part")
+        popup.geometry("450x220")
+
+        ctk.CTkLabel(popup, text="Enter Part Numbers:", font=("", 14)).pack(pady=10)
+        ctk.CTkLabel(popup, text="(e.g. P001, P002 or a prefix such as BRKPAD-%)", text_color="gray").pack()
+        
+        part_entry = ctk.CTkEntry(popup, width=300)
+        part_entry.pack(pady=5)
+
+        def submit():
+            part_no = part_entry.get().strip()
+            
+            if not part_no:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Part Number is required!\n")
+                return
+
+            popup.destroy()
+            self.run_async("techs_by_part", get_techs_by_part, part_no,
+                           on_done=lambda results: render(part_no, results),
+                           busy_text="Searching...")
+
+        def render(part_no, results):
+            try:
+                self.table.set_rows(
+                    results or [], title=f"TECHNICIANS WHO USED PART: {part_no.upper()}",
+                    source="techs_by_part", columns=TECHS_BY_PART_COLUMNS,
+                    message=f"No technicians found who used part {part_no}."
+                )
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Search", command=submit).pack(pady=15)
+
+    def analytics_popup(self):
+        """Popup to pick an analytics breakdown and period (reads the rollup tables)"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Analytics")
+        popup.geometry("400x260")
+
+        breakdowns = {"Per technician": "technician", "Per service type": "service_type", "Per month": "month"}
+        periods = ["Last 12 months", "This year", "All time"]
+
+        ctk.CTkLabel(popup, text="Breakdown:").pack(pady=5)
+        breakdown_menu = ctk.CTkOptionMenu(popup, values=list(breakdowns), width=250)
+        breakdown_menu.pack(pady=5)
+        ctk.CTkLabel(popup, text="Period:").pack(pady=5)
+        period_menu = ctk.CTkOptionMenu(popup, values=periods, width=250)
+        period_menu.pack(pady=5)
+
+        def submit():
+            label, period = breakdown_menu.get(), period_menu.get()
+            from_month, to_month = self._analytics_range(period)
+            popup.destroy()
+            self.run_async("analytics", get_analytics, breakdowns[label], from_month, to_month,
+                           on_done=lambda rows: self._render_analytics(f"{label.upper()} - {period.upper()}", rows),
+                           busy_text="Loading analytics...")
+
+        ctk.CTkButton(popup, text="Show", command=submit).pack(pady=15)
+
+    def _analytics_range(self, period):
+        """(first month, last month) of a period, as first-of-month dates"""
+        this_month = date.today().replace(day=1)
+        if period == "This year":
+            return this_month.replace(month=1), this_month
+        if period == "Last 12 months":
+            year, month = divmod(this_month.year * 12 + this_month.month - 1 - 11, 12)
+            return date(year, month + 1, 1), this_month
+        return date(1900, 1, 1), this_month
+
+    def _render_analytics(self, title, rows):
+        """Show analytics rows in the table"""
+        table_rows = []
+        for r in rows:
+            if "TechID" in r:
+                name = f"{r['TechID']} {r.get('Fname') or ''} {r.get('Name') or ''}".strip()
+            elif "Service_type" in r:
+                name = r["Service_type"]
+            else:
+                name = r["month"].strftime("%Y-%m") if hasattr(r["month"], "strftime") else str(r["month"])[:7]
+            avg = float(r["avg_duration_days"]) if r["avg_duration_days"] is not None else None
+            table_rows.append({"name": name, "jobs": int(r["jobs"]), "revenue": int(r["revenue"]), "avg_days": avg})
+
+        columns = [("name", "", 300), ("jobs", "Jobs", 100, ","), ("revenue", "Revenue", 140, ","),
+                   ("avg_days", "Avg days", 100, ".1f")]
+        self.table.set_rows(table_rows, title=title, source="analytics", columns=columns,
+                            message="No jobs in this period.")
+
+    def export_data_popup(self):
+        """Popup to export a whole table (jobs, parts usage, customers...) to a file"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Export Data")
+        popup.geometry("400x180")
+
+        ctk.CTkLabel(popup, text="Export:").pack(pady=5)
+        dataset_menu = ctk.CTkOptionMenu(popup, values=list(EXPORT_DATASETS), width=250)
+        dataset_menu.pack(pady=5)
+
+        def submit():
+            name = EXPORT_DATASETS[dataset_menu.get()]
+            popup.destroy()
+            self.start_export(name, lambda columns: stream_query(sql(f"export_{name}"), columns=columns))
+
+        ctk.CTkButton(popup, text="Export...", command=submit).pack(pady=15)
@@ -1,169 +1,168 @@
-from DB_connecrtors import run_query
-
-def get_jobs_for_technician(technician_id):
-    """
-    Get all jobs assigned to a specific technician
-    Returns list of job dictionaries
-    """
-    query = """
-    SELECT 
-        sj.Service_ID, 
-        sj.Reg_No,
-        v.Make,
-        v.Model,
-        sj.Service_type,
-        sj.Start_Date,
-        sj.Predicted_End_date,
-        sj.Predicted_Cost
-    FROM Service_Job sj
-    JOIN Done_By db ON sj.Service_ID = db.JobID
-    JOIN vehicle v ON sj.Reg_No = v.Reg_No
-    WHERE db.TechID = %s
-    ORDER BY sj.Start_Date DESC
-    """
-    
-    try:
-        results = run_query(query, (technician_id,), fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching jobs for technician: {e}")
-        return []
-
-def get_job_details(job_id):
-    """
-    Get detailed information about a specific job
-    Returns dictionary with job details
-    """
-    query = """
-    SELECT 
-        sj.Service_ID,
-        sj.Reg_No,
-        v.Make,
-        v.Model,
-        v.Year,
-        v.Chassis_No,
-        v.Body_type,
-        sj.Service_type,
-        sj.Description,
-        sj.Start_Date,
-        sj.Predicted_End_date,
-        sj.Predicted_Cost,
-        c.Customer_ID,
-        c.Name as Customer_Name,
-        c.Phone_no,
-        c.email_ID,
-        (
-            SELECT COALESCE(SUM(p.Quantity * p.Price), 0)
-            FROM parts p
-            WHERE p.JobID = sj.Service_ID
-        ) AS Total_Parts_Cost
-    FROM Service_Job sj
-    JOIN vehicle v ON sj.Reg_No = v.Reg_No
-    JOIN customers c ON v.CustomerID = c.Customer_ID
-    WHERE sj.Service_ID = %s
-    """
-    
-    try:
-        results = run_query(query, (job_id,), fetch=True)
-        return results[0] if results else None
-    except Exception as e:
-        print(f"Error fetching job details: {e}")
-        return None
-
-def add_complaint_for_job(job_id, complaint_text):
-    """
-    Add a complaint/issue for a specific job
-    Returns True if successful, error string otherwise
-    """
-    query = """
-    INSERT INTO complaints (JobID, Complaints, Fixed)
-    VALUES (%s, %s, NULL)
-    """
-    
-    try:
-        result = run_query(query, (job_id, complaint_text))
-        return result
-    except Exception as e:
-        print(f"Error adding complaint: {e}")
-        return str(e)
-
-def get_complaints_for_job(job_id):
-    """
-    Get all complaints for a specific job
-    Returns list of complaint dictionaries
-    """
-    query = """
-    SELECT Complaints, Fixed
-    FROM complaints
-    WHERE JobID = %s
-    """
-    
-    try:
-        results = run_query(query, (job_id,), fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching complaints: {e}")
-        return []
-
-def add_parts_for_job(job_id, parts_list):
-    """
-    Add parts required for a job
-    parts_list: list of tuples (part_no, quantity, price)
-    Returns True if successful, error string otherwise
-    """
-    if not parts_list:
-        return "No parts provided"
-    
-    query = """
-    INSERT INTO parts (JobID, Part_No, Quantity, Price)
-    VALUES (%s, %s, %s, %s)
-    """
-    
-    try:
-        for part_no, quantity, price in parts_list:
-            result = run_query(query, (job_id, part_no, quantity, price))
-            if result is not True:
-                return result
-        
-        return True
-    except Exception as e:
-        print(f"Error adding parts: {e}")
-        return str(e)
-
-def get_parts_for_job(job_id):
-    """
-    Get all parts for a specific job
-    Returns list of part dictionaries
-    """
-    query = """
-    SELECT Part_No, Quantity, Price, (Quantity * Price) as Total
-    FROM parts
-    WHERE JobID = %s
-    """
-    
-    try:
-        results = run_query(query, (job_id,), fetch=True)
-        return results if results else []
-    except Exception as e:
-        print(f"Error fetching parts: {e}")
-        return []
-
-def get_total_parts_cost(job_id):
-    """
-    Calculate total cost of all parts for a job
-    Returns total cost as integer
-    """
-    query = """
-    SELECT SUM(Quantity * Price) as Total_Cost
-    FROM parts
-    WHERE JobID = %s
-    """
-    
-    try:
-        results = run_query(query, (job_id,), fetch=True)
-        if results and results[0]['Total_Cost']:
-            return results[0]['Total_Cost']
-        return 0
-    except Exception as e:
-        print(f"Error calculating total parts cost: {e}")
-        return 0
+from DB_connecrtors import run_many
+from query_registry import run_named, sql, JOB_BATCH_SIZES
+from events import publish, ComplaintAdded, PartsAdded
+
+def get_jobs_for_technician(technician_id):
+    """
+    Get all jobs assigned to a specific technician
+    Returns list of job dictionaries
+    """
+    try:
+        results = run_named("get_jobs_for_technician", (technician_id,), fetch=True)
+        return results if results else []
+    except Exception as e:
+        print(f"Error fetching jobs for technician: {e}")
+        return []
+
+def get_job_details(job_id):
+    """
+    Get detailed information about a specific job
+    Returns dictionary with job details
+    """
+    try:
+        results = run_named("get_job_details", (job_id,), fetch=True)
+        return results[0] if results else None
+    except Exception as e:
+        print(f"Error fetching job details: {e}")
+        return None
+
+def _bundles_from_rows(rows):
+    """Group get_job_bundle rows into {JobID: bundle} (jobs without a job row are dropped)"""
+    bundles = {}
+    complaints, parts = {}, {}
+    for row in rows:
+        section, job_id = row["section"], row["JobID"]
+        if section == "job":
+            details = {k: v for k, v in row.items()
+                       if k not in ("section", "JobID", "Complaints", "Fixed", "Part_No", "Quantity", "Price")}
+            details["Service_ID"] = job_id
+            bundles[job_id] = {"details": details}
+        elif section == "complaint":
+            complaints.setdefault(job_id, []).append({"Complaints": row["Complaints"], "Fixed": row["Fixed"]})
+        else:
+            quantity = row["Quantity"]
+            parts.setdefault(job_id, []).append({
+                "Part_No": row["Part_No"],
+                "Quantity": quantity,
+                "Price": row["Price"],
+                "Total": quantity * row["Price"] if quantity is not None else None,
+            })
+
+    for job_id, bundle in bundles.items():
+        bundle["complaints"] = complaints.get(job_id, [])
+        bundle["parts"] = parts.get(job_id, [])
+        # A NULL quantity counts as nothing, as in SUM(Quantity * Price)
+        total = sum(p["Total"] or 0 for p in bundle["parts"])
+        bundle["total_parts_cost"] = total
+        bundle["details"]["Total_Parts_Cost"] = total
+    return bundles
+
+def get_job_bundle(job_id):
+    """
+    Get a job with its vehicle, customer, complaints and parts in one round trip
+    Returns dict {"details", "complaints", "parts", "total_parts_cost"}
+    (details as get_job_details), or None if the job doesn't exist
+    """
+    try:
+        results = run_named("get_job_bundle", (job_id,) * 3, fetch=True)
+        if isinstance(results, str):
+            return None
+        bundles = _bundles_from_rows(results)
+        return next(iter(bundles.values()), None)
+    except Exception as e:
+        print(f"Error fetching job bundle: {e}")
+        return None
+
+def get_job_bundles(job_ids):
+    """
+    Get the bundles (see get_job_bundle) of many jobs
+    One round trip per JOB_BATCH_SIZES[-1] jobs
+    Returns dict {Service_ID: bundle}; missing jobs are left out
+    """
+    job_ids = list(dict.fromkeys(job_ids))
+    bundles = {}
+    try:
+        largest = JOB_BATCH_SIZES[-1]
+        for start in range(0, len(job_ids), largest):
+            batch = job_ids[start:start + largest]
+            size = next(n for n in JOB_BATCH_SIZES if n >= len(batch))
+            padded = batch + [batch[-1]] * (size - len(batch))
+            results = run_named(f"get_job_bundles_{size}", tuple(padded) * 3, fetch=True)
+            if isinstance(results, str):
+                return bundles
+            bundles.update(_bundles_from_rows(results))
+        return bundles
+    except Exception as e:
+        print(f"Error fetching job bundles: {e}")
+        return bundles
+
+def add_complaint_for_job(job_id, complaint_text):
+    """
+    Add a complaint/issue for a specific job
+    Returns True if successful, error string otherwise
+    """
+    try:
+        result = run_named("add_complaint_for_job", (job_id, complaint_text))
+        if result is True:
+            publish(ComplaintAdded(int(job_id), complaint_text))
+        return result
+    except Exception as e:
+        print(f"Error adding complaint: {e}")
+        return str(e)
+
+def get_complaints_for_job(job_id):
+    """
+    Get all complaints for a specific job
+    Returns list of complaint dictionaries
+    """
+    try:
+        results = run_named("get_complaints_for_job", (job_id,), fetch=True)
+        return results if results else []
+    except Exception as e:
+        print(f"Error fetching complaints: {e}")
+        return []
+
+def add_parts_for_job(job_id, parts_list):
+    """
+    Add parts required for a job (all-or-nothing, one round trip)
+    parts_list: list of tuples (part_no, quantity, price)
+    Returns True if successful, error string otherwise
+    """
+    if not parts_list:
+        return "No parts provided"
+    
+    try:
+        rows = [(job_id, part_no, quantity, price) for part_no, quantity, price in parts_list]
+        result = run_many(sql("add_parts_for_job"), rows)
+        if result is True:
+            publish(PartsAdded(int(job_id), list(parts_list)))
+        return result
+    except Exception as e:
+        print(f"Error adding parts: {e}")
+        return str(e)
+
+def get_parts_for_job(job_id):
+    """
+    Get all parts for a specific job
+    Returns list of part dictionaries
+    """
+    try:
+        results = run_named("get_parts_for_job", (job_id,), fetch=True)
+        return results if results else []
+    except Exception as e:
+        print(f"Error fetching parts: {e}")
+        return []
+
+def get_total_parts_cost(job_id):
+    """
+    Calculate total cost of all parts for a job
+    Returns total cost as integer
+    """
+    try:
+        results = run_named("get_total_parts_cost", (job_id,), fetch=True)
+        if results and results[0]['Total_Cost']:
+            return results[0]['Total_Cost']
+        return 0
+    except Exception as e:
+        print(f"Error calculating total parts cost: {e}")
+        return 0
@@ -1,305 +1,489 @@
-import customtkinter as ctk
-from ServiceTechView import (
-    get_jobs_for_technician,
-    get_job_details,
-    add_complaint_for_job,
-    add_parts_for_job,
-    get_complaints_for_job,
-    get_parts_for_job,
-    get_total_parts_cost
-)
-from datetime import date
-
-class ServiceTechViewGUI(ctk.CTkFrame):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.pack(fill="both", expand=True)
-        self.current_tech_id = None
-        self.selected_job_id = None
-        self.build_ui()
-
-    def build_ui(self):
-        # Title
-        title = ctk.CTkLabel(self, text="Service Technician Dashboard", font=("", 18, "bold"))
-        title.pack(pady=10)
-
-        # Technician Login Section
-        login_frame = ctk.CTkFrame(self)
-        login_frame.pack(pady=10)
-        
-        ctk.CTkLabel(login_frame, text="Technician ID:").grid(row=0, column=0, padx=5)
-        self.tech_id_entry = ctk.CTkEntry(login_frame, width=200)
-        self.tech_id_entry.grid(row=0, column=1, padx=5)
-        
-        ctk.CTkButton(login_frame, text="Login", command=self.login_technician).grid(row=0, column=2, padx=5)
-
-        # Button Section
-        btn_frame = ctk.CTkFrame(self)
-        btn_frame.pack(pady=5)
-
-        ctk.CTkButton(btn_frame, text="My Jobs", command=self.show_my_jobs).grid(row=0, column=0, padx=5)
-        ctk.CTkButton(btn_frame, text="Job Details", command=self.show_job_details).grid(row=0, column=1, padx=5)
-        ctk.CTkButton(btn_frame, text="Add Complaint", command=self.add_complaint_popup).grid(row=0, column=2, padx=5)
-        ctk.CTkButton(btn_frame, text="Add Parts", command=self.add_parts_popup).grid(row=0, column=3, padx=5)
-
-        # Output Section
-        self.output = ctk.CTkTextbox(self, width=900, height=400)
-        self.output.pack(pady=20)
-
-    def login_technician(self):
-        """Verify technician exists and store ID"""
-        tech_id = self.tech_id_entry.get().strip()
-        
-        if not tech_id:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", "Error: Please enter a Technician ID!\n")
-            return
-
-        try:
-            # Try to fetch jobs to verify technician exists
-            jobs = get_jobs_for_technician(tech_id)
-            self.current_tech_id = tech_id
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"✓ Logged in as Technician {tech_id}\n")
-            self.output.insert("end", f"You have {len(jobs)} assigned job(s).\n\n")
-            self.output.insert("end", "Use the buttons above to view jobs and manage work.\n")
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error: {str(e)}\n")
-
-    def show_my_jobs(self):
-        """Display all jobs assigned to the logged-in technician"""
-        if not self.current_tech_id:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", "Error: Please login with your Technician ID first!\n")
-            return
-
-        try:
-            jobs = get_jobs_for_technician(self.current_tech_id)
-            self.output.delete("1.0", "end")
-
-            if not jobs:
-                self.output.insert("end", f"No jobs assigned to Technician {self.current_tech_id}.\n")
-                return
-
-            self.output.insert("end", f"=== JOBS ASSIGNED TO TECHNICIAN {self.current_tech_id} ===\n\n")
-            
-            for job in jobs:
-                self.output.insert("end", f"Service ID: {job['Service_ID']}\n")
-                self.output.insert("end", f"  Vehicle: {job['Make']} {job['Model']} ({job['Reg_No']})\n")
-                self.output.insert("end", f"  Service Type: {job['Service_type']}\n")
-                self.output.insert("end", f"  Start Date: {job['Start_Date']}\n")
-                self.output.insert("end", f"  Predicted End: {job['Predicted_End_date'] if job['Predicted_End_date'] else 'Not Set'}\n")
-                self.output.insert("end", f"  Predicted Cost: ${job['Predicted_Cost'] if job['Predicted_Cost'] else 0}\n")
-                self.output.insert("end", "\n" + "="*60 + "\n\n")
-
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error fetching jobs: {str(e)}\n")
-
-    def show_job_details(self):
-        """Show detailed popup to select and view job details"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("View Job Details")
-        popup.geometry("450x200")
-
-        ctk.CTkLabel(popup, text="Enter Service ID:").pack(pady=10)
-        job_entry = ctk.CTkEntry(popup, width=300)
-        job_entry.pack(pady=5)
-
-        def submit():
-            job_id = job_entry.get().strip()
-            if not job_id:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Please enter a Service ID!\n")
-                return
-
-            try:
-                details = get_job_details(job_id)
-                
-                if not details:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"No details found for Service ID {job_id}.\n")
-                    popup.destroy()
-                    return
-
-                # Get complaints and parts
-                complaints = get_complaints_for_job(job_id)
-                parts = get_parts_for_job(job_id)
-
-                self.selected_job_id = job_id
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"=== JOB DETAILS: {job_id} ===\n\n")
-                
-                # Vehicle Information
-                self.output.insert("end", "VEHICLE INFORMATION:\n")
-                self.output.insert("end", f"  Registration: {details['Reg_No']}\n")
-                self.output.insert("end", f"  Make/Model: {details['Make']} {details['Model']} ({details['Year']})\n")
-                self.output.insert("end", f"  Chassis No: {details['Chassis_No']}\n")
-                self.output.insert("end", f"  Body Type: {details['Body_type']}\n\n")
-                
-                # Customer Information
-                self.output.insert("end", "CUSTOMER INFORMATION:\n")
-                self.output.insert("end", f"  ID: {details['Customer_ID']}\n")
-                self.output.insert("end", f"  Name: {details['Customer_Name']}\n")
-                self.output.insert("end", f"  Phone: {details['Phone_no']}\n")
-                self.output.insert("end", f"  Email: {details['email_ID']}\n\n")
-                
-                # Service Information
-                self.output.insert("end", "SERVICE INFORMATION:\n")
-                self.output.insert("end", f"  Service Type: {details['Service_type']}\n")
-                self.output.insert("end", f"  Description: {details['Description'] if details['Description'] else 'N/A'}\n")
-                self.output.insert("end", f"  Start Date: {details['Start_Date']}\n")
-                self.output.insert("end", f"  Predicted End: {details['Predicted_End_date'] if details['Predicted_End_date'] else 'Not Set'}\n")
-                self.output.insert("end", f"  Predicted Cost: ${details['Predicted_Cost'] if details['Predicted_Cost'] else 0}\n\n")
-                
-                # Complaints
-                self.output.insert("end", "COMPLAINTS/ISSUES:\n")
-                if complaints:
-                    for i, comp in enumerate(complaints, 1):
-                        self.output.insert("end", f"  {i}. {comp['Complaints']}\n")
-                        if comp['Fixed']:
-                            self.output.insert("end", f"     Fixed: {comp['Fixed']}\n")
-                else:
-                    self.output.insert("end", "  No complaints recorded.\n")
-                self.output.insert("end", "\n")
-                
-                # Parts
-                self.output.insert("end", "PARTS USED:\n")
-                if parts:
-                    for part in parts:
-                        self.output.insert("end", f"  Part No: {part['Part_No']} | Qty: {part['Quantity']} | Price: ${part['Price']} | Total: ${part['Total']}\n")
-                    
-                    # --- UPDATED: Using the nested query result directly ---
-                    total_cost = details.get('Total_Parts_Cost', 0)
-                    self.output.insert("end", f"\n  Total Parts Cost: ${total_cost}\n")
-                else:
-                    self.output.insert("end", "  No parts recorded.\n")
-
-                popup.destroy()
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error fetching job details: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="View Details", command=submit).pack(pady=15)
-
-    def add_complaint_popup(self):
-        """Popup to add complaints/issues for a job"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Add Complaint/Issue")
-        popup.geometry("500x350")
-
-        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
-        job_entry = ctk.CTkEntry(popup, width=350)
-        job_entry.pack(pady=5)
-
-        if self.selected_job_id:
-            job_entry.insert(0, self.selected_job_id)
-
-        ctk.CTkLabel(popup, text="Complaint/Issue Description:").pack(pady=5)
-        complaint_text = ctk.CTkTextbox(popup, width=450, height=150)
-        complaint_text.pack(pady=5)
-
-        def submit():
-            job_id = job_entry.get().strip()
-            text = complaint_text.get("1.0", "end").strip()
-
-            if not job_id or not text:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Both Service ID and complaint text are required!\n")
-                return
-
-            try:
-                result = add_complaint_for_job(job_id, text)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if result is True:
-                    self.output.insert("end", f"✓ Complaint added successfully for Service ID {job_id}!\n")
-                elif isinstance(result, str):
-                    self.output.insert("end", f"Error: {result}\n")
-                else:
-                    self.output.insert("end", "Error: Failed to add complaint.\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Submit Complaint", command=submit).pack(pady=15)
-
-    def add_parts_popup(self):
-        """Popup to add parts for a job"""
-        popup = ctk.CTkToplevel(self)
-        popup.title("Add Parts for Job")
-        popup.geometry("550x450")
-
-        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
-        job_entry = ctk.CTkEntry(popup, width=400)
-        job_entry.pack(pady=5)
-
-        if self.selected_job_id:
-            job_entry.insert(0, self.selected_job_id)
-
-        ctk.CTkLabel(popup, text="Enter parts (one per line):").pack(pady=5)
-        ctk.CTkLabel(popup, text="Format: PartNo:Quantity:Price", font=("", 10), text_color="gray").pack()
-        ctk.CTkLabel(popup, text="Example: ABC123:2:150", font=("", 10), text_color="gray").pack()
-        
-        parts_text = ctk.CTkTextbox(popup, width=450, height=200)
-        parts_text.pack(pady=10)
-
-        def submit():
-            job_id = job_entry.get().strip()
-            raw = parts_text.get("1.0", "end").strip()
-
-            if not job_id:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Service ID is required!\n")
-                return
-
-            if not raw:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Please enter at least one part!\n")
-                return
-
-            parts_list = []
-            try:
-                for line in raw.split('\n'):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    part_no, qty, price = line.split(':')
-                    parts_list.append((part_no.strip(), int(qty.strip()), int(float(price.strip()))))
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error parsing parts input: {str(e)}\n")
-                self.output.insert("end", "Please use format: PartNo:Quantity:Price (one per line)\n")
-                return
-
-            try:
-                result = add_parts_for_job(job_id, parts_list)
-                
-                popup.destroy()
-                self.output.delete("1.0", "end")
-                
-                if result is True:
-                    self.output.insert("end", f"✓ {len(parts_list)} part(s) added successfully for Service ID {job_id}!\n")
-                    
-                    # Calculate and show total cost
-                    total_cost = get_total_parts_cost(job_id)
-                    self.output.insert("end", f"Total parts cost for this job: ${total_cost}\n")
-                elif isinstance(result, str):
-                    self.output.insert("end", f"Error: {result}\n")
-                else:
-                    self.output.insert("end", "Error: Failed to add parts.\n")
-
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-                popup.destroy()
-
-        ctk.CTkButton(popup, text="Add Parts", command=submit).pack(pady=15)
+import customtkinter as ctk
+from ServiceTechView import (
+    get_job_bundle,
+    add_complaint_for_job,
+    add_parts_for_job,
+    get_total_parts_cost
+)
+from job_search import search_jobs
+from delta_sync import JobListSync
+from async_ui import AsyncViewMixin
+from export_view import ExportMixin
+from data_table import DataTable
+from DB_connecrtors import stream_query
+from query_registry import sql
+from events import JobCreated, TechnicianAssigned, ComplaintAdded, PartsAdded
+from datetime import date
+
+JOB_COLUMNS = [
+    ("Service_ID", "Service ID", 90),
+    ("Reg_No", "Vehicle", 110),
+    ("Make", "Make", 100),
+    ("Model", "Model", 100),
+    ("Service_type", "Service Type", 130),
+    ("Start_Date", "Start Date", 100),
+    ("Predicted_End_date", "Predicted End", 110),
+    ("Predicted_Cost", "Predicted Cost", 110, ","),
+]
+
+SEARCH_COLUMNS = [
+    ("Service_ID", "Service ID", 90),
+    ("score", "Relevance", 80, ".2f"),
+    ("Reg_No", "Vehicle", 100),
+    ("Make", "Make", 90),
+    ("Model", "Model", 90),
+    ("Service_type", "Service Type", 110),
+    ("Start_Date", "Start Date", 100),
+    ("Description", "Description", 200),
+    ("complaint_text", "Complaints / Fixes", 300),
+]
+
+class ServiceTechViewGUI(ExportMixin, AsyncViewMixin, ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.pack(fill="both", expand=True)
+        self.current_tech_id = None
+        self.job_sync = None
+        self.selected_job_id = None
+        # (job_id, details, complaints, parts) of the job details last rendered
+        self.shown_job = None
+        self.search_text = ""
+        self.search_page = 1
+        self.init_async()
+        self.build_ui()
+
+        # Writes from any tab patch the job on screen / refresh the job list by delta
+        self.subscribe_event(ComplaintAdded, self._complaint_added)
+        self.subscribe_event(PartsAdded, self._parts_added)
+        self.subscribe_event(JobCreated, self._job_assigned)
+        self.subscribe_event(TechnicianAssigned, self._job_assigned)
+
+    def build_ui(self):
+        # Title
+        title = ctk.CTkLabel(self, text="Service Technician Dashboard", font=("", 18, "bold"))
+        title.pack(pady=10)
+
+        # Technician Login Section
+        login_frame = ctk.CTkFrame(self)
+        login_frame.pack(pady=10)
+        
+        ctk.CTkLabel(login_frame, text="Technician ID:").grid(row=0, column=0, padx=5)
+        self.tech_id_entry = ctk.CTkEntry(login_frame, width=200)
+        self.tech_id_entry.grid(row=0, column=1, padx=5)
+        
+        ctk.CTkButton(login_frame, text="Login", command=self.login_technician).grid(row=0, column=2, padx=5)
+
+        # Button Section
+        btn_frame = ctk.CTkFrame(self)
+        btn_frame.pack(pady=5)
+
+        ctk.CTkButton(btn_frame, text="My Jobs", command=self.show_my_jobs).grid(row=0, column=0, padx=5)
+        ctk.CTkButton(btn_frame, text="Job Details", command=self.show_job_details).grid(row=0, column=1, padx=5)
+        ctk.CTkButton(btn_frame, text="Add Complaint", command=self.add_complaint_popup).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btn_frame, text="Add Parts", command=self.add_parts_popup).grid(row=0, column=3, padx=5)
+
+        # Search Section - past jobs with similar symptoms
+        search_frame = ctk.CTkFrame(self)
+        search_frame.pack(pady=5)
+
+        ctk.CTkLabel(search_frame, text="Search past jobs:").grid(row=0, column=0, padx=5)
+        self.search_entry = ctk.CTkEntry(search_frame, width=300,
+                                         placeholder_text="e.g. knocking, AC not cooling")
+        self.search_entry.grid(row=0, column=1, padx=5)
+        self.search_entry.bind("<Return>", lambda _: self.search_past_jobs())
+        ctk.CTkButton(search_frame, text="Search", width=80,
+                      command=self.search_past_jobs).grid(row=0, column=2, padx=5)
+        self.search_prev_btn = ctk.CTkButton(search_frame, text="◀", width=40, state="disabled",
+                                             command=lambda: self.load_search_page(self.search_page - 1))
+        self.search_prev_btn.grid(row=0, column=3, padx=(15, 2))
+        self.search_page_label = ctk.CTkLabel(search_frame, text="", width=60)
+        self.search_page_label.grid(row=0, column=4, padx=2)
+        self.search_next_btn = ctk.CTkButton(search_frame, text="▶", width=40, state="disabled",
+                                             command=lambda: self.load_search_page(self.search_page + 1))
+        self.search_next_btn.grid(row=0, column=5, padx=2)
+
+        self.build_busy_bar(self).pack(pady=2)
+
+        # Output Section - messages and job details above, job rows in the table below
+        self.output = ctk.CTkTextbox(self, width=900, height=200)
+        self.output.pack(pady=(10, 5))
+
+        self.table = DataTable(self, actions=[("Open Job", lambda row: self.open_job(row["Service_ID"]))],
+                               tools=[("Export...", self.export_current)], height=220)
+        self.table.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+    def export_source(self):
+        """Export the technician's whole job list from the server, or the search results on screen"""
+        tech_id = self.current_tech_id
+        if tech_id is not None and self.table.source == ("jobs", tech_id):
+            return f"jobs-{tech_id}", lambda columns: stream_query(
+                sql("get_jobs_for_technician"), (tech_id,), columns=columns)
+        return super().export_source()
+
+    def login_technician(self):
+        """Verify technician exists and store ID"""
+        tech_id = self.tech_id_entry.get().strip()
+        
+        if not tech_id:
+            self.output.delete("1.0", "end")
+            self.output.insert("end", "Error: Please enter a Technician ID!\n")
+            return
+
+        # Try to fetch jobs to verify technician exists; the list is then
+        # kept current by delta sync
+        job_sync = JobListSync("get_jobs_for_technician", tech_id)
+        self.run_async("jobs", job_sync.refresh,
+                       on_done=lambda jobs: self._show_login(tech_id, job_sync, jobs),
+                       busy_text="Logging in...")
+
+    def _show_login(self, tech_id, job_sync, jobs):
+        """Render the login result"""
+        try:
+            if isinstance(jobs, str):
+                raise RuntimeError(jobs)
+            self.current_tech_id = tech_id
+            self.job_sync = job_sync
+            self.output.delete("1.0", "end")
+            self.output.insert("end", f"✓ Logged in as Technician {tech_id}\n")
+            self.output.insert("end", f"You have {len(jobs)} assigned job(s).\n\n")
+            self.output.insert("end", "Use the buttons above to view jobs and manage work.\n")
+        except Exception as e:
+            self.output.delete("1.0", "end")
+            self.output.insert("end", f"Error: {str(e)}\n")
+
+    def show_my_jobs(self):
+        """Display all jobs assigned to the logged-in technician"""
+        if not self.current_tech_id:
+            self.output.delete("1.0", "end")
+            self.output.insert("end", "Error: Please login with your Technician ID first!\n")
+            return
+
+        # Only jobs changed since the last refresh are fetched
+        self.run_async("jobs", self.job_sync.refresh,
+                       on_done=self._render_jobs, busy_text="Loading jobs...")
+
+    def _render_jobs(self, jobs):
+        """Show the logged-in technician's jobs in the table"""
+        if isinstance(jobs, str):
+            self.output.delete("1.0", "end")
+            self.output.insert("end", f"Error fetching jobs: {jobs}\n")
+            return
+
+        tech_id = self.current_tech_id
+        self.table.set_rows(
+            jobs, title=f"JOBS ASSIGNED TO TECHNICIAN {tech_id}", source=("jobs", tech_id),
+            columns=JOB_COLUMNS, message=f"No jobs assigned to Technician {tech_id}.",
+            keep_view=self.table.source == ("jobs", tech_id)
+        )
+
+    def show_job_details(self):
+        """Show detailed popup to select and view job details"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("View Job Details")
+        popup.geometry("450x200")
+
+        ctk.CTkLabel(popup, text="Enter Service ID:").pack(pady=10)
+        job_entry = ctk.CTkEntry(popup, width=300)
+        job_entry.pack(pady=5)
+
+        def submit():
+            job_id = job_entry.get().strip()
+            if not job_id:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Please enter a Service ID!\n")
+                return
+
+            popup.destroy()
+            self.open_job(job_id)
+
+        ctk.CTkButton(popup, text="View Details", command=submit).pack(pady=15)
+
+    def open_job(self, job_id):
+        """Load and show a job's details (from the popup or a search result link)"""
+        job_id = str(job_id)
+        self.run_async("job_details", self._fetch_job_details, job_id,
+                       on_done=lambda result: self._render_job_details(job_id, *result),
+                       on_error=self._job_details_failed, busy_text=f"Loading job {job_id}...")
+
+    def _job_details_failed(self, e):
+        self.output.delete("1.0", "end")
+        self.output.insert("end", f"Error fetching job details: {str(e)}\n")
+
+    def _render_job_details(self, job_id, details, complaints, parts):
+        """Render a job's details, complaints and parts"""
+        try:
+            if not details:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"No details found for Service ID {job_id}.\n")
+                return
+
+            self.selected_job_id = job_id
+            self.shown_job = (job_id, details, complaints, parts)
+            self.output.delete("1.0", "end")
+            self.output.insert("end", f"=== JOB DETAILS: {job_id} ===\n\n")
+            
+            # Vehicle Information
+            self.output.insert("end", "VEHICLE INFORMATION:\n")
+            self.output.insert("end", f"  Registration: {details['Reg_No']}\n")
+            self.output.insert("end", f"  Make/Model: {details['Make']} {details['Model']} ({details['Year']})\n")
+            self.output.insert("end", f"  Chassis No: {details['Chassis_No']}\n")
+            self.output.insert("end", f"  Body Type: {details['Body_type']}\n\n")
+            
+            # Customer Information
+            self.output.insert("end", "CUSTOMER INFORMATION:\n")
+            self.output.insert("end", f"  ID: {details['Customer_ID']}\n")
+            self.output.insert("end", f"  Name: {details['Customer_Name']}\n")
+            self.output.insert("end", f"  Phone: {details['Phone_no']}\n")
+            self.output.insert("end", f"  Email: {details['email_ID']}\n\n")
+            
+            # Service Information
+            self.output.insert("end", "SERVICE INFORMATION:\n")
+            self.output.insert("end", f"  Service Type: {details['Service_type']}\n")
+            self.output.insert("end", f"  Description: {details['Description'] if details['Description'] else 'N/A'}\n")
+            self.output.insert("end", f"  Start Date: {details['Start_Date']}\n")
+            self.output.insert("end", f"  Predicted End: {details['Predicted_End_date'] if details['Predicted_End_date'] else 'Not Set'}\n")
+            self.output.insert("end", f"  Predicted Cost: ${details['Predicted_Cost'] if details['Predicted_Cost'] else 0}\n\n")
+            
+            # Complaints
+            self.output.insert("end", "COMPLAINTS/ISSUES:\n")
+            if complaints:
+                for i, comp in enumerate(complaints, 1):
+                    self.output.insert("end", f"  {i}. {comp['Complaints']}\n")
+                    if comp['Fixed']:
+                        self.output.insert("end", f"     Fixed: {comp['Fixed']}\n")
+            else:
+                self.output.insert("end", "  No complaints recorded.\n")
+            self.output.insert("end", "\n")
+            
+            # Parts
+            self.output.insert("end", "PARTS USED:\n")
+            if parts:
+                for part in parts:
+                    self.output.insert("end", f"  Part No: {part['Part_No']} | Qty: {part['Quantity']} | Price: ${part['Price']} | Total: ${part['Total']}\n")
+                
+                # Summed from the parts rows of the bundle
+                total_cost = details.get('Total_Parts_Cost', 0)
+                self.output.insert("end", f"\n  Total Parts Cost: ${total_cost}\n")
+            else:
+                self.output.insert("end", "  No parts recorded.\n")
+
+        except Exception as e:
+            self._job_details_failed(e)
+
+    def _showing(self, header):
+        """True if the output still starts with a header this view rendered"""
+        return self.output.get("1.0", "1.end") == header
+
+    def _shown_job_for(self, job_id):
+        """The rendered job details of a job, if they are still on screen"""
+        if self.shown_job is None or self.shown_job[0] != str(job_id):
+            return None
+        if not self._showing(f"=== JOB DETAILS: {job_id} ==="):
+            return None
+        return self.shown_job
+
+    def _complaint_added(self, event):
+        """Append a new complaint to the job on screen"""
+        shown = self._shown_job_for(event.job_id)
+        if shown:
+            job_id, details, complaints, parts = shown
+            self._render_job_details(job_id, details, complaints + [{"Complaints": event.complaint, "Fixed": None}], parts)
+
+    def _parts_added(self, event):
+        """Append new parts (and their cost) to the job on screen"""
+        shown = self._shown_job_for(event.job_id)
+        if shown:
+            job_id, details, complaints, parts = shown
+            added = [{"Part_No": part_no, "Quantity": qty, "Price": price, "Total": qty * price}
+                     for part_no, qty, price in event.parts]
+            details = dict(details, Total_Parts_Cost=(details.get("Total_Parts_Cost") or 0) + sum(p["Total"] for p in added))
+            self._render_job_details(job_id, details, complaints, parts + added)
+
+    def _job_assigned(self, event):
+        """A job was given to the logged-in technician - refresh the list on screen"""
+        if event.tech_id is None or str(event.tech_id) != str(self.current_tech_id):
+            return
+        if self.table.source == ("jobs", self.current_tech_id):
+            # Delta sync reads just the new job
+            self.show_my_jobs()
+
+    @staticmethod
+    def _fetch_job_details(job_id):
+        """Fetch job, complaints and parts in one round trip (runs on a worker thread)"""
+        bundle = get_job_bundle(job_id)
+        if not bundle:
+            return None, [], []
+        return bundle["details"], bundle["complaints"], bundle["parts"]
+
+    def search_past_jobs(self):
+        """Start a search of past jobs' descriptions, complaints and fixes"""
+        text = self.search_entry.get().strip()
+        if not text:
+            self.output.delete("1.0", "end")
+            self.output.insert("end", "Error: Please enter words to search for!\n")
+            return
+        self.search_text = text
+        self.load_search_page(1)
+
+    def load_search_page(self, page):
+        """Fetch one page of the current search in the background"""
+        if not self.search_text or page < 1:
+            return
+        text = self.search_text
+        self.run_async("search", search_jobs, text, page,
+                       on_done=lambda result: self._render_search(text, page, result),
+                       busy_text="Searching...")
+
+    def _render_search(self, text, page, result):
+        """Show a page of search results; opening a row shows the job's details"""
+        if isinstance(result, str):
+            self.output.delete("1.0", "end")
+            self.output.insert("end", f"Error searching jobs: {result}\n")
+            return
+
+        self.search_page = page
+        rows = result["rows"]
+        self.search_page_label.configure(text=f"Page {page}" if rows else "")
+        self.search_prev_btn.configure(state="normal" if page > 1 else "disabled")
+        self.search_next_btn.configure(state="normal" if result["has_more"] else "disabled")
+
+        for job in rows:
+            job["complaint_text"] = "; ".join(
+                f"{c['Complaints']} -> Fixed: {c['Fixed']}" if c['Fixed'] else c['Complaints']
+                for c in job["complaints"]
+            )
+        self.table.set_rows(
+            rows, title=f"PAST JOBS MATCHING \"{text}\" (best first)", source="search",
+            columns=SEARCH_COLUMNS, message=f"No past jobs match \"{text}\"."
+        )
+
+    def add_complaint_popup(self):
+        """Popup to add complaints/issues for a job"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Add Complaint/Issue")
+        popup.geometry("500x350")
+
+        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
+        job_entry = ctk.CTkEntry(popup, width=350)
+        job_entry.pack(pady=5)
+
+        if self.selected_job_id:
+            job_entry.insert(0, self.selected_job_id)
+
+        ctk.CTkLabel(popup, text="Complaint/Issue Description:").pack(pady=5)
+        complaint_text = ctk.CTkTextbox(popup, width=450, height=150)
+        complaint_text.pack(pady=5)
+
+        def submit():
+            job_id = job_entry.get().strip()
+            text = complaint_text.get("1.0", "end").strip()
+
+            if not job_id or not text:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Both Service ID and complaint text are required!\n")
+                return
+
+            popup.destroy()
+            self.run_async("add_complaint", add_complaint_for_job, job_id, text,
+                           on_done=lambda result: complaint_done(job_id, result),
+                           busy_text="Saving complaint...")
+
+        def complaint_done(job_id, result):
+            try:
+                self.output.delete("1.0", "end")
+                
+                if result is True:
+                    self.output.insert("end", f"✓ Complaint added successfully for Service ID {job_id}!\n")
+                elif isinstance(result, str):
+                    self.output.insert("end", f"Error: {result}\n")
+                else:
+                    self.output.insert("end", "Error: Failed to add complaint.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Submit Complaint", command=submit).pack(pady=15)
+
+    def add_parts_popup(self):
+        """Popup to add parts for a job"""
+        popup = ctk.CTkToplevel(self)
+        popup.title("Add Parts for Job")
+        popup.geometry("550x450")
+
+        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
+        job_entry = ctk.CTkEntry(popup, width=400)
+        job_entry.pack(pady=5)
+
+        if self.selected_job_id:
+            job_entry.insert(0, self.selected_job_id)
+
+        ctk.CTkLabel(popup, text="Enter parts (one per line):").pack(pady=5)
+        ctk.CTkLabel(popup, text="Format: PartNo:Quantity:Price", font=("", 10), text_color="gray").pack()
+        ctk.CTkLabel(popup, text="Example: ABC123:2:150", font=("", 10), text_color="gray").pack()
+        
+        parts_text = ctk.CTkTextbox(popup, width=450, height=200)
+        parts_text.pack(pady=10)
+
+        def submit():
+            job_id = job_entry.get().strip()
+            raw = parts_text.get("1.0", "end").strip()
+
+            if not job_id:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Service ID is required!\n")
+                return
+
+            if not raw:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Please enter at least one part!\n")
+                return
+
+            parts_list = []
+            try:
+                for line in raw.split('\n'):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    part_no, qty, price = line.split(':')
+                    parts_list.append((part_no.strip(), int(qty.strip()), int(float(price.strip()))))
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error parsing parts input: {str(e)}\n")
+                self.output.insert("end", "Please use format: PartNo:Quantity:Price (one per line)\n")
+                return
+
+            self.run_async("add_parts", self._save_parts, job_id, parts_list,
+                           on_done=lambda result: parts_done(job_id, parts_list, *result),
+                           busy_text="Saving parts...")
+
+        def parts_done(job_id, parts_list, result, total_cost):
+            try:
+                self.output.delete("1.0", "end")
+                
+                if result is True:
+                    popup.destroy()
+                    self.output.insert("end", f"✓ {len(parts_list)} part(s) added successfully for Service ID {job_id}!\n")
+                    
+                    # Show total cost calculated on the worker thread
+                    self.output.insert("end", f"Total parts cost for this job: ${total_cost}\n")
+                elif isinstance(result, str):
+                    self.output.insert("end", f"Error: {result}\n")
+                    # The batch is atomic, so keep the popup open for a corrected resubmit
+                    self.output.insert("end", "No parts were saved - fix the list and submit it again.\n")
+                else:
+                    self.output.insert("end", "Error: Failed to add parts.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Add Parts", command=submit).pack(pady=15)
+
+    @staticmethod
+    def _save_parts(job_id, parts_list):
+        """Insert parts and recalculate the job total (runs on a worker thread)"""
+        result = add_parts_for_job(job_id, parts_list)
+        total_cost = get_total_parts_cost(job_id) if result is True else 0
+        return result, total_cost
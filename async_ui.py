@@ -0,0 +1,291 @@
+import customtkinter as ctk
+import queue
+import threading
+from DB_connecrtors import submit_call
+from events import subscribe, unsubscribe
+
+# How often (ms) the Tk main thread checks whether a background query finished
+POLL_INTERVAL_MS = 40
+
+# Streaming: rows handed to the widgets per batch, and how many batches may wait
+# for the Tk thread before the worker pauses (keeps memory bounded)
+STREAM_BATCH_ROWS = 200
+STREAM_MAX_PENDING = 8
+
+# How often (ms) the Tk main thread delivers change events published by workers
+EVENT_POLL_MS = 100
+
+class AsyncViewMixin:
+    """
+    Mixin for CTk views that run database calls off the Tk main thread
+
+    Work is submitted to the DB_connecrtors executor and the result is handed
+    back to the widgets through after(), so callbacks always run on the Tk
+    main thread. Each task has a key: starting a new task with the same key
+    supersedes the old one, whose result is then ignored.
+
+    Change events (events.py) subscribed through subscribe_event are queued
+    by the publishing thread and delivered on the Tk main thread too.
+    """
+
+    def init_async(self):
+        """Set up task bookkeeping (call before build_ui)"""
+        self._tasks = {}
+        self._events = queue.SimpleQueue()
+        self._event_tokens = []
+        self._events_after = None
+        self.busy_label = None
+        self.cancel_btn = None
+        self.bind("<Destroy>", self._end_subscriptions, add="+")
+
+    def build_busy_bar(self, parent):
+        """Create the busy indicator + cancel button and return its frame"""
+        bar = ctk.CTkFrame(parent, fg_color="transparent")
+
+        self.busy_label = ctk.CTkLabel(bar, text="", text_color="gray", width=160)
+        self.busy_label.pack(side="left", padx=5)
+
+        self.cancel_btn = ctk.CTkButton(
+            bar,
+            text="Cancel",
+            width=80,
+            state="disabled",
+            fg_color="gray",
+            command=self.cancel_pending
+        )
+        self.cancel_btn.pack(side="left", padx=5)
+        return bar
+
+    def run_async(self, key, func, *args, on_done=None, on_error=None, busy_text="Loading...", stop=None):
+        """
+        Run func(*args) in the background and call on_done(result) on the Tk thread
+
+        Args:
+            key: Task name; a newer task with the same key cancels this one
+            func: Blocking data-access function
+            on_done: Callback receiving func's return value
+            on_error: Callback receiving the exception (defaults to show_error)
+            busy_text: Text shown in the busy indicator while running, or a
+                       callable returning it (re-read on every poll, for progress)
+            stop: Optional threading.Event that func checks; set on cancel, so
+                  long-running work (e.g. an export) can stop part way. Its
+                  return value then still goes to on_done
+
+        Returns:
+            The submitted Future
+        """
+        self._cancel_task(key)
+
+        future = submit_call(func, *args)
+        self._tasks[key] = (future, busy_text, stop)
+        self._refresh_busy()
+        self.after(POLL_INTERVAL_MS, self._poll_task, key, future, on_done, on_error)
+        return future
+
+    def run_stream(self, key, make_rows, on_batch, on_done=None, on_error=None,
+                   batch_rows=STREAM_BATCH_ROWS, busy_text="Loading..."):
+        """
+        Consume a row iterator in the background and render it batch by batch
+
+        Args:
+            key: Task name (same superseding rules as run_async)
+            make_rows: Zero-argument callable returning the row iterator, e.g.
+                       lambda: stream_query(...); it is called on the worker
+            on_batch: Callback receiving each list of rows on the Tk thread
+            on_done: Callback receiving the total row count after the last batch
+
+        Cancelling stops the worker between rows and closes the iterator, which
+        releases its connection.
+
+        Returns:
+            The submitted Future
+        """
+        self._cancel_task(key)
+
+        stop = threading.Event()
+        batches = queue.Queue(maxsize=STREAM_MAX_PENDING)
+
+        def put(batch):
+            # Wait for the Tk thread to catch up, but give up promptly on cancel
+            while not stop.is_set():
+                try:
+                    batches.put(batch, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def pump():
+            rows = make_rows()
+            total = 0
+            batch = []
+            try:
+                for row in rows:
+                    if stop.is_set():
+                        return total
+                    batch.append(row)
+                    total += 1
+                    if len(batch) >= batch_rows:
+                        if not put(batch):
+                            return total
+                        batch = []
+                if batch:
+                    put(batch)
+                return total
+            finally:
+                close = getattr(rows, "close", None)
+                if close:
+                    close()
+
+        future = submit_call(pump)
+        self._tasks[key] = (future, busy_text, stop)
+        self._refresh_busy()
+        self.after(POLL_INTERVAL_MS, self._poll_stream, key, future, batches,
+                   on_batch, on_done, on_error)
+        return future
+
+    def subscribe_event(self, event_type, handler):
+        """
+        Call handler(event) on the Tk thread for each published event of a type
+
+        Returns:
+            Token for unsubscribe_event (view-lifetime subscriptions can keep it)
+        """
+        token = subscribe(event_type, lambda event: self._events.put((handler, event)))
+        self._event_tokens.append(token)
+        if self._events_after is None:
+            self._events_after = self.after(EVENT_POLL_MS, self._poll_events)
+        return token
+
+    def unsubscribe_event(self, token):
+        """Stop a subscription made with subscribe_event (e.g. when a popup closes)"""
+        unsubscribe(token)
+        if token in self._event_tokens:
+            self._event_tokens.remove(token)
+
+    def _end_subscriptions(self, _event=None):
+        """Widget destroyed - drop its subscriptions and stop delivering events"""
+        for token in self._event_tokens:
+            unsubscribe(token)
+        self._event_tokens.clear()
+        if self._events_after is not None:
+            self.after_cancel(self._events_after)
+            self._events_after = None
+
+    def cancel_pending(self):
+        """
+        Cancel every outstanding task (the Cancel button)
+
+        Results still in flight are discarded, except from running tasks that
+        have a stop event: those are asked to stop and still report through
+        on_done, e.g. an export saying it was cancelled and cleaned up.
+        """
+        for key, (future, _, stop) in list(self._tasks.items()):
+            if stop is not None and not future.cancel():
+                stop.set()
+                self._tasks[key] = (future, "Cancelling...", stop)
+            else:
+                self._cancel_task(key)
+        self._refresh_busy()
+        if self.busy_label is not None and not self._tasks:
+            self.busy_label.configure(text="Cancelled")
+
+    def show_error(self, error):
+        """Default error handler - writes to the view's output textbox"""
+        self.output.delete("1.0", "end")
+        self.output.insert("end", f"Error: {error}\n")
+
+    def _cancel_task(self, key):
+        """Cancel one task (if any) and forget it"""
+        task = self._tasks.pop(key, None)
+        if task is None:
+            return
+        future, _, stop = task
+        future.cancel()
+        if stop is not None:
+            stop.set()
+
+    def _poll_events(self):
+        """Deliver queued change events from the Tk main thread (while anything is subscribed)"""
+        self._events_after = None
+        while True:
+            try:
+                handler, event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                handler(event)
+            except Exception as e:
+                print(f"Error applying {type(event).__name__}: {e}")
+
+        if self._event_tokens:
+            self._events_after = self.after(EVENT_POLL_MS, self._poll_events)
+
+    def _poll_stream(self, key, future, batches, on_batch, on_done, on_error):
+        """Hand streamed batches to the widgets from the Tk main thread"""
+        current = self._tasks.get(key)
+        if current is None or current[0] is not future:
+            return
+
+        # Render a few batches per tick so the window stays responsive
+        for _ in range(4):
+            try:
+                batch = batches.get_nowait()
+            except queue.Empty:
+                break
+            on_batch(batch)
+
+        if not future.done() or not batches.empty():
+            self.after(POLL_INTERVAL_MS, self._poll_stream, key, future, batches,
+                       on_batch, on_done, on_error)
+            return
+
+        del self._tasks[key]
+        self._refresh_busy()
+
+        try:
+            total = future.result()
+        except Exception as e:
+            (on_error or self.show_error)(e)
+            return
+
+        if on_done:
+            on_done(total)
+
+    def _poll_task(self, key, future, on_done, on_error):
+        """Check a task from the Tk main thread and dispatch its result"""
+        current = self._tasks.get(key)
+        if current is None or current[0] is not future:
+            # Superseded or cancelled - drop the result
+            return
+
+        if not future.done():
+            if callable(current[1]):
+                self._refresh_busy()
+            self.after(POLL_INTERVAL_MS, self._poll_task, key, future, on_done, on_error)
+            return
+
+        del self._tasks[key]
+        self._refresh_busy()
+
+        try:
+            result = future.result()
+        except Exception as e:
+            (on_error or self.show_error)(e)
+            return
+
+        if on_done:
+            on_done(result)
+
+    def _refresh_busy(self):
+        """Update the busy indicator to reflect outstanding tasks"""
+        if self.busy_label is None:
+            return
+
+        if self._tasks:
+            _, text, _ = next(reversed(self._tasks.values()))
+            self.busy_label.configure(text=f"⏳ {text() if callable(text) else text}")
+            self.cancel_btn.configure(state="normal")
+        else:
+            self.busy_label.configure(text="")
+            self.cancel_btn.configure(state="disabled")
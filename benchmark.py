@@ -0,0 +1,338 @@
+"""
+benchmark.py - Latency benchmark for the data-access layer.
+
+Seeds the schema at one or more scales, then times every data-access
+function of ServiceTechView and ManagerView plus the registered queries the
+customer and rep views run, and reports p50/p95/p99 latency and rows/s.
+
+    python -m benchmark                                # 10k rows, in-memory SQLite
+    python -m benchmark --scales 10000 100000 1000000 --output run.json
+    python -m benchmark --compare baseline.json --output run.json
+
+Scale is the number of service jobs; datagen.py sizes the other tables from it.
+Results are written as JSON; --compare prints the change against an earlier
+run and exits with status 1 if any p95 regressed by more than --threshold.
+Seeding wipes every workshop table, so a MySQL database is only used when
+--allow-wipe is given.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import date
+
+import DB_connecrtors
+from DB_connecrtors import initialize_connection_pool, close_pool
+from query_registry import run_named
+import ServiceTechView
+import ManagerView
+from customer_rep_view import create_job_with_assignment, assign_technician_to_job
+from job_search import search_jobs
+import typeahead
+from delta_sync import JobListSync
+from datagen import SyntheticWorkshop, FIRST_NAMES, tech_id, customer_id, job_id, reg_no, rep_id, part_no
+from populate_db import load_tables, truncate_tables
+from rollups import refresh_rollups
+
+DEFAULT_DB = "sqlite::memory:"
+DEFAULT_SCALES = (10_000,)
+DEFAULT_ITERATIONS = 200
+WARMUP_ITERATIONS = 5
+SEED_CHUNK_ROWS = 5_000
+REGRESSION_THRESHOLD = 0.10
+
+PART_CATALOG = tuple(part_no(i) for i in range(40))
+# Symptom searches: one rare word, a common phrase, a stemmed variant
+SEARCH_TEXTS = ("knocking", "AC not cooling", "brake squeal", "battery drain")
+
+# ---------- seeding ----------
+
+def seed_database(jobs, seed=42):
+    """
+    Wipe the workshop tables and bulk-load synthetic data for a number of jobs
+
+    Returns:
+        (SyntheticWorkshop, seconds taken, total rows inserted)
+    """
+    workshop = SyntheticWorkshop(jobs, seed)
+    started = time.perf_counter()
+    truncate_tables()
+    total = load_tables(workshop.tables(), chunk_rows=SEED_CHUNK_ROWS)
+    refresh_rollups()
+    # Hot keys of the previous data set
+    typeahead.clear_hot_keys()
+    return workshop, time.perf_counter() - started, total
+
+# ---------- cases ----------
+
+def _rows(result):
+    """Row count of a data-access return value"""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, str):
+        raise RuntimeError(result)
+    if isinstance(result, tuple) and result and result[0] is False:
+        raise RuntimeError(result[1])
+    return 0 if result is None else 1
+
+def build_cases(scale, rng):
+    """
+    Benchmark cases: name -> callable(i) running one iteration
+
+    Write cases derive their keys from the iteration number, so runs with
+    different time_case offsets never collide.
+    """
+    def some_job():
+        return job_id(rng.randrange(scale.jobs))
+
+    def some_tech():
+        return tech_id(rng.randrange(scale.technicians))
+
+    def some_customer():
+        return customer_id(rng.randrange(scale.customers))
+
+    def some_typed_prefix():
+        """What a rep has typed so far: part of a name, customer ID or Reg_No"""
+        text = rng.choice((rng.choice(FIRST_NAMES), customer_id(rng.randrange(scale.customers)),
+                           reg_no(rng.randrange(scale.vehicles))))
+        return text[:rng.randint(2, len(text))]
+
+    # One technician's open job list, refreshed by delta sync; write cases
+    # in the same run show up as changes
+    tech_jobs = JobListSync("get_jobs_for_technician", some_tech())
+
+    customers_page = [None]
+
+    def next_customers_page(_):
+        after = customers_page[0]
+        name = "page_customers_after" if after else "page_customers_first"
+        rows = run_named(name, (after, 51) if after else (51,), fetch=True)
+        customers_page[0] = rows[-1]["Customer_ID"] if len(rows) == 51 else None
+        return rows
+
+    return {
+        # ServiceTechView
+        "tech.get_jobs_for_technician": lambda i: ServiceTechView.get_jobs_for_technician(some_tech()),
+        "tech.get_job_details": lambda i: ServiceTechView.get_job_details(some_job()),
+        "tech.get_complaints_for_job": lambda i: ServiceTechView.get_complaints_for_job(some_job()),
+        "tech.get_parts_for_job": lambda i: ServiceTechView.get_parts_for_job(some_job()),
+        "tech.get_total_parts_cost": lambda i: ServiceTechView.get_total_parts_cost(some_job()),
+        "tech.refresh_my_jobs": lambda i: tech_jobs.refresh(),
+        "tech.get_job_bundle": lambda i: ServiceTechView.get_job_bundle(some_job()),
+        "tech.get_job_bundles_50": lambda i: ServiceTechView.get_job_bundles([some_job() for _ in range(50)]),
+        "tech.add_complaint_for_job": lambda i: ServiceTechView.add_complaint_for_job(some_job(), "Bench complaint"),
+        "tech.add_parts_for_job": lambda i: ServiceTechView.add_parts_for_job(
+            some_job(), [(rng.choice(PART_CATALOG), 1, 100) for _ in range(3)]),
+        "tech.search_jobs": lambda i: search_jobs(rng.choice(SEARCH_TEXTS)),
+        # ManagerView
+        "manager.get_all_technicians": lambda i: ManagerView.get_all_technicians(),
+        "manager.get_all_customer_reps": lambda i: ManagerView.get_all_customer_reps(),
+        "manager.get_techs_by_part": lambda i: ManagerView.get_techs_by_part(rng.choice(PART_CATALOG)),
+        "manager.get_techs_by_parts": lambda i: ManagerView.get_techs_by_part(rng.sample(PART_CATALOG, 3)),
+        "manager.get_techs_by_part_prefix": lambda i: ManagerView.get_techs_by_part(
+            rng.choice(PART_CATALOG).split("-")[0] + "-%"),
+        "manager.add_new_technician": lambda i: ManagerView.add_new_technician(
+            f"BX{i:06d}", "New", "Tech", "General", "Bench", 1),
+        "manager.delete_technician": lambda i: ManagerView.delete_technician(f"BX{i:06d}"),
+        "manager.add_new_customer_rep": lambda i: ManagerView.add_new_customer_rep(f"BY{i:06d}", "New Rep", 1, 1),
+        "manager.delete_customer_rep": lambda i: ManagerView.delete_customer_rep(f"BY{i:06d}"),
+        "manager.analytics_by_technician": lambda i: ManagerView.get_analytics(
+            "technician", date(1900, 1, 1), date(9999, 12, 1), refresh=False),
+        "manager.analytics_by_month": lambda i: ManagerView.get_analytics(
+            "month", date(1900, 1, 1), date(9999, 12, 1), refresh=False),
+        # CustomerView queries
+        "customer.customer_login": lambda i: run_named("customer_login", (some_customer(),), fetch=True),
+        "customer.get_customer_vehicles": lambda i: run_named("get_customer_vehicles", (some_customer(),), fetch=True),
+        "customer.view_service_status": lambda i: run_named(
+            "get_customer_service_status", (some_customer(),), fetch=True),
+        # CustomerRepView queries
+        "rep.technician_picklist": lambda i: run_named("technician_picklist", fetch=True),
+        "rep.page_customers": next_customers_page,
+        "rep.create_job_with_assignment": lambda i: create_job_with_assignment(
+            (job_id(scale.jobs + 1 + i), date(2025, 1, 1), reg_no(rng.randrange(scale.vehicles)), "Engine",
+             "Bench job", None, 1000, rep_id(0)),
+            some_tech(), "Bench complaint"),
+        "rep.assign_technician_to_job": lambda i: assign_technician_to_job(some_job(), some_tech()),
+        "rep.typeahead": lambda i: typeahead.suggest(some_typed_prefix()),
+    }
+
+# ---------- timing ----------
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def time_case(func, iterations, offset=0):
+    """
+    Run one case iterations times (after a short warm-up)
+
+    Returns:
+        Dict of latency percentiles (ms), mean, ops/s, rows/s and errors
+    """
+    errors = 0
+    for i in range(WARMUP_ITERATIONS):
+        try:
+            func(offset + i)
+        except Exception:
+            errors += 1
+
+    timings = []
+    total_rows = 0
+    for i in range(WARMUP_ITERATIONS, WARMUP_ITERATIONS + iterations):
+        started = time.perf_counter()
+        try:
+            total_rows += _rows(func(offset + i))
+        except Exception:
+            errors += 1
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    total = sum(timings)
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(timings, 50) * 1000,
+        "p95_ms": percentile(timings, 95) * 1000,
+        "p99_ms": percentile(timings, 99) * 1000,
+        "mean_ms": total / len(timings) * 1000,
+        "max_ms": timings[-1] * 1000,
+        "ops_per_s": len(timings) / total if total else 0.0,
+        "rows": total_rows,
+        "rows_per_s": total_rows / total if total else 0.0,
+        "errors": errors,
+    }
+
+def run_scale(jobs, iterations, seed, only=None):
+    """Seed one scale and time every case; returns the scale's result dict"""
+    print(f"\nSeeding {jobs:,} service jobs...")
+    scale, seconds, rows = seed_database(jobs, seed)
+    print(f"  {rows:,} rows in {seconds:.1f}s ({rows / seconds:,.0f} rows/s)")
+
+    rng = random.Random(seed)
+    results = {}
+    for name, func in build_cases(scale, rng).items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = time_case(func, iterations)
+        r = results[name]
+        print(f"  {name:<36} p50 {r['p50_ms']:8.2f}  p95 {r['p95_ms']:8.2f}  p99 {r['p99_ms']:8.2f} ms"
+              f"  {r['rows_per_s']:>12,.0f} rows/s" + (f"  {r['errors']} errors" if r["errors"] else ""))
+
+    return {"seed_seconds": seconds, "seed_rows": rows, "results": results}
+
+# ---------- comparison ----------
+
+def compare(previous, current, threshold=REGRESSION_THRESHOLD):
+    """
+    Print p50/p95 changes between two result files' data
+
+    Returns:
+        List of "scale/case" names whose p95 regressed by more than threshold
+    """
+    regressions = []
+    print(f"\nComparison (threshold {threshold:.0%} on p95):")
+    for scale, data in current["scales"].items():
+        before = previous.get("scales", {}).get(scale)
+        if not before:
+            continue
+        for name, r in data["results"].items():
+            old = before["results"].get(name)
+            if not old or not old["p95_ms"]:
+                continue
+            change = r["p95_ms"] / old["p95_ms"] - 1
+            p50_change = r["p50_ms"] / old["p50_ms"] - 1 if old["p50_ms"] else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{scale}/{name}")
+            print(f"  {scale:>9} {name:<36} p50 {p50_change:+7.1%}  p95 {change:+7.1%}{flag}")
+    return regressions
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", default=DEFAULT_DB,
+                        help="backend URL: sqlite::memory:, sqlite:file.db or mysql (default %(default)s)")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(DEFAULT_SCALES),
+                        help="service job counts to seed (default %(default)s)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", nargs="+", help="run only cases whose name contains one of these")
+    parser.add_argument("--cache", action="store_true", help="keep the result cache enabled")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--compare", help="earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="p95 regression threshold as a fraction (default %(default)s)")
+    parser.add_argument("--allow-wipe", action="store_true",
+                        help="allow seeding (wiping) a MySQL database")
+    args = parser.parse_args(argv)
+
+    if not args.db.startswith("sqlite:") and not args.allow_wipe:
+        parser.error("seeding wipes every workshop table; pass --allow-wipe to benchmark MySQL")
+
+    if not args.cache:
+        # Measure the database, not the result cache
+        DB_connecrtors.query_cache.max_entries = 0
+
+    report = {
+        "meta": {
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "db": args.db,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "cache": args.cache,
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "scales": {},
+    }
+
+    url = args.db if args.db != "mysql" else None
+    fresh_per_scale = args.db in ("sqlite:", "sqlite::memory:")
+    try:
+        for jobs in args.scales:
+            # A fresh in-memory database per scale; files/MySQL are wiped by seeding
+            if fresh_per_scale:
+                close_pool()
+            if not initialize_connection_pool(url):
+                return 2
+            report["scales"][str(jobs)] = run_scale(jobs, args.iterations, args.seed, args.only)
+    finally:
+        close_pool()
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        regressions = compare(previous, report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
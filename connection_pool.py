@@ -0,0 +1,348 @@
+"""
+connection_pool.py - Connection pool used by DB_connecrtors.
+
+Replaces mysql.connector's fixed-size pool:
+- min_size connections are opened up front, more are opened lazily up to
+  max_size as desks get busy.
+- When every connection is checked out, callers wait in a bounded queue for
+  up to wait_timeout seconds instead of failing straight away.
+- Connections idle for longer than pre_ping_after are pinged before being
+  handed out, and connections beyond min_size that stay idle for
+  idle_timeout are closed.
+- stats() reports what the pool is doing right now.
+"""
+
+import threading
+import time
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+# How a connection is cleaned up when it comes back to the pool:
+#   "none"  - nothing (keeps query_registry's prepared statements alive)
+#   "cheap" - roll back an open transaction; client-side checks only
+#   "full"  - COM_RESET_CONNECTION (also drops prepared statements and
+#             session variables)
+RESET_MODES = ("none", "cheap", "full")
+
+class PoolTimeout(PoolError):
+    """No connection became free within wait_timeout"""
+
+class PoolExhausted(PoolError):
+    """Every connection is checked out and the wait queue is full"""
+
+class _Slot:
+    """One physical connection and its bookkeeping"""
+
+    __slots__ = ("cnx", "created", "last_used")
+
+    def __init__(self, cnx):
+        self.cnx = cnx
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+class PooledConnection:
+    """
+    Checked-out connection; behaves like the underlying connection
+
+    close() hands it back to the pool, disconnect() throws it away (use when
+    the session is in an unknown state, e.g. a half-read result set).
+    """
+
+    def __init__(self, pool, slot):
+        self._pool = pool
+        self._slot = slot
+        self._cnx = slot.cnx
+        self._returned = False
+
+    def __getattr__(self, name):
+        return getattr(self._cnx, name)
+
+    def close(self):
+        if not self._returned:
+            self._returned = True
+            self._pool._release(self._slot)
+
+    def disconnect(self):
+        if not self._returned:
+            self._returned = True
+            self._pool._discard(self._slot)
+
+class ConnectionPool:
+    """
+    Thread-safe pool of MySQL connections with lazy growth
+
+    Args:
+        min_size: Connections opened at startup and never reaped
+        max_size: Hard limit on open connections
+        max_waiters: Callers allowed to queue for a connection at once
+        wait_timeout: Seconds a caller waits before PoolTimeout
+        idle_timeout: Seconds before an idle connection above min_size is closed
+        pre_ping_after: Ping connections idle at least this long before reuse
+        reset: One of RESET_MODES
+        connect: Connection factory (default mysql.connector.connect); anything
+                 returning an object with the mysql.connector connection API
+        **connect_args: Passed to the connection factory
+    """
+
+    def __init__(self, min_size=2, max_size=10, max_waiters=20, wait_timeout=5.0,
+                 idle_timeout=300.0, pre_ping_after=30.0, reset="none", connect=None,
+                 **connect_args):
+        if reset not in RESET_MODES:
+            raise ValueError(f"reset must be one of {RESET_MODES}")
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size, max_size >= 1")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_waiters = max_waiters
+        self.wait_timeout = wait_timeout
+        self.idle_timeout = idle_timeout
+        self.pre_ping_after = pre_ping_after
+        self.reset = reset
+        self._connect = connect or mysql.connector.connect
+        self._connect_args = connect_args
+
+        self._cond = threading.Condition()
+        self._idle = []           # most recently used last (handed out LIFO)
+        self._in_use = set()
+        self._opening = 0         # slots reserved for connections being opened
+        self._waiting = 0
+        self._closed = False
+
+        # metrics
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._timeouts = 0
+        self._rejected = 0
+        self._created = 0
+        self._discarded = 0
+        self._reaped = 0
+        self._ping_failures = 0
+
+        try:
+            for _ in range(min_size):
+                slot = self._open()
+                with self._cond:
+                    self._idle.append(slot)
+        except Exception:
+            # Don't leak the connections opened before the failure
+            for slot in self._idle:
+                self._close_cnx(slot.cnx)
+            self._idle.clear()
+            raise
+
+    # ---------- checkout / return ----------
+
+    def get_connection(self, timeout=None):
+        """
+        Check out a connection, opening or waiting for one if needed
+
+        Raises:
+            PoolExhausted if the wait queue is full
+            PoolTimeout if nothing became free in time
+            mysql.connector.Error if a new connection could not be opened
+        """
+        timeout = self.wait_timeout if timeout is None else timeout
+        # One deadline for the whole call, however many stale connections are skipped
+        deadline = time.monotonic() + timeout
+
+        while True:
+            slot, must_open = self._acquire(deadline, timeout)
+            if must_open:
+                try:
+                    slot = self._open()
+                finally:
+                    with self._cond:
+                        self._opening -= 1
+                        if slot is not None:
+                            self._in_use.add(slot)
+                            self._checkouts += 1
+                        else:
+                            self._cond.notify()
+                return PooledConnection(self, slot)
+
+            if self._healthy(slot):
+                with self._cond:
+                    self._checkouts += 1
+                return PooledConnection(self, slot)
+            # Stale connection - drop it and try again (its slot is free now)
+            self._discard(slot)
+
+    def _acquire(self, deadline, timeout):
+        """
+        Take an idle slot or reserve room for a new one
+
+        Args:
+            deadline: time.monotonic() by which the caller gives up
+            timeout: The caller's total timeout (for the error message)
+        Returns:
+            (slot, must_open)
+        """
+        with self._cond:
+            if self._closed:
+                raise PoolError("Connection pool is closed")
+            self._reap_locked()
+
+            if not self._idle and self._size_locked() >= self.max_size:
+                if self._waiting >= self.max_waiters:
+                    self._rejected += 1
+                    raise PoolExhausted(
+                        f"All {self.max_size} connections busy and {self._waiting} callers already waiting"
+                    )
+                started = time.monotonic()
+                self._waiting += 1
+                self._waits += 1
+                try:
+                    while not self._idle and self._size_locked() >= self.max_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or self._closed:
+                            self._timeouts += 1
+                            raise PoolTimeout(
+                                f"No connection available after {timeout:.1f}s ({self.max_size} in use)"
+                            )
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                    waited = time.monotonic() - started
+                    self._wait_total += waited
+                    self._wait_max = max(self._wait_max, waited)
+
+            if self._idle:
+                slot = self._idle.pop()
+                self._in_use.add(slot)
+                return slot, False
+
+            self._opening += 1
+            return None, True
+
+    def _healthy(self, slot):
+        """Pre-ping a connection that sat idle for a while"""
+        if time.monotonic() - slot.last_used < self.pre_ping_after:
+            return True
+        try:
+            slot.cnx.ping(reconnect=False)
+            return True
+        except Error:
+            with self._cond:
+                self._ping_failures += 1
+            return False
+
+    def _release(self, slot):
+        """Return a connection (called by PooledConnection.close)"""
+        try:
+            clean = self._reset(slot.cnx)
+        except Error:
+            clean = False
+        if not clean:
+            self._discard(slot)
+            return
+
+        with self._cond:
+            self._in_use.discard(slot)
+            slot.last_used = time.monotonic()
+            if self._closed:
+                self._close_cnx(slot.cnx)
+                return
+            self._idle.append(slot)
+            self._cond.notify()
+
+    def _reset(self, cnx):
+        """Apply the reset mode; False means the connection should not be reused"""
+        if getattr(cnx, "unread_result", False):
+            return False
+        if self.reset == "cheap":
+            if cnx.in_transaction:
+                cnx.rollback()
+        elif self.reset == "full":
+            cnx.reset_session()
+        return True
+
+    def _discard(self, slot):
+        """Close a connection and free its slot"""
+        with self._cond:
+            self._in_use.discard(slot)
+            self._discarded += 1
+            self._cond.notify()
+        self._close_cnx(slot.cnx)
+
+    # ---------- maintenance ----------
+
+    def reap(self):
+        """Close connections idle beyond idle_timeout (keeps min_size); returns how many"""
+        with self._cond:
+            return self._reap_locked()
+
+    def _reap_locked(self):
+        now = time.monotonic()
+        reaped = 0
+        # _idle is ordered by last use, so the longest-idle are at the front
+        while (self._idle and self._size_locked() > self.min_size
+               and now - self._idle[0].last_used >= self.idle_timeout):
+            slot = self._idle.pop(0)
+            self._close_cnx(slot.cnx)
+            reaped += 1
+        self._reaped += reaped
+        return reaped
+
+    def close(self):
+        """Close idle connections now and checked-out ones when they come back"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for slot in idle:
+            self._close_cnx(slot.cnx)
+
+    def stats(self):
+        """
+        Live pool metrics
+
+        Returns:
+            Dict with size, idle, checked_out, waiting, checkouts, waits,
+            avg/max wait (ms), timeouts, rejected, created, discarded, reaped,
+            ping_failures and the average/oldest connection age (s)
+        """
+        with self._cond:
+            now = time.monotonic()
+            ages = [now - s.created for s in self._idle + list(self._in_use)]
+            return {
+                "size": self._size_locked(),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "checked_out": len(self._in_use),
+                "waiting": self._waiting,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "avg_wait_ms": self._wait_total / self._waits * 1000 if self._waits else 0.0,
+                "max_wait_ms": self._wait_max * 1000,
+                "timeouts": self._timeouts,
+                "rejected": self._rejected,
+                "created": self._created,
+                "discarded": self._discarded,
+                "reaped": self._reaped,
+                "ping_failures": self._ping_failures,
+                "avg_age_s": sum(ages) / len(ages) if ages else 0.0,
+                "oldest_age_s": max(ages) if ages else 0.0,
+            }
+
+    # ---------- internals ----------
+
+    def _size_locked(self):
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def _open(self):
+        cnx = self._connect(**self._connect_args)
+        with self._cond:
+            self._created += 1
+        return _Slot(cnx)
+
+    @staticmethod
+    def _close_cnx(cnx):
+        try:
+            cnx.close()
+        except Error:
+            pass
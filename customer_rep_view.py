@@ -1,301 +1,511 @@
-import customtkinter as ctk
-from DB_connecrtors import run_query
-from datetime import datetime
-
-class CustomerRepView(ctk.CTkFrame):
-    def __init__(self, parent):
-        super().__init__(parent)
-        self.pack(fill="both", expand=True)
-        self.build_ui()
-
-    def build_ui(self):
-        self.title = ctk.CTkLabel(self, text="Customer Representative Dashboard", font=("", 18))
-        self.title.pack(pady=10)
-
-        # First row of buttons
-        btns1 = ctk.CTkFrame(self)
-        btns1.pack(pady=5)
-        
-        ctk.CTkButton(btns1, text="Register New Customer", command=self.add_customer).grid(row=0, column=0, padx=5)
-        ctk.CTkButton(btns1, text="Register Vehicle", command=self.add_vehicle).grid(row=0, column=1, padx=5)
-        ctk.CTkButton(btns1, text="View Technicians", command=self.show_techs).grid(row=0, column=2, padx=5)
-        ctk.CTkButton(btns1, text="View Customers", command=self.show_customers).grid(row=0, column=3, padx=5)
-
-        # Second row of buttons
-        btns2 = ctk.CTkFrame(self)
-        btns2.pack(pady=5)
-        
-        ctk.CTkButton(btns2, text="Create Service Job", command=self.create_service_job).grid(row=0, column=0, padx=5)
-        ctk.CTkButton(btns2, text="Assign Technician", command=self.assign_technician).grid(row=0, column=1, padx=5)
-
-        self.output = ctk.CTkTextbox(self, width=800, height=350)
-        self.output.pack(pady=20)
-
-    def show_techs(self):
-        query = "SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE FROM service_technician"
-        data = run_query(query, fetch=True)
-        self.output.delete("1.0", "end")
-        
-        if not data:
-            self.output.insert("end", "No technicians found.\n")
-            return
-            
-        self.output.insert("end", "=== SERVICE TECHNICIANS ===\n\n")
-        for d in data:
-            self.output.insert("end", f"ID: {d['technician_ID']} | {d['Fname']} {d['Name']}\n")
-            self.output.insert("end", f"  Trained For: {d['Trained_For']} | Specialization: {d['Specialization']} | Experience: {d['YOE']} years\n\n")
-
-    def show_customers(self):
-        query = "SELECT Customer_ID, Name, email_ID, Phone_no FROM customers"
-        data = run_query(query, fetch=True)
-        self.output.delete("1.0", "end")
-        
-        if not data:
-            self.output.insert("end", "No customers found.\n")
-            return
-            
-        self.output.insert("end", "=== REGISTERED CUSTOMERS ===\n\n")
-        for c in data:
-            self.output.insert("end", f"ID: {c['Customer_ID']} | {c['Name']} | {c['email_ID']} | {c['Phone_no']}\n")
-
-    def add_customer(self):
-        popup = ctk.CTkToplevel(self)
-        popup.title("Register New Customer")
-        popup.geometry("400x450")
-
-        labels = ["Customer ID", "Name", "Email", "Phone", "License No", "Age", "EmpID"]
-        entries = {}
-
-        for label in labels:
-            ctk.CTkLabel(popup, text=label).pack(pady=3)
-            entries[label] = ctk.CTkEntry(popup, width=300)
-            entries[label].pack(pady=3)
-
-        def submit_customer():
-            try:
-                data = (
-                    entries["Customer ID"].get().strip(),
-                    entries["Name"].get().strip(),
-                    entries["Email"].get().strip(),
-                    entries["Phone"].get().strip(),
-                    entries["License No"].get().strip(),
-                    int(entries["Age"].get()),
-                    entries["EmpID"].get().strip(),
-                )
-
-                if not all([data[0], data[1], data[2], data[3], data[4], data[6]]):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: All fields are required!\n")
-                    return
-
-                query = """
-                INSERT INTO customers (Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID)
-                VALUES (%s, %s, %s, %s, %s, %s, CURDATE(), %s)
-                """
-
-                result = run_query(query, data)
-
-                if result is True:
-                    popup.destroy()
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"✓ Successfully added customer: {data[1]} (ID: {data[0]})\n")
-                elif isinstance(result, str):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"MySQL Error:\n{result}\n")
-                else:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: Failed to add customer.\n")
-
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Age must be a valid number!\n")
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-
-        ctk.CTkButton(popup, text="Submit", command=submit_customer).pack(pady=15)
-            
-    def add_vehicle(self):
-        popup = ctk.CTkToplevel(self)
-        popup.title("Register New Vehicle")
-        popup.geometry("400x550")
-
-        labels = ["Reg_No", "Make", "Model", "Year", "Chassis_No", "Body_type", "CustomerID", "EmpID"]
-        entries = {}
-
-        for label in labels:
-            ctk.CTkLabel(popup, text=label).pack(pady=3)
-            entries[label] = ctk.CTkEntry(popup, width=300)
-            entries[label].pack(pady=3)
-
-        def submit_vehicle():
-            try:
-                data = (
-                    entries["Reg_No"].get().strip(),
-                    entries["Make"].get().strip(),
-                    entries["Model"].get().strip(),
-                    int(entries["Year"].get()),
-                    entries["Chassis_No"].get().strip(),
-                    entries["Body_type"].get().strip(),
-                    entries["CustomerID"].get().strip(),
-                    entries["EmpID"].get().strip(),
-                )
-
-                if not all([data[0], data[1], data[2], data[4], data[5], data[6], data[7]]):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: All fields are required!\n")
-                    return
-
-                query = """
-                INSERT INTO vehicle (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """
-
-                result = run_query(query, data)
-
-                if result is True:
-                    popup.destroy()
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"✓ Vehicle {data[0]} successfully registered for Customer {data[6]}!\n")
-                elif isinstance(result, str):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"MySQL Error:\n{result}\n")
-                else:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: Failed to register vehicle.\n")
-
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Year must be a valid number!\n")
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-
-        ctk.CTkButton(popup, text="Submit", command=submit_vehicle).pack(pady=15)
-
-    def create_service_job(self):
-        popup = ctk.CTkToplevel(self)
-        popup.title("Create Service Job")
-        popup.geometry("450x600")
-
-        labels = ["Service ID", "Vehicle Reg_No", "Service Type", "Description", 
-                  "Start Date (YYYY-MM-DD)", "Predicted End Date (YYYY-MM-DD)", 
-                  "Predicted Cost", "EmpID"]
-        entries = {}
-
-        for label in labels:
-            ctk.CTkLabel(popup, text=label).pack(pady=3)
-            entries[label] = ctk.CTkEntry(popup, width=350)
-            entries[label].pack(pady=3)
-
-        def submit_job():
-            try:
-                data = (
-                    int(entries["Service ID"].get().strip()),
-                    entries["Start Date (YYYY-MM-DD)"].get().strip(),
-                    entries["Vehicle Reg_No"].get().strip(),
-                    entries["Service Type"].get().strip(),
-                    entries["Description"].get().strip(),
-                    entries["Predicted End Date (YYYY-MM-DD)"].get().strip(),
-                    int(entries["Predicted Cost"].get()),
-                    entries["EmpID"].get().strip(),
-                )
-
-                if not all([data[1], data[2], data[4], data[5], data[7]]):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: All fields are required!\n")
-                    return
-
-                query = """
-                INSERT INTO Service_Job (Service_ID, Start_Date, Reg_No, Service_type, 
-                                    Description, Predicted_End_date, Predicted_Cost, EmpID)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """
-
-                result = run_query(query, data)
-
-                if result is True:
-                    popup.destroy()
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"✓ Service job {data[0]} created successfully for vehicle {data[2]}!\n")
-                    self.output.insert("end", f"  Type: {data[3]} | Predicted Cost: ${data[6]}\n")
-                elif isinstance(result, str):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"MySQL Error:\n{result}\n")
-                else:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: Failed to create service job.\n")
-
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Service ID and Predicted Cost must be valid numbers!\n")
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-
-        ctk.CTkButton(popup, text="Create Job", command=submit_job).pack(pady=15)
-
-    def assign_technician(self):
-        popup = ctk.CTkToplevel(self)
-        popup.title("Assign Technician to Service Job")
-        popup.geometry("450x400")
-
-        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
-        service_entry = ctk.CTkEntry(popup, width=300)
-        service_entry.pack(pady=5)
-
-        ctk.CTkLabel(popup, text="Available Technicians:", font=("", 14, "bold")).pack(pady=10)
-
-        # Show available technicians
-        tech_list = ctk.CTkTextbox(popup, width=400, height=150)
-        tech_list.pack(pady=5)
-
-        query = "SELECT technician_ID, Fname, Name, Specialization, YOE FROM service_technician"
-        techs = run_query(query, fetch=True)
-        
-        if techs:
-            for t in techs:
-                tech_list.insert("end", f"ID: {t['technician_ID']} | {t['Fname']} {t['Name']} - {t['Specialization']} ({t['YOE']} yrs)\n")
-        else:
-            tech_list.insert("end", "No technicians available.\n")
-
-        ctk.CTkLabel(popup, text="Technician ID to Assign:").pack(pady=5)
-        tech_entry = ctk.CTkEntry(popup, width=300)
-        tech_entry.pack(pady=5)
-
-        def submit_assignment():
-            try:
-                job_id = service_entry.get().strip()
-                tech_id = tech_entry.get().strip()
-
-                if not job_id or not tech_id:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: Both Service ID and Technician ID are required!\n")
-                    return
-
-                query = """
-                INSERT INTO Done_By (JobID, TechID)
-                VALUES (%s, %s)
-                """
-
-                result = run_query(query, (int(job_id), tech_id))
-
-                if result is True:
-                    popup.destroy()
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"✓ Technician {tech_id} assigned to Service Job {job_id} successfully!\n")
-                elif isinstance(result, str):
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", f"MySQL Error:\n{result}\n")
-                else:
-                    self.output.delete("1.0", "end")
-                    self.output.insert("end", "Error: Failed to assign technician.\n")
-
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Service ID must be a valid number!\n")
-            except Exception as e:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", f"Error: {str(e)}\n")
-
+import customtkinter as ctk
+from DB_connecrtors import transaction
+from query_registry import run_named, sql
+from async_ui import AsyncViewMixin
+from paged_view import PagedListMixin
+from export_view import ExportMixin
+from data_table import DataTable
+from typeahead import suggest, refresh_hot_keys
+from events import (
+    publish, CustomerAdded, VehicleAdded, JobCreated, TechnicianAssigned, ComplaintAdded,
+    TechnicianAdded, TechnicianDeleted
+)
+from datetime import datetime
+
+# Pause in typing before suggestions are looked up
+TYPEAHEAD_DEBOUNCE_MS = 150
+
+PICKLIST_COLUMNS = [
+    ("technician_ID", "ID", 100),
+    ("Fname", "First Name", 100),
+    ("Name", "Last Name", 100),
+    ("Specialization", "Specialization", 120),
+    ("YOE", "Yrs", 50),
+]
+
+def _insert_assignment(tx, job_id, tech_id):
+    """Write the Done_By row and the assigns audit row for one technician"""
+    tx.execute(sql("assign_done_by"), (job_id, tech_id))
+    tx.execute(sql("assign_audit"), (tech_id, job_id))
+
+def create_job_with_assignment(job, tech_id=None, complaint=None):
+    """
+    Create a service job and its related rows in one transaction
+    job: tuple (Service_ID, Start_Date, Reg_No, Service_type, Description,
+                Predicted_End_date, Predicted_Cost, EmpID)
+    tech_id / complaint: optional technician to assign and initial complaint
+    Returns True if successful, error string otherwise (nothing is saved)
+    """
+    job_id, reg_no = job[0], job[2]
+    try:
+        with transaction() as tx:
+            tx.execute(sql("create_service_job"), job)
+            tx.execute(sql("add_job_need"), (reg_no, job_id))
+
+            if tech_id:
+                _insert_assignment(tx, job_id, tech_id)
+            if complaint:
+                tx.execute(sql("add_complaint_for_job"), (job_id, complaint))
+    except Exception as e:
+        print(f"Error creating service job: {e}")
+        return str(e)
+
+    publish(JobCreated(job_id, reg_no, tech_id or None))
+    if complaint:
+        publish(ComplaintAdded(job_id, complaint))
+    return True
+
+def add_customer(data):
+    """
+    Register a customer
+    data: tuple (Customer_ID, Name, email_ID, Phone_no, license_No, Age, empID)
+    Returns True if successful, error string otherwise
+    """
+    result = run_named("add_customer", data)
+    if result is True:
+        publish(CustomerAdded({"Customer_ID": data[0], "Name": data[1], "email_ID": data[2], "Phone_no": data[3]}))
+    return result
+
+def add_vehicle(data):
+    """
+    Register a vehicle
+    data: tuple (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID)
+    Returns True if successful, error string otherwise
+    """
+    result = run_named("add_vehicle", data)
+    if result is True:
+        columns = ("Reg_No", "Make", "Model", "Year", "Chassis_No", "Body_type", "CustomerID")
+        publish(VehicleAdded(dict(zip(columns, data))))
+    return result
+
+def get_technician_picklist():
+    """
+    Technicians offered in the assign popup
+    Served from the result cache; adding/removing a technician invalidates it
+    """
+    return run_named("technician_picklist", fetch=True, cache=True)
+
+def assign_technician_to_job(job_id, tech_id):
+    """
+    Assign a technician to an existing job (Done_By + assigns, one transaction)
+    Returns True if successful, error string otherwise
+    """
+    try:
+        with transaction() as tx:
+            _insert_assignment(tx, job_id, tech_id)
+    except Exception as e:
+        print(f"Error assigning technician: {e}")
+        return str(e)
+
+    publish(TechnicianAssigned(job_id, tech_id))
+    return True
+
+class CustomerRepView(PagedListMixin, ExportMixin, AsyncViewMixin, ctk.CTkFrame):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.pack(fill="both", expand=True)
+        self.init_async()
+        self.init_paging()
+        self._typeahead_after = None
+        # Last picked suggestion per kind, used to prefill the popups
+        self.picked = {}
+        self.build_ui()
+        self.run_async("typeahead_load", refresh_hot_keys, busy_text="Loading search index...")
+
+        # Keep a technician / customer page on screen in step with writes from any tab
+        self.subscribe_event(TechnicianAdded, lambda e: self.patch_page(
+            ("technicians",), "technician_ID", e.row["technician_ID"], e.row))
+        self.subscribe_event(TechnicianDeleted, lambda e: self.patch_page(
+            ("technicians",), "technician_ID", e.tech_id))
+        self.subscribe_event(CustomerAdded, lambda e: self.patch_page(
+            ("customers",), "Customer_ID", e.row["Customer_ID"], e.row))
+
+    def build_ui(self):
+        self.title = ctk.CTkLabel(self, text="Customer Representative Dashboard", font=("", 18))
+        self.title.pack(pady=10)
+
+        # First row of buttons
+        btns1 = ctk.CTkFrame(self)
+        btns1.pack(pady=5)
+        
+        ctk.CTkButton(btns1, text="Register New Customer", command=self.add_customer).grid(row=0, column=0, padx=5)
+        ctk.CTkButton(btns1, text="Register Vehicle", command=self.add_vehicle).grid(row=0, column=1, padx=5)
+        ctk.CTkButton(btns1, text="View Technicians", command=self.show_techs).grid(row=0, column=2, padx=5)
+        ctk.CTkButton(btns1, text="View Customers", command=self.show_customers).grid(row=0, column=3, padx=5)
+
+        # Second row of buttons
+        btns2 = ctk.CTkFrame(self)
+        btns2.pack(pady=5)
+        
+        ctk.CTkButton(btns2, text="Create Service Job", command=self.create_service_job).grid(row=0, column=0, padx=5)
+        ctk.CTkButton(btns2, text="Assign Technician", command=self.assign_technician).grid(row=0, column=1, padx=5)
+
+        # Typeahead search
+        find_frame = ctk.CTkFrame(self)
+        find_frame.pack(pady=5)
+        ctk.CTkLabel(find_frame, text="Find:").grid(row=0, column=0, padx=5)
+        self.find_entry = ctk.CTkEntry(
+            find_frame, width=450,
+            placeholder_text="Customer name / phone / email / ID, Reg_No or technician name"
+        )
+        self.find_entry.grid(row=0, column=1, padx=5)
+        self.find_entry.bind("<KeyRelease>", self._schedule_typeahead)
+        self.suggestion_frame = ctk.CTkFrame(find_frame, fg_color="transparent")
+        self.suggestion_frame.grid(row=1, column=1, sticky="we")
+
+        self.build_busy_bar(self).pack(pady=2)
+        self.build_pager_bar(self).pack(pady=2)
+
+        # Messages above, result rows in the table below
+        self.output = ctk.CTkTextbox(self, width=800, height=80)
+        self.output.pack(pady=(10, 5))
+
+        self.table = DataTable(self, actions=[("Use Selected", self._use_selected)],
+                               tools=[("Export...", self.export_current)], height=260)
+        self.table.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+    def _schedule_typeahead(self, _event=None):
+        """Restart the debounce timer on every keystroke"""
+        if self._typeahead_after is not None:
+            self.after_cancel(self._typeahead_after)
+        self._typeahead_after = self.after(TYPEAHEAD_DEBOUNCE_MS, self._run_typeahead)
+
+    def _run_typeahead(self):
+        self._typeahead_after = None
+        text = self.find_entry.get()
+        self.run_async("typeahead", suggest, text,
+                       on_done=self._show_suggestions, busy_text="Searching...")
+
+    def _show_suggestions(self, suggestions):
+        """Replace the suggestion buttons"""
+        for widget in self.suggestion_frame.winfo_children():
+            widget.destroy()
+        if isinstance(suggestions, str):
+            ctk.CTkLabel(self.suggestion_frame, text=f"Search failed: {suggestions}").pack(anchor="w")
+            return
+        for s in suggestions:
+            ctk.CTkButton(
+                self.suggestion_frame, text=f"[{s['kind'].title()}] {s['label']}", anchor="w",
+                fg_color="transparent", text_color=("gray10", "gray90"), height=24,
+                command=lambda s=s: self._pick_suggestion(s)
+            ).pack(fill="x")
+
+    def _pick_suggestion(self, suggestion):
+        """Remember the picked record for the popups and show it"""
+        self.picked[suggestion["kind"]] = suggestion["id"]
+        self._show_suggestions([])
+        self.output.delete("1.0", "end")
+        self.output.insert("end", f"Selected {suggestion['kind']}: {suggestion['label']}\n")
+        self.output.insert("end", "Its ID is filled in when you open Register Vehicle, "
+                                  "Create Service Job or Assign Technician.\n")
+
+    def _prefill(self, entry, kind):
+        """Put the last picked ID of a kind into an entry"""
+        if self.picked.get(kind):
+            entry.insert(0, self.picked[kind])
+
+    def _use_selected(self, row):
+        """Remember the selected technician / customer for the popups, like a picked suggestion"""
+        if "technician_ID" in row:
+            kind, entity_id, label = "technician", row["technician_ID"], f"{row['Fname']} {row['Name']}"
+        else:
+            kind, entity_id, label = "customer", row["Customer_ID"], row["Name"]
+        self._pick_suggestion({"kind": kind, "id": entity_id, "label": f"{label} ({entity_id})"})
+
+    def show_techs(self):
+        self.open_listing("technicians", "SERVICE TECHNICIANS")
+
+    def show_customers(self):
+        self.open_listing("customers", "REGISTERED CUSTOMERS")
+
+    def add_customer(self):
+        popup = ctk.CTkToplevel(self)
+        popup.title("Register New Customer")
+        popup.geometry("400x450")
+
+        labels = ["Customer ID", "Name", "Email", "Phone", "License No", "Age", "EmpID"]
+        entries = {}
+
+        for label in labels:
+            ctk.CTkLabel(popup, text=label).pack(pady=3)
+            entries[label] = ctk.CTkEntry(popup, width=300)
+            entries[label].pack(pady=3)
+
+        def submit_customer():
+            try:
+                data = (
+                    entries["Customer ID"].get().strip(),
+                    entries["Name"].get().strip(),
+                    entries["Email"].get().strip(),
+                    entries["Phone"].get().strip(),
+                    entries["License No"].get().strip(),
+                    int(entries["Age"].get()),
+                    entries["EmpID"].get().strip(),
+                )
+
+                if not all([data[0], data[1], data[2], data[3], data[4], data[6]]):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: All fields are required!\n")
+                    return
+
+                self.run_async("add_customer", add_customer, data,
+                               on_done=lambda result: customer_done(data, result),
+                               busy_text="Saving customer...")
+
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Age must be a valid number!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        def customer_done(data, result):
+            try:
+                if result is True:
+                    popup.destroy()
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"✓ Successfully added customer: {data[1]} (ID: {data[0]})\n")
+                elif isinstance(result, str):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"MySQL Error:\n{result}\n")
+                else:
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: Failed to add customer.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Submit", command=submit_customer).pack(pady=15)
+            
+    def add_vehicle(self):
+        popup = ctk.CTkToplevel(self)
+        popup.title("Register New Vehicle")
+        popup.geometry("400x550")
+
+        labels = ["Reg_No", "Make", "Model", "Year", "Chassis_No", "Body_type", "CustomerID", "EmpID"]
+        entries = {}
+
+        for label in labels:
+            ctk.CTkLabel(popup, text=label).pack(pady=3)
+            entries[label] = ctk.CTkEntry(popup, width=300)
+            entries[label].pack(pady=3)
+        self._prefill(entries["CustomerID"], "customer")
+
+        def submit_vehicle():
+            try:
+                data = (
+                    entries["Reg_No"].get().strip(),
+                    entries["Make"].get().strip(),
+                    entries["Model"].get().strip(),
+                    int(entries["Year"].get()),
+                    entries["Chassis_No"].get().strip(),
+                    entries["Body_type"].get().strip(),
+                    entries["CustomerID"].get().strip(),
+                    entries["EmpID"].get().strip(),
+                )
+
+                if not all([data[0], data[1], data[2], data[4], data[5], data[6], data[7]]):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: All fields are required!\n")
+                    return
+
+                self.run_async("add_vehicle", add_vehicle, data,
+                               on_done=lambda result: vehicle_done(data, result),
+                               busy_text="Saving vehicle...")
+
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Year must be a valid number!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        def vehicle_done(data, result):
+            try:
+                if result is True:
+                    popup.destroy()
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"✓ Vehicle {data[0]} successfully registered for Customer {data[6]}!\n")
+                elif isinstance(result, str):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"MySQL Error:\n{result}\n")
+                else:
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: Failed to register vehicle.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Submit", command=submit_vehicle).pack(pady=15)
+
+    def create_service_job(self):
+        popup = ctk.CTkToplevel(self)
+        popup.title("Create Service Job")
+        popup.geometry("450x750")
+
+        labels = ["Service ID", "Vehicle Reg_No", "Service Type", "Description", 
+                  "Start Date (YYYY-MM-DD)", "Predicted End Date (YYYY-MM-DD)", 
+                  "Predicted Cost", "EmpID",
+                  "Assign Technician ID (optional)", "Initial Complaint (optional)"]
+        entries = {}
+
+        for label in labels:
+            ctk.CTkLabel(popup, text=label).pack(pady=3)
+            entries[label] = ctk.CTkEntry(popup, width=350)
+            entries[label].pack(pady=3)
+        self._prefill(entries["Vehicle Reg_No"], "vehicle")
+        self._prefill(entries["Assign Technician ID (optional)"], "technician")
+
+        def submit_job():
+            try:
+                data = (
+                    int(entries["Service ID"].get().strip()),
+                    entries["Start Date (YYYY-MM-DD)"].get().strip(),
+                    entries["Vehicle Reg_No"].get().strip(),
+                    entries["Service Type"].get().strip(),
+                    entries["Description"].get().strip(),
+                    entries["Predicted End Date (YYYY-MM-DD)"].get().strip(),
+                    int(entries["Predicted Cost"].get()),
+                    entries["EmpID"].get().strip(),
+                )
+                tech_id = entries["Assign Technician ID (optional)"].get().strip()
+                complaint = entries["Initial Complaint (optional)"].get().strip()
+
+                if not all([data[1], data[2], data[4], data[5], data[7]]):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: All fields are required!\n")
+                    return
+
+                self.run_async("create_job", create_job_with_assignment, data, tech_id, complaint,
+                               on_done=lambda result: job_done(data, tech_id, result),
+                               busy_text="Creating job...")
+
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Service ID and Predicted Cost must be valid numbers!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        def job_done(data, tech_id, result):
+            try:
+                if result is True:
+                    popup.destroy()
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"✓ Service job {data[0]} created successfully for vehicle {data[2]}!\n")
+                    self.output.insert("end", f"  Type: {data[3]} | Predicted Cost: ${data[6]}\n")
+                    if tech_id:
+                        self.output.insert("end", f"  Assigned to Technician {tech_id}\n")
+                elif isinstance(result, str):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"MySQL Error:\n{result}\n")
+                else:
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: Failed to create service job.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        ctk.CTkButton(popup, text="Create Job", command=submit_job).pack(pady=15)
+
+    def assign_technician(self):
+        popup = ctk.CTkToplevel(self)
+        popup.title("Assign Technician to Service Job")
+        popup.geometry("520x480")
+
+        ctk.CTkLabel(popup, text="Service ID:").pack(pady=5)
+        service_entry = ctk.CTkEntry(popup, width=300)
+        service_entry.pack(pady=5)
+
+        ctk.CTkLabel(popup, text="Available Technicians:", font=("", 14, "bold")).pack(pady=10)
+
+        # Show available technicians; picking one fills in the ID below
+        tech_list = DataTable(popup, PICKLIST_COLUMNS, actions=[("Pick", lambda row: pick_tech(row))], height=150)
+        tech_list.pack(fill="both", expand=True, padx=10, pady=5)
+        tech_list.show_message("Loading technicians...")
+        # technician_ID -> picklist row; None until loaded
+        techs = {"rows": None}
+
+        def fill_tech_list(rows):
+            if not tech_list.winfo_exists():
+                return
+            if isinstance(rows, str):
+                tech_list.show_message(f"Error loading technicians: {rows}")
+                return
+            techs["rows"] = {t["technician_ID"]: t for t in rows or []}
+            tech_list.set_rows(list(techs["rows"].values()), message="No technicians available.")
+
+        def tech_changed(tech_id, row=None):
+            # Patch the open list; a manager's add or delete shows up without a re-query
+            if techs["rows"] is None or not tech_list.winfo_exists():
+                return
+            techs["rows"].pop(tech_id, None)
+            if row is not None:
+                techs["rows"][tech_id] = row
+            tech_list.set_rows(list(techs["rows"].values()), message="No technicians available.", keep_view=True)
+
+        self.run_async("assign_list", get_technician_picklist,
+                       on_done=fill_tech_list, busy_text="Loading technicians...")
+        tokens = [
+            self.subscribe_event(TechnicianAdded, lambda e: tech_changed(e.row["technician_ID"], e.row)),
+            self.subscribe_event(TechnicianDeleted, lambda e: tech_changed(e.tech_id)),
+        ]
+
+        def popup_closed(event):
+            if event.widget is popup:
+                for token in tokens:
+                    self.unsubscribe_event(token)
+
+        popup.bind("<Destroy>", popup_closed)
+
+        ctk.CTkLabel(popup, text="Technician ID to Assign:").pack(pady=5)
+        tech_entry = ctk.CTkEntry(popup, width=300)
+        tech_entry.pack(pady=5)
+        self._prefill(tech_entry, "technician")
+
+        def pick_tech(row):
+            tech_entry.delete(0, "end")
+            tech_entry.insert(0, row["technician_ID"])
+
+        def submit_assignment():
+            try:
+                job_id = service_entry.get().strip()
+                tech_id = tech_entry.get().strip()
+
+                if not job_id or not tech_id:
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: Both Service ID and Technician ID are required!\n")
+                    return
+
+                self.run_async("assign_tech", assign_technician_to_job, int(job_id), tech_id,
+                               on_done=lambda result: assignment_done(job_id, tech_id, result),
+                               busy_text="Assigning technician...")
+
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Service ID must be a valid number!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
+        def assignment_done(job_id, tech_id, result):
+            try:
+                if result is True:
+                    popup.destroy()
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"✓ Technician {tech_id} assigned to Service Job {job_id} successfully!\n")
+                elif isinstance(result, str):
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", f"MySQL Error:\n{result}\n")
+                else:
+                    self.output.delete("1.0", "end")
+                    self.output.insert("end", "Error: Failed to assign technician.\n")
+
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
+
         ctk.CTkButton(popup, text="Assign", command=submit_assignment).pack(pady=15)
\ No newline at end of file
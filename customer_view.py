@@ -1,13 +1,53 @@
 import customtkinter as ctk
-from DB_connecrtors import run_query
-
-class CustomerView(ctk.CTkFrame):
+from query_registry import run_named, sql
+from async_ui import AsyncViewMixin
+from export_view import ExportMixin
+from DB_connecrtors import stream_query
+from delta_sync import JobListSync
+from customer_rep_view import add_vehicle
+from events import VehicleAdded, JOB_EVENTS
+from data_table import DataTable
+
+VEHICLE_COLUMNS = [
+    ("Reg_No", "Registration", 120),
+    ("Make", "Make", 120),
+    ("Model", "Model", 120),
+    ("Year", "Year", 70),
+    ("Body_type", "Body Type", 110),
+    ("Chassis_No", "Chassis No", 160),
+]
+
+SERVICE_COLUMNS = [
+    ("Service_ID", "Job ID", 80),
+    ("Reg_No", "Vehicle", 110),
+    ("Make", "Make", 100),
+    ("Model", "Model", 100),
+    ("Description", "Description", 220),
+    ("Start_date", "Start Date", 100),
+    ("Predicted_End_Date", "Predicted End", 110),
+    ("Predicted_cost", "Predicted Cost (₹)", 130, ","),
+]
+
+# Query behind each kind of list the table shows (table.source is (kind, customer id))
+EXPORT_LISTS = {
+    "vehicles": "get_customer_vehicles",
+    "status": "get_customer_service_status",
+}
+
+class CustomerView(ExportMixin, AsyncViewMixin, ctk.CTkFrame):
     def __init__(self, parent):
         super().__init__(parent)
         self.pack(fill="both", expand=True)
         self.current_customer_id = None
+        self.status_sync = None
+        self.init_async()
         self.build_ui()
 
+        # Writes from any tab patch the list on screen
+        self.subscribe_event(VehicleAdded, self._vehicle_added)
+        for event_type in JOB_EVENTS:
+            self.subscribe_event(event_type, self._job_changed)
+
     def build_ui(self):
         # Title
         title = ctk.CTkLabel(self, text="Customer Dashboard", font=("", 18, "bold"))
@@ -32,9 +72,22 @@ class CustomerView(ctk.CTkFrame):
         ctk.CTkButton(btn_frame, text="Register My Vehicle", command=self.register_vehicle).grid(row=0, column=2, padx=5)
         ctk.CTkButton(btn_frame, text="View Service Status", command=self.view_service_status).grid(row=0, column=3, padx=5)
 
-        # Output Section
-        self.output = ctk.CTkTextbox(self, width=800, height=400)
-        self.output.pack(pady=20)
+        self.build_busy_bar(self).pack(pady=2)
+
+        # Output Section - messages above, result rows in the table below
+        self.output = ctk.CTkTextbox(self, width=800, height=110)
+        self.output.pack(pady=(10, 5))
+
+        self.table = DataTable(self, tools=[("Export...", self.export_current)], height=280)
+        self.table.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+
+    def export_source(self):
+        """Export the vehicle list / service records on screen, read again from the server"""
+        if self.table.source is None:
+            return None
+        kind, cust_id = self.table.source
+        return f"{kind}-{cust_id}", lambda columns: stream_query(
+            sql(EXPORT_LISTS[kind]), (cust_id,), columns=columns)
 
     def login_customer(self):
         """Verify customer exists and store ID"""
@@ -45,10 +98,15 @@ class CustomerView(ctk.CTkFrame):
             self.output.insert("end", "Error: Please enter a Customer ID!\n")
             return
 
-        query = "SELECT Customer_ID, Name, email_ID FROM customers WHERE Customer_ID = %s"
+        self.run_async(
+            "login", run_named, "customer_login", (cust_id,), True,
+            on_done=lambda result: self._show_login(cust_id, result),
+            busy_text="Logging in..."
+        )
+
+    def _show_login(self, cust_id, result):
+        """Render the login lookup result"""
         try:
-            result = run_query(query, (cust_id,), fetch=True)
-            
             if result and len(result) > 0:
                 self.current_customer_id = cust_id
                 self.output.delete("1.0", "end")
@@ -73,24 +131,34 @@ class CustomerView(ctk.CTkFrame):
             self.output.insert("end", "Error: Please enter your Customer ID!\n")
             return
 
-        query = "SELECT Reg_No, Make, Model, Year, Body_type, Chassis_No FROM vehicle WHERE CustomerID=%s"
-        try:
-            results = run_query(query, (cust_id,), fetch=True)
-            self.output.delete("1.0", "end")
-
-            if not results:
-                self.output.insert("end", "No vehicles registered under this Customer ID.\n")
-                return
+        self.run_async(
+            "list", run_named, "get_customer_vehicles", (cust_id,), True,
+            on_done=lambda results: self._show_vehicle_list(cust_id, results),
+            busy_text="Loading vehicles..."
+        )
 
-            self.output.insert("end", f"=== YOUR REGISTERED VEHICLES ===\n\n")
-            for v in results:
-                self.output.insert("end", f"Registration: {v['Reg_No']}\n")
-                self.output.insert("end", f"  Make/Model: {v['Make']} {v['Model']} ({v['Year']})\n")
-                self.output.insert("end", f"  Body Type: {v['Body_type']}\n")
-                self.output.insert("end", f"  Chassis No: {v['Chassis_No']}\n\n")
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error: {str(e)}\n")
+    def _show_vehicle_list(self, cust_id, results, keep_view=False):
+        """Show the customer's vehicles in the table"""
+        if isinstance(results, str):
+            self.show_error(results)
+            return
+        self.table.set_rows(
+            list(results or []), title="YOUR REGISTERED VEHICLES", source=("vehicles", cust_id),
+            columns=VEHICLE_COLUMNS, message="No vehicles registered under this Customer ID.",
+            keep_view=keep_view
+        )
+
+    def _vehicle_added(self, event):
+        """Add a newly registered vehicle to the list on screen"""
+        cust_id = event.row["CustomerID"]
+        if self.table.source == ("vehicles", cust_id):
+            self._show_vehicle_list(cust_id, self.table.rows + [event.row], keep_view=True)
+
+    def _job_changed(self, _event):
+        """A job changed somewhere - bring the service records on screen up to date"""
+        if self.status_sync is not None and self.table.source == ("status", self.status_sync.owner_id):
+            # Only the changed jobs are read, and only if they are this customer's
+            self.view_service_status(self.status_sync.owner_id)
 
     def register_self(self):
         """Allow customer to register their own details"""
@@ -127,13 +195,21 @@ class CustomerView(ctk.CTkFrame):
                     return
 
                 # Note: empID is set to NULL since customer is self-registering
-                query = """
-                INSERT INTO customers (Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID)
-                VALUES (%s, %s, %s, %s, %s, %s, CURDATE(), NULL)
-                """
+                self.run_async(
+                    "register", run_named, "register_customer_self", data,
+                    on_done=lambda result: registration_done(data, result),
+                    busy_text="Registering..."
+                )
 
-                result = run_query(query, data)
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Age must be a valid number!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
 
+        def registration_done(data, result):
+            try:
                 if result is True:
                     popup.destroy()
                     self.cust_entry.delete(0, "end")
@@ -150,9 +226,6 @@ class CustomerView(ctk.CTkFrame):
                     self.output.delete("1.0", "end")
                     self.output.insert("end", "Error: Failed to register. Please try again.\n")
 
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Age must be a valid number!\n")
             except Exception as e:
                 self.output.delete("1.0", "end")
                 self.output.insert("end", f"Error: {str(e)}\n")
@@ -198,13 +271,21 @@ class CustomerView(ctk.CTkFrame):
                     self.output.insert("end", "Error: All fields are required!\n")
                     return
 
-                query = """
-                INSERT INTO vehicle (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """
+                self.run_async(
+                    "register_vehicle", add_vehicle, data,
+                    on_done=lambda result: vehicle_done(data, result),
+                    busy_text="Registering vehicle..."
+                )
 
-                result = run_query(query, data)
+            except ValueError:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", "Error: Year must be a valid number!\n")
+            except Exception as e:
+                self.output.delete("1.0", "end")
+                self.output.insert("end", f"Error: {str(e)}\n")
 
+        def vehicle_done(data, result):
+            try:
                 if result is True:
                     popup.destroy()
                     self.output.delete("1.0", "end")
@@ -218,59 +299,38 @@ class CustomerView(ctk.CTkFrame):
                     self.output.delete("1.0", "end")
                     self.output.insert("end", "Error: Failed to register vehicle.\n")
 
-            except ValueError:
-                self.output.delete("1.0", "end")
-                self.output.insert("end", "Error: Year must be a valid number!\n")
             except Exception as e:
                 self.output.delete("1.0", "end")
                 self.output.insert("end", f"Error: {str(e)}\n")
 
         ctk.CTkButton(popup, text="Register Vehicle", command=submit_vehicle).pack(pady=20)
 
-    def view_service_status(self):
+    def view_service_status(self, cust_id=None):
         """View service details for customer's vehicles"""
-        cust_id = self.cust_entry.get().strip()
+        cust_id = cust_id or self.cust_entry.get().strip()
         
         if not cust_id:
             self.output.delete("1.0", "end")
             self.output.insert("end", "Error: Please enter your Customer ID!\n")
             return
 
-        query = """
-        SELECT 
-            sj.Service_ID,
-            sj.Reg_No,
-            v.Make,
-            v.Model,
-            sj.Description,
-            sj.Start_date,
-            sj.Predicted_End_Date,
-            sj.Predicted_cost
-        FROM Service_Job sj
-        JOIN vehicle v ON sj.Reg_No = v.Reg_No
-        WHERE v.CustomerID = %s
-        ORDER BY sj.Start_date DESC
-        """
-
-        try:
-            results = run_query(query, (cust_id,), fetch=True)
-            self.output.delete("1.0", "end")
+        # Later clicks for the same customer fetch only the jobs changed since
+        if self.status_sync is None or self.status_sync.owner_id != cust_id:
+            self.status_sync = JobListSync("get_customer_service_status", cust_id)
 
-            if not results:
-                self.output.insert("end", "No service records found for your vehicles.\n")
-                return
+        self.run_async(
+            "list", self.status_sync.refresh,
+            on_done=lambda results: self._show_service_records(cust_id, results),
+            busy_text="Loading service records..."
+        )
 
-            self.output.insert("end", f"=== YOUR SERVICE RECORDS ===\n\n")
-
-            for service in results:
-                self.output.insert("end", f"Job ID: {service['Service_ID']}\n")
-                self.output.insert("end", f"Vehicle: {service['Make']} {service['Model']} ({service['Reg_No']})\n")
-                self.output.insert("end", f"Description: {service['Description']}\n")
-                self.output.insert("end", f"Start Date: {service['Start_date']}\n")
-                self.output.insert("end", f"Predicted End Date: {service['Predicted_End_Date']}\n")
-                self.output.insert("end", f"Predicted Cost: ₹{service['Predicted_cost']}\n")
-
-              
-        except Exception as e:
-            self.output.delete("1.0", "end")
-            self.output.insert("end", f"Error: {str(e)}\n")
\ No newline at end of file
+    def _show_service_records(self, cust_id, results):
+        """Show the customer's service history in the table"""
+        if isinstance(results, str):
+            self.show_error(results)
+            return
+        self.table.set_rows(
+            results, title="YOUR SERVICE RECORDS", source=("status", cust_id),
+            columns=SERVICE_COLUMNS, message="No service records found for your vehicles.",
+            keep_view=self.table.source == ("status", cust_id)
+        )
@@ -0,0 +1,419 @@
+"""
+data_table.py - Virtualized table for large result sets in the dashboards.
+
+Only the rows in view are drawn: the canvas gets one text item per visible
+cell and scrolling redraws those few instead of creating widgets, so 50k
+rows cost the same to show as 50. Rows come from a list (set_rows), a
+keyset-paginated listing (set_rows per page, see PagedListMixin) or a stream
+(append_rows per batch, then finish_append, see AsyncViewMixin.run_stream). Sorting, filtering
+and selection work on the rows held, in memory; actions such as "Open Job"
+receive the selected row.
+
+    table = DataTable(parent, [("Service_ID", "Job", 70), ("Reg_No", "Vehicle", 110)],
+                      actions=[("Open Job", lambda row: open_job(row["Service_ID"]))])
+    table.set_rows(rows, title="MY JOBS")
+"""
+
+import tkinter as tk
+import tkinter.font as tkfont
+
+import customtkinter as ctk
+
+ROW_HEIGHT = 22
+CELL_PADDING = 6
+# Pause in typing before the filter is applied
+FILTER_DEBOUNCE_MS = 150
+# Rows moved per mouse wheel notch
+WHEEL_ROWS = 3
+
+# (light, dark) colors, following the CTk appearance mode
+_COLORS = {
+    "background": ("gray95", "gray14"),
+    "header": ("gray82", "gray22"),
+    "stripe": ("gray90", "gray17"),
+    "selected": ("#3B8ED0", "#1F6AA5"),
+    "text": ("gray10", "#DCE4EE"),
+    "selected_text": ("white", "white"),
+    "message": ("gray40", "gray60"),
+}
+
+def _cell_text(value, spec=""):
+    if value is None:
+        return ""
+    if spec:
+        try:
+            return format(value, spec)
+        except (TypeError, ValueError):
+            pass
+    return str(value)
+
+def _column(column):
+    key, heading, width = column[:3]
+    return (key, heading, width, column[3] if len(column) > 3 else "")
+
+class DataTable(ctk.CTkFrame):
+    """
+    Scrollable, sortable, filterable table drawing only its visible rows
+
+    Args:
+        columns: [(row key, heading, width in pixels[, format spec such as ","])];
+                 set_columns() swaps them
+        actions: [(label, callback(row))] buttons, enabled while a row is selected
+        tools: [(label, callback())] buttons that are always enabled (e.g. "Export...")
+        on_activate: callback(row) for double-click / Return (default: first action)
+        height: Height of the row area in pixels
+    """
+
+    def __init__(self, parent, columns=(), actions=(), tools=(), on_activate=None, height=300, **kwargs):
+        super().__init__(parent, **kwargs)
+        self._columns = [_column(c) for c in columns]
+        self._rows = []
+        # Indices into _rows that pass the filter, in display order
+        self._view = []
+        # Streamed rows (append_rows) waiting to be merged into a sorted view
+        self._unsorted = []
+        self._sort = None
+        self._filter = ""
+        # Lower-cased text of each row for the filter, built on first use
+        self._search = None
+        self._selected = None
+        self._first = 0
+        self._filter_after = None
+        self._message = ""
+        self._actions = list(actions)
+        self.on_activate = on_activate or (self._actions[0][1] if self._actions else None)
+        # Tag of what the table shows (a pager, a list name...); views compare it
+        # before patching rows in place
+        self.source = None
+
+        self._font = tkfont.nametofont("TkDefaultFont")
+        self._char_width = max(self._font.measure("0"), 1)
+
+        toolbar = ctk.CTkFrame(self, fg_color="transparent")
+        toolbar.pack(fill="x", pady=(0, 2))
+        self.title_label = ctk.CTkLabel(toolbar, text="", font=("", 13, "bold"))
+        self.title_label.pack(side="left", padx=5)
+        self.count_label = ctk.CTkLabel(toolbar, text="", text_color="gray")
+        self.count_label.pack(side="right", padx=5)
+        self.filter_entry = ctk.CTkEntry(toolbar, width=200, placeholder_text="Filter rows...")
+        self.filter_entry.pack(side="right", padx=5)
+        self.filter_entry.bind("<KeyRelease>", self._schedule_filter)
+        self._action_buttons = []
+        for label, callback in reversed(self._actions):
+            button = ctk.CTkButton(toolbar, text=label, width=110, state="disabled",
+                                   command=lambda callback=callback: self._run_action(callback))
+            button.pack(side="right", padx=5)
+            self._action_buttons.append(button)
+        for label, callback in reversed(list(tools)):
+            ctk.CTkButton(toolbar, text=label, width=90, command=callback).pack(side="right", padx=5)
+
+        body = ctk.CTkFrame(self, fg_color="transparent")
+        body.pack(fill="both", expand=True)
+        body.grid_columnconfigure(0, weight=1)
+        body.grid_rowconfigure(1, weight=1)
+
+        self.header = tk.Canvas(body, height=ROW_HEIGHT, highlightthickness=0, cursor="hand2")
+        self.header.grid(row=0, column=0, sticky="we")
+        self.canvas = tk.Canvas(body, height=height, highlightthickness=0, takefocus=1)
+        self.canvas.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(body, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, rowspan=2, sticky="ns")
+
+        self.header.bind("<Button-1>", self._on_header_click)
+        self.canvas.bind("<Configure>", lambda _: self._redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Double-Button-1>", self._on_double_click)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda _: self.scroll_to(self._first - WHEEL_ROWS))
+        self.canvas.bind("<Button-5>", lambda _: self.scroll_to(self._first + WHEEL_ROWS))
+        self.canvas.bind("<Up>", lambda _: self._move_selection(-1))
+        self.canvas.bind("<Down>", lambda _: self._move_selection(1))
+        self.canvas.bind("<Prior>", lambda _: self._move_selection(-self._visible_rows()))
+        self.canvas.bind("<Next>", lambda _: self._move_selection(self._visible_rows()))
+        self.canvas.bind("<Return>", lambda _: self._activate())
+
+    # ---------- Rows ----------
+
+    @property
+    def rows(self):
+        """Every row held (unfiltered, in arrival order)"""
+        return self._rows
+
+    def set_columns(self, columns):
+        """Replace the columns (drops a sort on a column that is gone)"""
+        self._columns = [_column(c) for c in columns]
+        if self._sort and self._sort[0] not in {c[0] for c in self._columns}:
+            self._sort = None
+        self._search = None
+
+    def set_rows(self, rows, title=None, source=None, columns=None, message="No records found.", keep_view=False):
+        """
+        Show a new set of rows
+
+        Args:
+            rows: List of row dicts (held, not copied)
+            title: Heading above the table (None keeps the current one)
+            source: Tag of what is shown, see self.source
+            columns: New columns, if they change
+            message: Shown instead of rows when there are none
+            keep_view: Keep the scroll position, selection and sort (patching
+                       the rows already shown rather than showing others)
+        """
+        if columns is not None:
+            self.set_columns(columns)
+        if title is not None:
+            self.title_label.configure(text=title)
+        self.source = source
+        self._message = message
+        self._rows = rows
+        self._search = None
+        if not keep_view:
+            self._first = 0
+            self._selected = None
+            self._sort = None
+        elif self._selected is not None and not any(r is self._selected for r in rows):
+            self._selected = None
+        self._rebuild_view()
+
+    def append_rows(self, rows):
+        """
+        Add a batch of rows (a streamed listing) keeping sort and filter
+
+        Only the batch is filtered. While a sort is active the batch is held
+        back and merged into the view once by finish_append(), rather than
+        re-sorting everything loaded so far on every batch.
+        """
+        start = len(self._rows)
+        self._rows.extend(rows)
+        if self._search is not None:
+            self._search.extend(self._row_text(r) for r in rows)
+        added = self._filtered(range(start, len(self._rows)))
+        if self._sort is None:
+            self._view.extend(added)
+        else:
+            self._unsorted.extend(added)
+        self._redraw()
+
+    def finish_append(self, message=None):
+        """
+        End a stream of append_rows batches
+
+        Args:
+            message: New text for an empty table (None keeps the current one)
+        """
+        if message is not None:
+            self._message = message
+        if self._unsorted:
+            # The view is sorted already, so this sort is close to linear
+            self._view = self._sorted(self._view + self._unsorted)
+            self._unsorted = []
+        self._redraw()
+
+    def show_message(self, message, title=""):
+        """Clear the rows and show a line of text instead"""
+        self.set_rows([], title=title, message=message)
+
+    def selected_row(self):
+        """The selected row dict, or None"""
+        return self._selected
+
+    # ---------- Sort / filter ----------
+
+    def sort_by(self, key, descending=None):
+        """Sort the view by a column; by default a second sort on it reverses"""
+        if descending is None:
+            descending = bool(self._sort and self._sort == (key, False))
+        self._sort = (key, descending)
+        self._rebuild_view()
+
+    def set_filter(self, text):
+        """Show only rows containing text (case-insensitive, any column)"""
+        self._filter = (text or "").strip().lower()
+        self._first = 0
+        self._rebuild_view()
+
+    def _row_text(self, row):
+        return "\x00".join(_cell_text(row.get(key), spec) for key, _, _, spec in self._columns).lower()
+
+    def _filtered(self, indices):
+        """Row indices passing the filter"""
+        if not self._filter:
+            return list(indices)
+        if self._search is None:
+            self._search = [self._row_text(r) for r in self._rows]
+        search, text = self._search, self._filter
+        return [i for i in indices if text in search[i]]
+
+    def _sorted(self, view):
+        """Row indices in the current sort order"""
+        if self._sort is None:
+            return view
+        key, descending = self._sort
+        rows = self._rows
+        # Empty cells stay last in either direction
+        empty = [i for i in view if rows[i].get(key) is None]
+        view = [i for i in view if rows[i].get(key) is not None]
+        try:
+            view.sort(key=lambda i: rows[i][key], reverse=descending)
+        except TypeError:
+            # Mixed types in one column - compare as text
+            view.sort(key=lambda i: str(rows[i][key]), reverse=descending)
+        return view + empty
+
+    def _rebuild_view(self):
+        self._unsorted = []
+        self._view = self._sorted(self._filtered(range(len(self._rows))))
+        self._redraw()
+
+    def _schedule_filter(self, _event=None):
+        if self._filter_after is not None:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(FILTER_DEBOUNCE_MS, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_after = None
+        self.set_filter(self.filter_entry.get())
+
+    # ---------- Scrolling / selection ----------
+
+    def _visible_rows(self):
+        return max(self.canvas.winfo_height() // ROW_HEIGHT, 1)
+
+    def scroll_to(self, first):
+        """Make a view position the top visible row"""
+        first = max(0, min(first, len(self._view) - self._visible_rows()))
+        if first != self._first:
+            self._first = first
+            self._redraw()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self._view)))
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            self.scroll_to(self._first + int(args[1]) * step)
+
+    def _on_wheel(self, event):
+        self.scroll_to(self._first - WHEEL_ROWS * (1 if event.delta > 0 else -1))
+
+    def _view_position(self, row):
+        for position, i in enumerate(self._view):
+            if self._rows[i] is row:
+                return position
+        return None
+
+    def _select_position(self, position):
+        if not self._view:
+            return
+        position = max(0, min(position, len(self._view) - 1))
+        self._selected = self._rows[self._view[position]]
+        if position < self._first:
+            self._first = position
+        elif position >= self._first + self._visible_rows():
+            self._first = position - self._visible_rows() + 1
+        self._redraw()
+
+    def _move_selection(self, step):
+        position = self._view_position(self._selected) if self._selected is not None else None
+        self._select_position(0 if position is None else position + step)
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        position = self._first + event.y // ROW_HEIGHT
+        if position < len(self._view):
+            self._select_position(position)
+
+    def _on_double_click(self, event):
+        self._on_click(event)
+        self._activate()
+
+    def _activate(self):
+        if self._selected is not None and self.on_activate:
+            self.on_activate(self._selected)
+
+    def _run_action(self, callback):
+        if self._selected is not None:
+            callback(self._selected)
+
+    def _on_header_click(self, event):
+        x = 0
+        for key, _, width, _ in self._columns:
+            if x <= event.x < x + width:
+                self.sort_by(key)
+                return
+            x += width
+
+    # ---------- Drawing ----------
+
+    def _color(self, name):
+        light, dark = _COLORS[name]
+        return dark if ctk.get_appearance_mode() == "Dark" else light
+
+    def _fit(self, text, width):
+        limit = max((width - 2 * CELL_PADDING) // self._char_width, 1)
+        text = text.replace("\n", " ")
+        return text if len(text) <= limit else text[:max(limit - 1, 1)] + "…"
+
+    def _redraw(self):
+        """Draw the header and the visible rows only"""
+        canvas, header = self.canvas, self.header
+        canvas.delete("all")
+        header.delete("all")
+        canvas.configure(bg=self._color("background"))
+        header.configure(bg=self._color("header"))
+        text_color = self._color("text")
+
+        x = 0
+        for key, heading, width, _ in self._columns:
+            arrow = ""
+            if self._sort and self._sort[0] == key:
+                arrow = " ▼" if self._sort[1] else " ▲"
+            header.create_text(x + CELL_PADDING, ROW_HEIGHT // 2, anchor="w", fill=text_color,
+                               font=self._font, text=self._fit(heading + arrow, width))
+            x += width
+
+        total = len(self._view)
+        held = len(self._unsorted)
+        visible = self._visible_rows()
+        self._first = max(0, min(self._first, total - visible))
+        canvas_width = max(canvas.winfo_width(), x)
+
+        if not total:
+            if not self._rows:
+                message = self._message
+            else:
+                message = "Sorting..." if held else "No rows match the filter."
+            canvas.create_text(CELL_PADDING, ROW_HEIGHT // 2, anchor="w", fill=self._color("message"),
+                               font=self._font, text=message)
+
+        for position in range(self._first, min(self._first + visible + 1, total)):
+            row = self._rows[self._view[position]]
+            y = (position - self._first) * ROW_HEIGHT
+            color = text_color
+            if row is self._selected:
+                canvas.create_rectangle(0, y, canvas_width, y + ROW_HEIGHT, width=0, fill=self._color("selected"))
+                color = self._color("selected_text")
+            elif position % 2:
+                canvas.create_rectangle(0, y, canvas_width, y + ROW_HEIGHT, width=0, fill=self._color("stripe"))
+            x = 0
+            for key, _, width, spec in self._columns:
+                canvas.create_text(x + CELL_PADDING, y + ROW_HEIGHT // 2, anchor="w", fill=color,
+                                   font=self._font, text=self._fit(_cell_text(row.get(key), spec), width))
+                x += width
+
+        if total:
+            self.scrollbar.set(self._first / total, min((self._first + visible) / total, 1.0))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+        if self._filter:
+            self.count_label.configure(text=f"{total + held:,} of {len(self._rows):,} rows")
+        else:
+            self.count_label.configure(text=f"{len(self._rows):,} rows" if self._rows else "")
+        state = "normal" if self._selected is not None else "disabled"
+        for button in self._action_buttons:
+            button.configure(state=state)
+
+    def _set_appearance_mode(self, mode_string):
+        super()._set_appearance_mode(mode_string)
+        self._redraw()
@@ -0,0 +1,338 @@
+"""
+datagen.py - Seeded, streaming synthetic workshop data.
+
+SyntheticWorkshop produces every table as a generator of row tuples in
+populate_db.TABLE_COLUMNS order, so any number of rows can be written to CSV
+or fed straight into populate_db.load_tables in constant memory:
+
+    python -m datagen --jobs 1000000 --csv-dir data/
+    python populate_db.py --generate 1000000
+
+Rows never need to be remembered to stay consistent: every cross-table fact
+(which vehicle a job is for, who worked on it) is a pure function of the
+seed and the row index, so each table's generator recomputes it on its own.
+
+The data satisfies every constraint in Commands.sql (Reg_No pattern, body
+types, age 18-100, email or phone, end date >= start date, column lengths)
+and is skewed like a real workshop: a few fleet customers own many
+vehicles, some vehicles come back often, and a handful of part numbers
+account for most of the parts used.
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+CSV_NULL = "\\N"
+
+# Ratios to the number of service jobs
+CUSTOMERS_PER_JOB = 1 / 3
+VEHICLES_PER_JOB = 1 / 2
+TECHNICIANS_PER_JOB = 1 / 500
+REPS_PER_JOB = 1 / 2000
+
+# Skew: share of vehicles owned by fleet customers (the first FLEET_SHARE
+# of customers), and share of jobs on frequently serviced vehicles
+FLEET_VEHICLE_SHARE = 0.10
+FLEET_CUSTOMER_SHARE = 0.01
+REPEAT_JOB_SHARE = 0.30
+REPEAT_VEHICLE_SHARE = 0.05
+# Part popularity follows u ** PART_SKEW (higher = a few parts dominate more)
+PART_SKEW = 3
+
+JOB_ID_BASE = 1_000_000
+FIRST_JOB_DATE = date(2019, 1, 1)
+JOB_DAYS = 2500
+
+STATE_CODES = (
+    "AN", "AP", "AR", "AS", "BR", "CG", "CH", "DD", "DL", "GA", "GJ", "HP",
+    "HR", "JH", "JK", "KA", "KL", "LA", "LD", "MH", "ML", "MN", "MP", "MZ",
+    "NL", "OD", "PB", "PY", "RJ", "SK", "TN", "TR", "TS", "UK", "UP", "WB",
+)
+BODY_TYPES = ("Sedan", "SUV", "Hatchback", "Coupe", "Convertible", "Pickup", "Van", "Minivan", "Wagon")
+MAKES = {
+    "Maruti": ("Swift", "Baleno", "Dzire", "Brezza", "Ertiga"),
+    "Hyundai": ("i20", "Creta", "Verna", "Venue"),
+    "Tata": ("Nexon", "Punch", "Harrier", "Tiago"),
+    "Mahindra": ("XUV700", "Scorpio", "Thar", "Bolero"),
+    "Honda": ("City", "Amaze", "Elevate"),
+    "Toyota": ("Innova", "Fortuner", "Glanza"),
+    "Kia": ("Seltos", "Sonet", "Carens"),
+}
+SERVICE_TYPES = (
+    "General Service", "Oil Change", "Brake Service", "AC Repair", "Diagnostics",
+    "Electrical", "Engine", "Transmission", "Body Work", "Suspension",
+)
+SPECIALIZATIONS = (
+    ("Engine", "Petrol Engines"), ("Engine", "Diesel Engines"), ("Electrical", "EV Systems"),
+    ("Electrical", "Diagnostics"), ("AC", "HVAC Systems"), ("Transmission", "Gearbox"),
+    ("Body", "Painting"), ("Suspension", "Wheel Alignment"), ("General", "All Models"),
+)
+COMPLAINTS = (
+    ("Engine knocking sound", "Replaced ignition coil"),
+    ("Squealing brakes", "Replaced brake pads"),
+    ("AC not cooling", "Recharged refrigerant"),
+    ("Check engine light on", "Replaced O2 sensor"),
+    ("Battery drains overnight", "Replaced battery"),
+    ("Oil leakage noticed", "Fixed with new gasket"),
+    ("Gear slip in 3rd gear", "Adjusted transmission"),
+    ("Headlight not working", "Replaced bulb"),
+    ("Steering pulls to the left", "Wheel alignment done"),
+    ("Rattling noise from dashboard", "Tightened loose components"),
+)
+PART_PREFIXES = (
+    "BRKPAD", "OILFLTR", "ENGNOIL", "AIRFLTR", "IGNCOIL", "O2SENSOR",
+    "SPARKPLG", "BATTERY", "WIPER", "COOLANT", "CLUTCH", "TIMBELT",
+)
+PARTS_PER_PREFIX = 40
+FIRST_NAMES = (
+    "Aarav", "Vivaan", "Aditya", "Ananya", "Diya", "Ishaan", "Kavya", "Meera",
+    "Rohan", "Saanvi", "Arjun", "Priya", "Rahul", "Sneha", "Vikram", "Neha",
+    "Karan", "Pooja", "Siddharth", "Lakshmi",
+)
+LAST_NAMES = (
+    "Sharma", "Verma", "Patel", "Reddy", "Nair", "Iyer", "Gupta", "Singh",
+    "Das", "Menon", "Rao", "Shah", "Kumar", "Pillai", "Chauhan", "Mehta",
+)
+
+_MASK = (1 << 64) - 1
+
+def _mix(x):
+    """splitmix64 finaliser - a fast, well-spread 64-bit hash"""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+def reg_no(i):
+    """i-th registration number; distinct for distinct i and matches chk_licenseNo"""
+    state = STATE_CODES[i % len(STATE_CODES)]
+    rest = i // len(STATE_CODES)
+    district = rest % 100
+    rest //= 100
+    letters = chr(65 + rest % 26) + chr(65 + (rest // 26) % 26)
+    serial = (rest // 676) % 10_000
+    return f"{state}{district:02d}{letters}{serial:04d}"
+
+def tech_id(i):
+    return f"TG{i:06d}"
+
+def rep_id(i):
+    return f"EG{i:06d}"
+
+def customer_id(i):
+    return f"CG{i:07d}"
+
+def job_id(i):
+    return JOB_ID_BASE + i
+
+def part_no(i):
+    """i-th part number of the catalog (0 is the most used)"""
+    return f"{PART_PREFIXES[i % len(PART_PREFIXES)]}-{i // len(PART_PREFIXES):04d}"
+
+def part_price(i):
+    """List price of catalog part i"""
+    return 150 + (_mix(i) % 80) * 50
+
+class SyntheticWorkshop:
+    """
+    Deterministic synthetic data set sized from a number of service jobs
+
+    The same jobs/seed always produce the same rows.
+    """
+
+    def __init__(self, jobs, seed=42):
+        self.jobs = jobs
+        self.seed = seed
+        self.customers = max(10, int(jobs * CUSTOMERS_PER_JOB))
+        self.vehicles = max(10, int(jobs * VEHICLES_PER_JOB))
+        self.technicians = max(10, int(jobs * TECHNICIANS_PER_JOB))
+        self.reps = max(3, int(jobs * REPS_PER_JOB))
+        self.parts_catalog = len(PART_PREFIXES) * PARTS_PER_PREFIX
+        self._key = _mix(seed)
+
+    # ---------- per-row facts shared between tables ----------
+
+    def _unit(self, salt, i):
+        """Uniform float in [0, 1) for (salt, row index) - stateless"""
+        return _mix(self._key ^ _mix(salt * 0x100000001B3 + i)) / 2.0 ** 64
+
+    def vehicle_owner(self, v):
+        """Customer index owning vehicle v (fleet customers own many)"""
+        if self._unit(1, v) < FLEET_VEHICLE_SHARE:
+            fleet = max(1, int(self.customers * FLEET_CUSTOMER_SHARE))
+            return int(self._unit(2, v) * fleet)
+        return int(self._unit(3, v) * self.customers)
+
+    def job_vehicle(self, j):
+        """Vehicle index serviced by job j (some vehicles come back often)"""
+        if self._unit(4, j) < REPEAT_JOB_SHARE:
+            return int(self._unit(5, j) * max(1, int(self.vehicles * REPEAT_VEHICLE_SHARE)))
+        return int(self._unit(6, j) * self.vehicles)
+
+    def job_rep(self, j):
+        """Rep index who booked job j"""
+        return int(self._unit(7, j) * self.reps)
+
+    def job_techs(self, j):
+        """Technician indexes who worked on job j (one, sometimes two)"""
+        first = int(self._unit(8, j) * self.technicians)
+        if self._unit(9, j) < 0.15 and self.technicians > 1:
+            second = (first + 1 + int(self._unit(10, j) * (self.technicians - 1))) % self.technicians
+            return (first, second)
+        return (first,)
+
+    def job_start(self, j):
+        """Start date of job j (recent years are busier)"""
+        return FIRST_JOB_DATE + timedelta(days=int(self._unit(11, j) ** 0.6 * JOB_DAYS))
+
+    def _rng(self, table):
+        return random.Random(f"{self.seed}:{table}")
+
+    # ---------- tables ----------
+
+    def technicians_rows(self):
+        rng = self._rng("service_technician")
+        for i in range(self.technicians):
+            trained_for, specialization = rng.choice(SPECIALIZATIONS)
+            yield (tech_id(i), rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+                   trained_for, specialization, rng.randint(0, 30))
+
+    def customer_reps_rows(self):
+        rng = self._rng("customer_reps")
+        for i in range(self.reps):
+            # Phone_Number is an INT column: 9 digits fit
+            yield (rep_id(i), f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                   rng.randint(600_000_000, 999_999_999), rng.randint(0, 25))
+
+    def customers_rows(self):
+        rng = self._rng("customers")
+        for i in range(self.customers):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            # At least one contact (before_customer_insert trigger)
+            contact = rng.random()
+            email = f"{name.split()[0].lower()}.{i}@example.com" if contact < 0.8 else None
+            phone = f"{rng.randint(6, 9)}{rng.randint(0, 999_999_999):09d}" if contact >= 0.2 else None
+            age = min(100, 18 + int(rng.expovariate(1 / 22)))
+            joined = FIRST_JOB_DATE + timedelta(days=rng.randrange(JOB_DAYS))
+            yield (customer_id(i), name, email, phone, f"{rng.choice(STATE_CODES)}{i:014d}",
+                   age, joined, rep_id(rng.randrange(self.reps)))
+
+    def vehicles_rows(self):
+        rng = self._rng("vehicle")
+        makes = tuple(MAKES)
+        for v in range(self.vehicles):
+            make = rng.choice(makes)
+            yield (reg_no(v), make, rng.choice(MAKES[make]), rng.randint(2005, 2025),
+                   f"MA{v:015d}", rng.choice(BODY_TYPES), customer_id(self.vehicle_owner(v)),
+                   rep_id(rng.randrange(self.reps)))
+
+    def service_jobs_rows(self):
+        rng = self._rng("service_job")
+        for j in range(self.jobs):
+            start = self.job_start(j)
+            # Open jobs have no predicted end yet; otherwise end >= start
+            end = None if rng.random() < 0.15 else start + timedelta(days=rng.randint(0, 14))
+            service_type = rng.choice(SERVICE_TYPES)
+            yield (job_id(j), start, reg_no(self.job_vehicle(j)), service_type,
+                   f"{service_type} for booking {j}", end, rng.randint(5, 400) * 50,
+                   rep_id(self.job_rep(j)))
+
+    def complaints_rows(self):
+        rng = self._rng("complaints")
+        for j in range(self.jobs):
+            for _ in range(1 + int(rng.random() ** 3 * 3)):
+                complaint, fix = rng.choice(COMPLAINTS)
+                yield (job_id(j), complaint, fix if rng.random() < 0.7 else None)
+
+    def parts_rows(self):
+        rng = self._rng("parts")
+        for j in range(self.jobs):
+            for _ in range(int(rng.random() ** 2 * 6)):
+                p = int(rng.random() ** PART_SKEW * self.parts_catalog)
+                yield (job_id(j), part_no(p), rng.randint(1, 4), part_price(p))
+
+    def needs_rows(self):
+        for j in range(self.jobs):
+            yield (reg_no(self.job_vehicle(j)), job_id(j))
+
+    def done_by_rows(self):
+        for j in range(self.jobs):
+            for t in self.job_techs(j):
+                yield (job_id(j), tech_id(t))
+
+    def assigns_rows(self):
+        for j in range(self.jobs):
+            rep = rep_id(self.job_rep(j))
+            for t in self.job_techs(j):
+                yield (job_id(j), rep, tech_id(t))
+
+    def tables(self):
+        """Table -> fresh row generator, ready for populate_db.load_tables"""
+        return {
+            "service_technician": self.technicians_rows(),
+            "customer_reps": self.customer_reps_rows(),
+            "customers": self.customers_rows(),
+            "vehicle": self.vehicles_rows(),
+            "service_job": self.service_jobs_rows(),
+            "complaints": self.complaints_rows(),
+            "parts": self.parts_rows(),
+            "needs": self.needs_rows(),
+            "Done_By": self.done_by_rows(),
+            "assigns": self.assigns_rows(),
+        }
+
+def _csv_value(value):
+    if value is None:
+        return CSV_NULL
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+def write_csv(workshop, directory, columns):
+    """
+    Write every table to <directory>/<table>.csv in populate_db's CSV format
+
+    Args:
+        columns: Table -> column names for the header row
+    Returns:
+        Dict table -> rows written
+    """
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    for table, rows in workshop.tables().items():
+        started = time.perf_counter()
+        count = 0
+        with open(os.path.join(directory, f"{table}.csv"), "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns[table])
+            for row in rows:
+                writer.writerow([_csv_value(v) for v in row])
+                count += 1
+        seconds = time.perf_counter() - started
+        counts[table] = count
+        print(f"  ✓ {table}.csv: {count:,} rows ({count / seconds if seconds else 0:,.0f} rows/s)")
+    return counts
+
+def main(argv=None):
+    from populate_db import TABLE_COLUMNS
+
+    parser = argparse.ArgumentParser(prog="python -m datagen", description="Write synthetic workshop data as CSV")
+    parser.add_argument("--jobs", type=int, required=True, help="number of service jobs (other tables scale with it)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--csv-dir", required=True, help="directory for the <table>.csv files")
+    args = parser.parse_args(argv)
+
+    workshop = SyntheticWorkshop(args.jobs, args.seed)
+    print(f"Generating {args.jobs:,} jobs, {workshop.customers:,} customers, "
+          f"{workshop.vehicles:,} vehicles into {args.csv_dir}")
+    write_csv(workshop, args.csv_dir, TABLE_COLUMNS)
+    print(f"\nLoad with: python populate_db.py --csv-dir {args.csv_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
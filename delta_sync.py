@@ -0,0 +1,261 @@
+"""
+delta_sync.py - Refresh open job lists from the job change log.
+
+Triggers (migration 007) append the job of every write to service_job,
+Done_By, parts and complaints to job_changes; change_id is the row version.
+A JobListSync holds one list (a technician's jobs, a customer's service
+history) plus the highest change_id it has seen. Refreshing reads the log
+past that watermark and re-fetches only the changed jobs of the list, so an
+unchanged list costs one primary-key range read however long the history
+grows. Changed jobs that no longer belong to the list are dropped from it.
+
+The log does not cover vehicles: a changed Make/Model shows up after the
+next full load (a new JobListSync).
+
+    python delta_sync.py --prune-days 30     # drop old log entries (MySQL)
+"""
+
+import argparse
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+from DB_connecrtors import initialize_connection_pool, close_pool, run_query, transaction
+from query_registry import run_named, JOB_BATCH_SIZES
+
+# More changed jobs than this since the watermark: reload the whole list
+FULL_RELOAD_JOBS = 256
+# Seconds a skipped change_id is waited for. AUTO_INCREMENT ids are handed
+# out before commit, so a lower id can still become visible after a higher
+# one; ids that never show up were rolled back.
+GAP_TIMEOUT = 60.0
+MAX_GAPS = 64
+PRUNE_DAYS = 30
+
+# Lists kept by delta sync: registered query -> sort column (newest first).
+# Each has *_changed_{n} variants restricted to a batch of jobs.
+SYNCED_LISTS = {
+    "get_jobs_for_technician": "Start_Date",
+    "get_customer_service_status": "Start_date",
+}
+
+# Separate subqueries: SQLite reads MIN and MAX off the primary key only one at a time
+_LOG_BOUNDS_SQL = """
+SELECT (SELECT MIN(change_id) FROM job_changes) AS first_id,
+       (SELECT MAX(change_id) FROM job_changes) AS last_id
+"""
+
+_CHANGES_SQL = """
+SELECT change_id, JobID FROM job_changes
+WHERE change_id > %s
+ORDER BY change_id
+LIMIT %s
+"""
+
+def latest_change():
+    """Highest change_id in the log (0 if empty); raises RuntimeError on failure"""
+    rows = run_query(_LOG_BOUNDS_SQL, fetch=True)
+    if isinstance(rows, str):
+        raise RuntimeError(rows)
+    return (rows[0]["last_id"] or 0) if rows else 0
+
+def changes_since(watermark, gaps=None, limit=FULL_RELOAD_JOBS):
+    """
+    Jobs changed after a watermark
+
+    Args:
+        watermark: Highest change_id already applied
+        gaps: {change_id: time first missed} of ids skipped by earlier calls;
+              updated in place (found and expired ids are removed)
+        limit: Changes to read; more means the caller should reload
+    Returns:
+        Dict {"jobs": set of JobIDs, "watermark": new watermark,
+              "reload": True if the log no longer covers the watermark or
+              has more than limit changes past it}
+    Raises:
+        RuntimeError with the error string if the log can't be read
+    """
+    gaps = gaps if gaps is not None else {}
+    bounds = run_query(_LOG_BOUNDS_SQL, fetch=True)
+    if isinstance(bounds, str):
+        raise RuntimeError(bounds)
+    first_id, last_id = bounds[0]["first_id"], bounds[0]["last_id"]
+    if last_id is None or last_id <= watermark and not gaps:
+        return {"jobs": set(), "watermark": watermark, "reload": False}
+    if first_id > watermark + 1 and watermark > 0:
+        # Entries after the watermark were pruned
+        return {"jobs": set(), "watermark": watermark, "reload": True}
+
+    rows = run_query(_CHANGES_SQL, (watermark, limit + 1), fetch=True)
+    if isinstance(rows, str):
+        raise RuntimeError(rows)
+    if len(rows) > limit:
+        return {"jobs": set(), "watermark": watermark, "reload": True}
+
+    now = time.monotonic()
+    if gaps:
+        ids = list(gaps)
+        found = run_query(
+            f"SELECT change_id, JobID FROM job_changes WHERE change_id IN ({', '.join(['%s'] * len(ids))})",
+            ids, fetch=True
+        )
+        if isinstance(found, str):
+            raise RuntimeError(found)
+        rows = found + rows
+        for row in found:
+            gaps.pop(row["change_id"], None)
+        for change_id in [c for c, seen in gaps.items() if now - seen > GAP_TIMEOUT]:
+            del gaps[change_id]
+
+    expected = watermark + 1
+    for row in rows:
+        if row["change_id"] > watermark:
+            # Only the newest MAX_GAPS ids of a hole (a rolled-back bulk insert,
+            # an auto-increment jump) can still be waited for
+            start = max(expected, row["change_id"] - MAX_GAPS)
+            gaps.update((missing, now) for missing in range(start, row["change_id"]))
+            expected = row["change_id"] + 1
+    if len(gaps) > MAX_GAPS:
+        for change_id in sorted(gaps)[:-MAX_GAPS]:
+            del gaps[change_id]
+
+    new_watermark = max([watermark] + [row["change_id"] for row in rows])
+    return {
+        "jobs": {row["JobID"] for row in rows if row["JobID"] is not None},
+        "watermark": new_watermark,
+        "reload": False,
+    }
+
+class JobListSync:
+    """
+    One open job list kept current by delta sync
+
+    refresh() runs on a worker thread (AsyncViewMixin.run_async); calls on
+    the same list are serialized.
+    """
+
+    def __init__(self, listing, owner_id):
+        """
+        Args:
+            listing: Key of SYNCED_LISTS
+            owner_id: The list's parameter (TechID or Customer_ID)
+        """
+        self.listing = listing
+        self.owner_id = owner_id
+        self.sort_column = SYNCED_LISTS[listing]
+        self.watermark = None
+        self.last_refresh = None
+        self._rows = {}
+        self._ordered = None
+        self._gaps = {}
+        self._lock = threading.Lock()
+
+    def _sorted(self):
+        if self._ordered is None:
+            self._ordered = sorted(
+                self._rows.values(),
+                key=lambda r: (r[self.sort_column] is not None, r[self.sort_column], r["Service_ID"]),
+                reverse=True
+            )
+        return list(self._ordered)
+
+    def _reload(self):
+        # Watermark first: a change made during the read is applied again next time
+        watermark = latest_change()
+        rows = run_named(self.listing, (self.owner_id,), fetch=True)
+        if isinstance(rows, str):
+            raise RuntimeError(rows)
+        self._rows = {row["Service_ID"]: row for row in rows}
+        self._ordered = None
+        self._gaps.clear()
+        self.watermark = watermark
+        self.last_refresh = {"full": True, "changed_jobs": len(rows)}
+
+    def _apply(self, job_ids):
+        """Re-fetch the list rows of changed jobs, a batch per round trip"""
+        job_ids = list(job_ids)
+        largest = JOB_BATCH_SIZES[-1]
+        for start in range(0, len(job_ids), largest):
+            batch = job_ids[start:start + largest]
+            size = next(n for n in JOB_BATCH_SIZES if n >= len(batch))
+            padded = batch + [batch[-1]] * (size - len(batch))
+            rows = run_named(f"{self.listing}_changed_{size}", (self.owner_id, *padded), fetch=True)
+            if isinstance(rows, str):
+                raise RuntimeError(rows)
+            for job_id in batch:
+                self._rows.pop(job_id, None)
+            for row in rows:
+                self._rows[row["Service_ID"]] = row
+        self._ordered = None
+
+    def refresh(self):
+        """
+        Bring the list up to date
+
+        Returns:
+            - List of job rows, newest first (same columns as the listing query)
+            - Error string if failed (the list keeps its previous state)
+        """
+        with self._lock:
+            try:
+                if self.watermark is None:
+                    self._reload()
+                    return self._sorted()
+
+                changes = changes_since(self.watermark, self._gaps)
+                if changes["reload"]:
+                    self._reload()
+                    return self._sorted()
+
+                if changes["jobs"]:
+                    self._apply(changes["jobs"])
+                self.watermark = changes["watermark"]
+                self.last_refresh = {"full": False, "changed_jobs": len(changes["jobs"])}
+                return self._sorted()
+
+            except Exception as e:
+                print(f"Error refreshing {self.listing}: {e}")
+                return str(e)
+
+def prune_changes(keep_days=PRUNE_DAYS):
+    """
+    Delete log entries older than keep_days
+
+    Lists synced before the cut reload in full on their next refresh.
+
+    Returns:
+        Number of entries deleted
+    Raises:
+        mysql.connector.Error if the delete fails
+    """
+    cutoff = datetime.now() - timedelta(days=keep_days)
+    with transaction() as tx:
+        latest = tx.execute(_LOG_BOUNDS_SQL, fetch=True)[0]["last_id"]
+        if latest is None:
+            return 0
+        # The newest entry stays so the log still shows how far it has got
+        return max(tx.execute(
+            "DELETE FROM job_changes WHERE changed_at < %s AND change_id < %s", (cutoff, latest)
+        ), 0)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the job change log")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--prune-days", type=int, default=PRUNE_DAYS, help="keep this many days of changes")
+    args = parser.parse_args(argv)
+
+    if not initialize_connection_pool(args.db):
+        return 1
+    try:
+        deleted = prune_changes(args.prune_days)
+        print(f"✓ {deleted:,} job changes older than {args.prune_days} days pruned")
+        return 0
+    except Exception as e:
+        print(f"✗ Prune failed: {e}")
+        return 1
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+events.py - In-process change events shared by the dashboards.
+
+Write paths publish a typed event once their change is committed; views
+and caches subscribe and patch what they already hold instead of running
+their queries again. Only writes made by this process are published -
+other clients' changes still arrive through delta sync (job lists) or the
+result cache TTL.
+
+Handlers run on the publishing thread, usually a DB worker. Tk views
+subscribe through AsyncViewMixin.subscribe_event, which hands each event to
+the Tk main thread.
+
+    from events import subscribe, publish, TechnicianDeleted
+    subscribe(TechnicianDeleted, lambda event: print(event.tech_id))
+    publish(TechnicianDeleted("T100"))
+"""
+
+import threading
+from collections import namedtuple
+
+# Rows carry the columns of the matching listing (query_registry.PAGED_LISTINGS)
+TechnicianAdded = namedtuple("TechnicianAdded", "row")
+TechnicianDeleted = namedtuple("TechnicianDeleted", "tech_id")
+CustomerRepAdded = namedtuple("CustomerRepAdded", "row")
+CustomerRepDeleted = namedtuple("CustomerRepDeleted", "emp_id")
+CustomerAdded = namedtuple("CustomerAdded", "row")
+# Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID
+VehicleAdded = namedtuple("VehicleAdded", "row")
+JobCreated = namedtuple("JobCreated", "job_id reg_no tech_id")
+TechnicianAssigned = namedtuple("TechnicianAssigned", "job_id tech_id")
+ComplaintAdded = namedtuple("ComplaintAdded", "job_id complaint")
+# parts: list of (Part_No, Quantity, Price)
+PartsAdded = namedtuple("PartsAdded", "job_id parts")
+
+# Events that change what a job list shows
+JOB_EVENTS = (JobCreated, TechnicianAssigned, ComplaintAdded, PartsAdded)
+
+_subscribers = {}
+_lock = threading.Lock()
+
+def subscribe(event_type, handler):
+    """
+    Call handler(event) for every published event of a type
+
+    Returns:
+        Token for unsubscribe()
+    """
+    with _lock:
+        _subscribers.setdefault(event_type, []).append(handler)
+    return (event_type, handler)
+
+def unsubscribe(token):
+    """Stop a subscription (unknown or already removed tokens are ignored)"""
+    event_type, handler = token
+    with _lock:
+        handlers = _subscribers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+def publish(event):
+    """Deliver an event to its type's subscribers, in subscription order"""
+    with _lock:
+        handlers = list(_subscribers.get(type(event), ()))
+    for handler in handlers:
+        try:
+            handler(event)
+        except Exception as e:
+            # A failing subscriber must not fail the write that published
+            print(f"Error handling {type(event).__name__}: {e}")
+
+def subscriber_count():
+    """Subscriptions per event type name (for diagnostics)"""
+    with _lock:
+        return {t.__name__: len(h) for t, h in _subscribers.items() if h}
@@ -0,0 +1,202 @@
+"""
+export.py - Stream a list view or a whole table to CSV / JSON Lines.
+
+Rows go from the server-side cursor (DB_connecrtors.stream_query, an
+unbuffered cursor read in chunks) through the encoder straight into the
+file, so memory stays flat however many rows there are. The file name
+picks the compression (.gz, .bz2, .xz, or none) and, unless a format is
+given, the format (.csv or .jsonl). Rows are written to <file>.part, which
+is renamed when the export completes, so a cancelled or failed export
+never leaves a truncated file behind.
+
+    python export.py jobs -o jobs.csv.gz
+    python export.py parts_usage -o parts.jsonl.xz --db sqlite:workshop.db
+    python export.py --list
+"""
+
+import argparse
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import os
+import sys
+import time
+from datetime import date, datetime, time as clock_time, timedelta
+from decimal import Decimal
+
+from DB_connecrtors import initialize_connection_pool, close_pool, stream_query
+from query_registry import EXPORT_QUERIES, sql
+
+FORMATS = ("csv", "jsonl")
+# Rows between progress callbacks
+PROGRESS_ROWS = 10_000
+# Seconds between progress lines (CLI)
+PROGRESS_INTERVAL = 2.0
+
+# Compression by file suffix; gzip at level 6 - level 9 costs far more CPU for ~1% smaller files
+_OPENERS = {
+    ".gz": lambda path: gzip.open(path, "wt", compresslevel=6, encoding="utf-8", newline=""),
+    ".bz2": lambda path: bz2.open(path, "wt", encoding="utf-8", newline=""),
+    ".xz": lambda path: lzma.open(path, "wt", encoding="utf-8", newline=""),
+}
+
+def export_format(path, fmt=None):
+    """
+    Format and compression of an output file
+
+    Returns:
+        (format, compression suffix or None), e.g. ("csv", ".gz") for jobs.csv.gz
+    Raises:
+        ValueError for an unknown format
+    """
+    stem, compression = os.path.splitext(path)
+    if compression.lower() not in _OPENERS:
+        stem, compression = path, None
+    else:
+        compression = compression.lower()
+    if fmt is None:
+        fmt = "jsonl" if os.path.splitext(stem)[1].lower() in (".jsonl", ".json", ".ndjson") else "csv"
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r} (use {' or '.join(FORMATS)})")
+    return fmt, compression
+
+def default_filename(stem, fmt="csv"):
+    """Dated, gzip-compressed file name for an export, e.g. jobs-20250101.csv.gz"""
+    return f"{stem}-{date.today():%Y%m%d}.{fmt}.gz"
+
+def _json_value(value):
+    """JSON for the non-JSON types the drivers return"""
+    if isinstance(value, (datetime, date, clock_time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        # MySQL TIME columns
+        return value.total_seconds()
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    raise TypeError(f"{type(value).__name__} is not exportable")
+
+def export_rows(rows, path, fmt=None, progress=None, stop=None, columns=None):
+    """
+    Write rows to a (compressed) CSV / JSONL file as they arrive
+
+    Args:
+        rows: Iterable of row dicts, e.g. stream_query(...); closed when done
+        path: Output file; its suffixes pick the compression and, unless
+              fmt is given, the format
+        fmt: "csv" or "jsonl"
+        progress: Callback(rows written so far), every PROGRESS_ROWS rows and
+                  at the end (called on the exporting thread)
+        stop: threading.Event; setting it cancels the export
+        columns: Column names for the CSV header when no rows come back, e.g.
+                 the list filled by stream_query(..., columns=columns)
+    Returns:
+        Rows written, or None if cancelled (the partial file is removed)
+    Raises:
+        ValueError for an unknown format; mysql.connector.Error / OSError if
+        reading or writing fails (the partial file is removed)
+    """
+    fmt, compression = export_format(path, fmt)
+    part = path + ".part"
+    written = 0
+    completed = False
+    try:
+        opener = _OPENERS.get(compression) or (lambda p: open(p, "w", encoding="utf-8", newline=""))
+        with opener(part) as out:
+            writer = None
+            for row in rows:
+                if stop is not None and stop.is_set():
+                    return None
+                if fmt == "csv":
+                    if writer is None:
+                        writer = csv.writer(out)
+                        writer.writerow(row.keys())
+                    writer.writerow(row.values())
+                else:
+                    out.write(json.dumps(row, default=_json_value, ensure_ascii=False))
+                    out.write("\n")
+                written += 1
+                if progress and written % PROGRESS_ROWS == 0:
+                    progress(written)
+            if fmt == "csv" and writer is None and columns:
+                # Empty result - still a valid CSV with its header
+                csv.writer(out).writerow(columns)
+        os.replace(part, path)
+        completed = True
+    finally:
+        close = getattr(rows, "close", None)
+        if close:
+            close()
+        if not completed and os.path.exists(part):
+            os.remove(part)
+
+    if progress:
+        progress(written)
+    return written
+
+def export_table(name, path, fmt=None, progress=None, stop=None):
+    """
+    Export one of query_registry.EXPORT_QUERIES (jobs, parts_usage, customers...)
+
+    Same arguments and return value as export_rows.
+    """
+    if name not in EXPORT_QUERIES:
+        raise ValueError(f"Unknown export {name!r} (one of {', '.join(sorted(EXPORT_QUERIES))})")
+    columns = []
+    return export_rows(stream_query(sql(f"export_{name}"), columns=columns), path, fmt, progress, stop, columns)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a table to CSV / JSON Lines, optionally compressed")
+    parser.add_argument("table", nargs="?", choices=sorted(EXPORT_QUERIES), help="what to export")
+    parser.add_argument("-o", "--output", help="output file; .gz/.bz2/.xz compress (default <table>-<date>.csv.gz)")
+    parser.add_argument("--format", choices=FORMATS, help="csv or jsonl (default from the file name)")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--list", action="store_true", help="list the exportable tables")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in sorted(EXPORT_QUERIES):
+            print(name)
+        return 0
+    if not args.table:
+        parser.error("a table to export is required (see --list)")
+
+    path = args.output or default_filename(args.table, args.format or "csv")
+    try:
+        export_format(path, args.format)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if not initialize_connection_pool(args.db):
+        return 1
+
+    started = last_report = time.perf_counter()
+
+    def report(rows):
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report < PROGRESS_INTERVAL:
+            return
+        last_report = now
+        size = os.path.getsize(path + ".part") if os.path.exists(path + ".part") else 0
+        print(f"  {rows:,} rows, {rows / (now - started):,.0f} rows/s, {size / 1e6:,.1f} MB written")
+
+    try:
+        rows = export_table(args.table, path, args.format, progress=report)
+        elapsed = time.perf_counter() - started
+        print(f"✓ {rows:,} rows exported to {path} ({os.path.getsize(path) / 1e6:,.1f} MB) in {elapsed:.1f}s")
+        return 0
+    except KeyboardInterrupt:
+        print("✗ Export cancelled")
+        return 130
+    except Exception as e:
+        print(f"✗ Export failed: {e}")
+        return 1
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    sys.exit(main())
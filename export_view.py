@@ -0,0 +1,88 @@
+import threading
+from tkinter import filedialog
+from export import export_rows, default_filename
+
+EXPORT_FILETYPES = [
+    ("Compressed CSV", "*.csv.gz"),
+    ("Compressed JSON Lines", "*.jsonl.gz"),
+    ("CSV", "*.csv"),
+    ("JSON Lines", "*.jsonl"),
+    ("All files", "*"),
+]
+
+class ExportMixin:
+    """
+    "Export..." for views that mix in AsyncViewMixin
+
+    export_source() says what the view's table is showing; export_current()
+    then streams all of it - every row of a listing, not just the page on
+    screen - to a file on a DB worker, with the row count in the busy bar.
+    The busy bar's Cancel button stops the export and removes the partial file.
+    """
+
+    def export_source(self):
+        """
+        What an export of the current table would write
+
+        Returns:
+            (file name stem, make_rows) where make_rows(columns) returns an
+            iterable of row dicts (called on the worker; columns is the list
+            to pass to stream_query, for the header of an empty CSV), or None
+            if there is nothing
+        """
+        if not self.table.rows:
+            return None
+        source = self.table.source
+        return self.table_export_source(source if isinstance(source, str) else "rows")
+
+    def table_export_source(self, stem):
+        """Export the rows the table holds (results that are not a query of their own)"""
+        rows = list(self.table.rows)
+        return stem, lambda columns: iter(rows)
+
+    def export_current(self):
+        """Ask for a file and export what the table is showing"""
+        source = self.export_source()
+        if source is None:
+            self.show_error("Nothing to export - show a list first")
+            return
+        self.start_export(*source)
+
+    def start_export(self, stem, make_rows):
+        """
+        Ask for a file name and stream make_rows(columns) into it in the background
+
+        Args:
+            stem: Default file name stem (date and .csv.gz are appended)
+            make_rows: Callable(columns) returning the rows, run on the worker
+        """
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            title="Export rows",
+            initialfile=default_filename(stem),
+            filetypes=EXPORT_FILETYPES
+        )
+        if not path:
+            return
+
+        stop = threading.Event()
+        written = [0]
+        columns = []
+
+        def progress(rows):
+            written[0] = rows
+
+        self.run_async(
+            "export", lambda: export_rows(make_rows(columns), path, progress=progress, stop=stop, columns=columns),
+            on_done=lambda rows: self._export_done(path, rows),
+            busy_text=lambda: f"Exporting... {written[0]:,} rows",
+            stop=stop
+        )
+
+    def _export_done(self, path, rows):
+        """Report a finished export (Tk thread)"""
+        self.output.delete("1.0", "end")
+        if rows is None:
+            self.output.insert("end", f"Export cancelled - nothing was written to {path}\n")
+        else:
+            self.output.insert("end", f"✓ Exported {rows:,} rows to {path}\n")
@@ -0,0 +1,410 @@
+"""
+index_advisor.py - Propose indexes for the statements the views issue.
+
+Seeds a database with datagen, runs the benchmark workload once while
+query_log.capture() records every statement with its real parameters, and
+EXPLAINs each one. A table that is scanned, or probed through an index that
+misses its equality predicate, gets a composite index proposal: equality
+columns first, then join / IN lookup columns, then ORDER BY columns and -
+when they are narrow enough - the other columns the statement reads, so the
+index covers it. Proposals are created on the seeded database and the
+workload is EXPLAINed again until nothing new comes up; the workload is
+timed before and after.
+
+    python -m index_advisor                          # 50k jobs, in-memory SQLite
+    python -m index_advisor --no-migrations --migration migrations/001_hot_path_indexes.sql
+
+--no-migrations advises against the bare Commands.sql schema. Seeding
+wipes every workshop table, so a MySQL database needs --allow-wipe.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+import DB_connecrtors
+import query_log
+from DB_connecrtors import initialize_connection_pool, close_pool, get_connection, run_query
+from query_registry import _table_aliases
+import benchmark
+
+DEFAULT_DB = "sqlite::memory:"
+DEFAULT_JOBS = 50_000
+DEFAULT_ITERATIONS = 50
+# Create / re-EXPLAIN rounds before giving up on new proposals
+MAX_ROUNDS = 3
+# Extra columns make an index covering only while their declared widths
+# add up to at most this many bytes
+COVERING_MAX_BYTES = 64
+# Case iterations of the capture run, far away from the timed runs' keys
+CAPTURE_OFFSET = 1_000_000
+
+_COLUMNS = {
+    "mysql": "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.COLUMNS "
+             "WHERE TABLE_SCHEMA = DATABASE()",
+    "sqlite": "SELECT m.name AS TABLE_NAME, p.name AS COLUMN_NAME, p.type AS COLUMN_TYPE "
+              "FROM sqlite_master m JOIN pragma_table_info(m.name) p WHERE m.type = 'table'",
+}
+_INDEXES = {
+    "mysql": "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS "
+             "WHERE TABLE_SCHEMA = DATABASE() ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX",
+    "sqlite": "SELECT m.name AS TABLE_NAME, il.name AS INDEX_NAME, ii.name AS COLUMN_NAME "
+              "FROM sqlite_master m JOIN pragma_index_list(m.name) il JOIN pragma_index_info(il.name) ii "
+              "WHERE m.type = 'table' ORDER BY m.name, il.name, ii.seqno",
+}
+_FOREIGN_KEYS = {
+    "mysql": "SELECT TABLE_NAME, COLUMN_NAME, REFERENCED_TABLE_NAME FROM information_schema.KEY_COLUMN_USAGE "
+             "WHERE TABLE_SCHEMA = DATABASE() AND REFERENCED_TABLE_NAME IS NOT NULL",
+    "sqlite": "SELECT m.name AS TABLE_NAME, f.\"from\" AS COLUMN_NAME, f.\"table\" AS REFERENCED_TABLE_NAME "
+              "FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f WHERE m.type = 'table'",
+}
+
+def _column_width(column_type):
+    """Approximate stored bytes of a column from its declared type"""
+    column_type = (column_type or "").lower()
+    length = re.search(r"char\s*\((\d+)\)", column_type)
+    if length:
+        return int(length.group(1))
+    if "bigint" in column_type or "datetime" in column_type or "timestamp" in column_type:
+        return 8
+    if "int" in column_type:
+        return 4
+    if "date" in column_type:
+        return 3
+    if "text" in column_type or "blob" in column_type:
+        return 1024
+    return 8
+
+class Schema:
+    """Columns, indexes and foreign keys of the connected database (names keyed lowercase)"""
+
+    def __init__(self):
+        self.tables = {}    # table -> table name as spelled in the schema
+        self.columns = {}   # table -> {column: (Column, width)}
+        self.indexes = {}   # table -> [(column, ...)]
+        self.foreign_keys = {}   # child table -> [(column, parent table)]
+
+    @classmethod
+    def load(cls):
+        schema = cls()
+        for row in run_query(_COLUMNS[DB_connecrtors.dialect], fetch=True) or []:
+            table = row["TABLE_NAME"]
+            schema.tables[table.lower()] = table
+            schema.columns.setdefault(table.lower(), {})[row["COLUMN_NAME"].lower()] = (
+                row["COLUMN_NAME"], _column_width(row["COLUMN_TYPE"])
+            )
+        indexes = {}
+        for row in run_query(_INDEXES[DB_connecrtors.dialect], fetch=True) or []:
+            indexes.setdefault((row["TABLE_NAME"].lower(), row["INDEX_NAME"]), []).append(row["COLUMN_NAME"].lower())
+        for (table, _), columns in indexes.items():
+            schema.indexes.setdefault(table, []).append(tuple(columns))
+        for row in run_query(_FOREIGN_KEYS[DB_connecrtors.dialect], fetch=True) or []:
+            schema.foreign_keys.setdefault(row["TABLE_NAME"].lower(), []).append(
+                (row["COLUMN_NAME"].lower(), row["REFERENCED_TABLE_NAME"].lower())
+            )
+        return schema
+
+    def column(self, table, name):
+        """Lowercase column name if table has it, else None"""
+        name = name.lower()
+        return name if name in self.columns.get(table, {}) else None
+
+    def spelled(self, table, column):
+        return self.columns[table][column][0]
+
+    def width(self, table, column):
+        return self.columns[table][column][1]
+
+    def covered(self, table, columns):
+        """True if an existing index already serves these columns"""
+        return any(_subsumes(index, columns) for index in self.indexes.get(table, []))
+
+def _subsumes(index, candidate):
+    """True if index serves every lookup candidate would (same leading column, superset of columns)"""
+    if tuple(index[:len(candidate)]) == tuple(candidate):
+        return True
+    return bool(index) and index[0] == candidate[0] and set(candidate) <= set(index)
+
+# ---------- statement analysis ----------
+
+def analyse(query, schema):
+    """
+    Classify the columns one statement uses, per table
+
+    Returns:
+        (aliases, usage) - alias -> table, and table -> {"eq", "lookup",
+        "order", "read"} column lists (lowercase names)
+    """
+    aliases = {a: t.lower() for a, t in _table_aliases(query).items() if t.lower() in schema.tables}
+    tables = set(aliases.values())
+    usage = {t: {"eq": [], "lookup": [], "order": [], "read": []} for t in tables}
+
+    def resolve(qualifier, name):
+        if qualifier:
+            table = aliases.get(qualifier.lower())
+            column = table and schema.column(table, name)
+            return (table, column) if column else None
+        owners = [t for t in tables if schema.column(t, name)]
+        return (owners[0], name.lower()) if len(owners) == 1 else None
+
+    def add(kind, qualifier, name):
+        found = resolve(qualifier, name)
+        if found and found[1] not in usage[found[0]][kind]:
+            usage[found[0]][kind].append(found[1])
+
+    text = re.sub(r"'(?:[^'\\]|\\.)*'", "''", query)
+    # Assignments and inserted values are not predicates
+    predicates = re.sub(r"\bSET\b.*?(?=\bWHERE\b|$)", " ", text, flags=re.IGNORECASE | re.DOTALL)
+    predicates = re.sub(r"\bINSERT\s+INTO\s+\w+\s*\([^)]*\)", " ", predicates, flags=re.IGNORECASE)
+
+    for qualifier, name in re.findall(r"\b(?:(\w+)\.)?(\w+)\s*=\s*(?:%s|\?|''|\d+\b)", predicates):
+        add("eq", qualifier, name)
+    for left_q, left, right_q, right in re.findall(r"\b(\w+)\.(\w+)\s*=\s*(\w+)\.(\w+)\b", predicates):
+        add("lookup", left_q, left)
+        add("lookup", right_q, right)
+    for qualifier, name in re.findall(r"\b(?:(\w+)\.)?(\w+)\s+IN\s*\(\s*SELECT\b", predicates, re.IGNORECASE):
+        add("lookup", qualifier, name)
+
+    order = re.search(r"\bORDER\s+BY\s+(.+?)(?:\bLIMIT\b|$)", text, re.IGNORECASE | re.DOTALL)
+    if order:
+        for item in order.group(1).split(","):
+            item = re.sub(r"\s+(?:ASC|DESC)\s*$", "", item.strip(), flags=re.IGNORECASE)
+            m = re.fullmatch(r"(?:(\w+)\.)?(\w+)", item)
+            if m:
+                add("order", m.group(1), m.group(2))
+
+    for qualifier, name in re.findall(r"\b(?:(\w+)\.)?(\w+)\b", text):
+        add("read", qualifier, name)
+    return aliases, usage
+
+def plan_accesses(plan):
+    """
+    Table accesses of an explain_plan() result
+
+    Returns:
+        List of (alias, "scan" | "search", columns used by the index, automatic)
+    """
+    accesses = []
+    if "sqlite_plan" in plan:
+        for detail in plan["sqlite_plan"]:
+            m = re.match(r"(SCAN|SEARCH) (\w+)(.*)", detail)
+            if not m:
+                continue
+            used = re.search(r"\((.*)\)\s*$", m.group(3))
+            columns = [re.split(r"[=<>]", part)[0].strip().lower()
+                       for part in used.group(1).split(" AND ")] if used else []
+            accesses.append((m.group(2), m.group(1).lower(), columns, "AUTOMATIC" in m.group(3)))
+        return accesses
+
+    def walk(node):
+        if isinstance(node, dict):
+            if "table_name" in node and "access_type" in node:
+                kind = "scan" if node["access_type"] in ("ALL", "index") else "search"
+                used = [c.lower() for c in node.get("used_key_parts", [])]
+                accesses.append((node["table_name"], kind, used, node.get("key") == "<auto_key0>"))
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+    walk(plan)
+    return accesses
+
+def propose(query, plan, schema):
+    """
+    Index proposals for one EXPLAINed statement
+
+    Returns:
+        List of (table, columns, reason)
+    """
+    aliases, usage = analyse(query, schema)
+    deleted = re.match(r"\s*DELETE\s+FROM\s+`?(\w+)", query, re.IGNORECASE)
+    proposals = []
+    for alias, kind, used, automatic in plan_accesses(plan):
+        table = aliases.get(alias.lower())
+        if table is None:
+            # A child table probed by a foreign key check of a DELETE
+            table = alias.lower()
+            parent = deleted and deleted.group(1).lower()
+            for column, references in schema.foreign_keys.get(table, []):
+                if references == parent:
+                    proposals.append((table, (column,), f"foreign key check from {parent}"))
+            continue
+
+        use = usage[table]
+        if kind == "search" and not automatic and all(c in used for c in use["eq"]):
+            continue
+        if not use["eq"] and not use["lookup"]:
+            # Unfiltered listings read the whole table anyway
+            continue
+        columns = []
+        for group in ("eq", "lookup", "order"):
+            columns.extend(c for c in use[group] if c not in columns)
+        rest = [c for c in use["read"] if c not in columns]
+        if rest and sum(schema.width(table, c) for c in rest) <= COVERING_MAX_BYTES:
+            columns.extend(rest)
+
+        reason = "temporary index" if automatic else "full scan" if kind == "scan" else "index misses predicate"
+        proposals.append((table, tuple(columns), reason))
+    return proposals
+
+def merge(proposals):
+    """Drop proposals another proposal on the same table already serves"""
+    kept = []
+    for table, columns, reasons in proposals:
+        if any(t == table and c != columns and _subsumes(c, columns) for t, c, _ in proposals):
+            continue
+        kept.append((table, columns, reasons))
+    return kept
+
+def index_name(table, columns):
+    return f"idx_{table}_{'_'.join(columns)}"[:64]
+
+def create_index_sql(schema, table, columns):
+    spelled = ", ".join(schema.spelled(table, c) for c in columns)
+    return f"CREATE INDEX {index_name(table, columns)} ON {schema.tables[table]} ({spelled})"
+
+# ---------- workflow ----------
+
+def capture_workload(cases):
+    """Run every case once and return the statements they issued"""
+    with query_log.capture() as samples:
+        for func in cases.values():
+            try:
+                func(CAPTURE_OFFSET)
+            except Exception as e:
+                print(f"  workload error: {e}")
+    return samples
+
+def time_workload(cases, iterations, offset):
+    return {name: benchmark.time_case(func, iterations, offset) for name, func in cases.items()}
+
+def advise(samples):
+    """
+    EXPLAIN the captured statements and create proposals until none are new
+
+    Returns:
+        List of (CREATE INDEX statement, [(statement name or SQL, reason)])
+    """
+    created = []
+    for _ in range(MAX_ROUNDS):
+        schema = Schema.load()
+        found = {}
+        conn = get_connection()
+        if not conn:
+            break
+        try:
+            for normalized, sample in samples.items():
+                plan = query_log.explain_plan(conn, sample["query"], sample["params"])
+                if not plan or "error" in plan:
+                    continue
+                for table, columns, reason in propose(sample["query"], plan, schema):
+                    if not schema.covered(table, columns):
+                        found.setdefault((table, columns), []).append((sample["name"] or normalized[:60], reason))
+        finally:
+            conn.close()
+
+        proposals = merge([(t, c, r) for (t, c), r in found.items()])
+        if not proposals:
+            break
+        for table, columns, reasons in proposals:
+            # Statements an absorbed proposal came from are served by this one
+            for (t, c), r in found.items():
+                if t == table and c != columns and _subsumes(columns, c):
+                    reasons = reasons + r
+            statement = create_index_sql(schema, table, columns)
+            result = run_query(statement)
+            if result is not True:
+                print(f"  ✗ {statement}: {result}")
+                continue
+            created.append((statement, reasons))
+    return created
+
+def report(created, before, after):
+    print("\nProposed indexes:")
+    if not created:
+        print("  (none - every captured statement is served by an index)")
+    for statement, reasons in created:
+        print(f"  {statement};")
+        for name, reason in sorted(set(reasons)):
+            print(f"      {reason:<44} {name}")
+
+    print(f"\n{'case':<36} {'p50 before':>11} {'after':>9} {'p95 before':>11} {'after':>9}")
+    for name in before:
+        b, a = before[name], after[name]
+        print(f"{name:<36} {b['p50_ms']:11.2f} {a['p50_ms']:9.2f} {b['p95_ms']:11.2f} {a['p95_ms']:9.2f}")
+
+def write_migration(path, created, before, after, jobs):
+    """Write the proposals as a migration file with the timings as comments"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    lines = [
+        f"-- {os.path.basename(path)}",
+        f"-- Generated by index_advisor on {jobs:,} seeded service jobs "
+        f"({DB_connecrtors.dialect}, {time.strftime('%Y-%m-%d')}).",
+        "--",
+        "-- Workload latency before -> after (ms):",
+        f"--   {'case':<36} {'p50':>15} {'p95':>17}",
+    ]
+    for name in before:
+        b, a = before[name], after[name]
+        lines.append(f"--   {name:<36} {b['p50_ms']:6.2f} -> {a['p50_ms']:6.2f}"
+                     f"   {b['p95_ms']:6.2f} -> {a['p95_ms']:6.2f}")
+    lines.append("")
+    for statement, reasons in created:
+        for name in sorted({n for n, _ in reasons}):
+            lines.append(f"-- {name}")
+        lines.append(f"{statement};")
+        lines.append("")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    print(f"\nMigration written to {path}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m index_advisor", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--db", default=DEFAULT_DB,
+                        help="backend URL: sqlite::memory:, sqlite:file.db or mysql (default %(default)s)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS, help="service jobs to seed (default %(default)s)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help="timed iterations per case, before and after (default %(default)s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-migrations", action="store_true",
+                        help="advise against Commands.sql alone (SQLite databases only)")
+    parser.add_argument("--migration", help="write the proposals to this migration file")
+    parser.add_argument("--allow-wipe", action="store_true", help="allow seeding (wiping) a MySQL database")
+    args = parser.parse_args(argv)
+
+    if not args.db.startswith("sqlite:") and not args.allow_wipe:
+        parser.error("seeding wipes every workshop table; pass --allow-wipe to advise on MySQL")
+
+    # Measure the database, not the result cache
+    DB_connecrtors.query_cache.max_entries = 0
+    DB_connecrtors.SQLITE_AUTO_MIGRATE = not args.no_migrations
+
+    if not initialize_connection_pool(args.db if args.db != "mysql" else None):
+        return 2
+    try:
+        print(f"\nSeeding {args.jobs:,} service jobs...")
+        workshop, _, _ = benchmark.seed_database(args.jobs, args.seed)
+        cases = benchmark.build_cases(workshop, random.Random(args.seed))
+
+        samples = capture_workload(cases)
+        print(f"\nCaptured {len(samples)} distinct statements; timing the workload...")
+        before = time_workload(cases, args.iterations, 0)
+
+        created = advise(samples)
+        after = time_workload(cases, args.iterations, benchmark.WARMUP_ITERATIONS + args.iterations)
+
+        report(created, before, after)
+        if args.migration and created:
+            write_migration(args.migration, created, before, after, args.jobs)
+    finally:
+        close_pool()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
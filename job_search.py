@@ -0,0 +1,147 @@
+"""
+job_search.py - Relevance-ranked full-text search over past jobs.
+
+Technicians look for earlier jobs with the same symptoms to reuse the fix.
+A job matches through its description or any of its complaints (the
+complaint text or the recorded fix); its score is the sum of the match
+scores, so a job matching in several places ranks higher.
+
+The text is matched through the FULLTEXT indexes of migration 005: MATCH
+... AGAINST in natural language mode on MySQL, the FTS5 tables (bm25,
+porter stemming) they translate to on SQLite. Never a LIKE '%...%' scan.
+
+    from job_search import search_jobs
+    page = search_jobs("engine knocking", page=1)
+"""
+
+import re
+
+import DB_connecrtors
+from DB_connecrtors import run_query
+
+SEARCH_PAGE_SIZE = 25
+# Words of the search text that are matched; the rest are ignored
+MAX_TERMS = 16
+
+# Matching jobs and their scores, best first; params (text, text, limit, offset)
+_MATCHES_SQL = {
+    "mysql": """
+    SELECT m.JobID, SUM(m.score) AS score
+    FROM (
+        SELECT Service_ID AS JobID, MATCH (Description) AGAINST (%s) AS score
+        FROM service_job
+        WHERE MATCH (Description) AGAINST (%s)
+        UNION ALL
+        SELECT JobID, MATCH (Complaints, Fixed) AGAINST (%s)
+        FROM complaints
+        WHERE MATCH (Complaints, Fixed) AGAINST (%s)
+    ) m
+    GROUP BY m.JobID
+    ORDER BY score DESC, m.JobID DESC
+    LIMIT %s OFFSET %s
+    """,
+    # bm25() is lower for better matches; the FTS rowids are the rowids of
+    # the indexed tables
+    "sqlite": """
+    SELECT m.JobID, SUM(m.score) AS score
+    FROM (
+        SELECT sj.Service_ID AS JobID, -bm25(ft_service_job_description) AS score
+        FROM ft_service_job_description
+        JOIN service_job sj ON sj.rowid = ft_service_job_description.rowid
+        WHERE ft_service_job_description MATCH %s
+        UNION ALL
+        SELECT c.JobID, -bm25(ft_complaints_text)
+        FROM ft_complaints_text
+        JOIN complaints c ON c.rowid = ft_complaints_text.rowid
+        WHERE ft_complaints_text MATCH %s
+    ) m
+    GROUP BY m.JobID
+    ORDER BY score DESC, m.JobID DESC
+    LIMIT %s OFFSET %s
+    """,
+}
+
+_JOBS_SQL = """
+SELECT
+    sj.Service_ID,
+    sj.Reg_No,
+    v.Make,
+    v.Model,
+    sj.Service_type,
+    sj.Description,
+    sj.Start_Date
+FROM service_job sj
+JOIN vehicle v ON sj.Reg_No = v.Reg_No
+WHERE sj.Service_ID IN ({ids})
+"""
+
+_COMPLAINTS_SQL = "SELECT JobID, Complaints, Fixed FROM complaints WHERE JobID IN ({ids})"
+
+def search_terms(text):
+    """Lower-cased distinct words of a search text (at most MAX_TERMS)"""
+    return list(dict.fromkeys(re.findall(r"\w+", (text or "").lower())))[:MAX_TERMS]
+
+def _match_params(terms):
+    """The text to match, in the backend's full-text query syntax"""
+    if DB_connecrtors.dialect == "sqlite":
+        # Each word as a quoted FTS5 string, any of them may match
+        text = " OR ".join(f'"{t}"' for t in terms)
+        return (text, text)
+    text = " ".join(terms)
+    return (text, text, text, text)
+
+def search_jobs(text, page=1, page_size=SEARCH_PAGE_SIZE):
+    """
+    Find jobs whose description, complaints or fixes match a text
+
+    Ranking has to score every match before the best can be picked, so a
+    page is an OFFSET into the ranked matches; a keyset would not save work.
+
+    Args:
+        text: Words to look for (e.g. "knocking", "AC not cooling")
+        page: 1-based page number
+    Returns:
+        - Dict {"rows": [...], "has_more": bool}; each row is a job
+          (Service_ID, Reg_No, Make, Model, Service_type, Description,
+          Start_Date) with its "score" and "complaints" (Complaints, Fixed)
+        - Error string if failed
+    """
+    terms = search_terms(text)
+    if not terms:
+        return {"rows": [], "has_more": False}
+
+    try:
+        params = _match_params(terms) + (page_size + 1, (max(page, 1) - 1) * page_size)
+        matches = run_query(_MATCHES_SQL[DB_connecrtors.dialect], params, fetch=True)
+        if isinstance(matches, str):
+            return matches
+        has_more = len(matches) > page_size
+        matches = matches[:page_size]
+        if not matches:
+            return {"rows": [], "has_more": False}
+
+        ids = [m["JobID"] for m in matches]
+        marks = ", ".join(["%s"] * len(ids))
+        jobs = run_query(_JOBS_SQL.format(ids=marks), ids, fetch=True)
+        complaints = run_query(_COMPLAINTS_SQL.format(ids=marks), ids, fetch=True)
+        for result in (jobs, complaints):
+            if isinstance(result, str):
+                return result
+
+        by_job = {}
+        for c in complaints:
+            by_job.setdefault(c["JobID"], []).append({"Complaints": c["Complaints"], "Fixed": c["Fixed"]})
+        details = {job["Service_ID"]: job for job in jobs}
+
+        rows = []
+        for m in matches:
+            job = details.get(m["JobID"])
+            if job is None:
+                # Deleted between the two queries
+                continue
+            rows.append(dict(job, score=float(m["score"]), complaints=by_job.get(m["JobID"], [])))
+        return {"rows": rows, "has_more": has_more}
+
+    except Exception as e:
+        print(f"Error searching jobs: {e}")
+        return str(e)
@@ -0,0 +1,137 @@
+"""
+migrate.py - Apply schema migrations on top of Commands.sql.
+
+Commands.sql creates the base schema; later schema changes live in
+migrations/NNN_description.sql, written in MySQL syntax. Applied versions
+are recorded in the schema_migrations table, so each file runs once:
+
+    python migrate.py                        # MySQL (prompts for the password)
+    python migrate.py --db sqlite:workshop.db
+    python migrate.py --status
+
+SQLite databases opened through DB_connecrtors are migrated automatically;
+their migration files are translated with sqlite_backend.translate_schema.
+"""
+
+import argparse
+import os
+import sys
+
+from mysql.connector import Error
+from sqlite_backend import split_statements, translate_schema
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+_TRACKING_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(100) NOT NULL PRIMARY KEY,
+    applied_at DATETIME NOT NULL
+)
+"""
+
+def available_migrations(directory=MIGRATIONS_DIR):
+    """(version, path) of every migration file, in the order they apply"""
+    if not os.path.isdir(directory):
+        return []
+    return [
+        (name[:-len(".sql")], os.path.join(directory, name))
+        for name in sorted(os.listdir(directory))
+        if name.endswith(".sql")
+    ]
+
+def applied_versions(conn):
+    """Set of versions already applied on conn's database"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(_TRACKING_TABLE)
+        cursor.execute("SELECT version FROM schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+def pending_migrations(conn, directory=MIGRATIONS_DIR):
+    """(version, path) of the migrations not yet applied"""
+    applied = applied_versions(conn)
+    return [(v, path) for v, path in available_migrations(directory) if v not in applied]
+
+def _statements(conn, text):
+    """Statements of a migration file for conn's backend, plus skipped objects"""
+    if getattr(conn, "dialect", "mysql") == "sqlite":
+        return translate_schema(text)
+    return split_statements(text), []
+
+def apply_migrations(conn, directory=MIGRATIONS_DIR, verbose=True):
+    """
+    Apply pending migrations in order
+
+    On SQLite each migration runs in one transaction. MySQL commits DDL
+    implicitly, so a failed migration can leave earlier statements of the
+    same file applied; it is not recorded and the error is raised.
+
+    Returns:
+        List of versions applied
+    Raises:
+        mysql.connector.Error if a statement fails
+    """
+    sqlite = getattr(conn, "dialect", "mysql") == "sqlite"
+    done = []
+    for version, path in pending_migrations(conn, directory):
+        with open(path, encoding="utf-8") as f:
+            statements, skipped = _statements(conn, f.read())
+
+        cursor = conn.cursor()
+        try:
+            if sqlite:
+                conn.start_transaction()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, applied_at) VALUES (%s, NOW())", (version,)
+            )
+            conn.commit()
+        except Error:
+            if sqlite:
+                conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+        done.append(version)
+        if verbose:
+            note = f" (skipped {', '.join(skipped)})" if skipped else ""
+            print(f"  ✓ Applied migration {version}{note}")
+    return done
+
+def main(argv=None):
+    from DB_connecrtors import initialize_connection_pool, get_connection, close_pool
+
+    parser = argparse.ArgumentParser(description="Apply workshop schema migrations")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--status", action="store_true", help="list pending migrations without applying them")
+    args = parser.parse_args(argv)
+
+    if not initialize_connection_pool(args.db):
+        return 1
+    conn = get_connection()
+    if not conn:
+        close_pool()
+        return 1
+    try:
+        if args.status:
+            pending = pending_migrations(conn)
+            for version, _ in pending:
+                print(f"  pending {version}")
+            print(f"{len(pending)} pending migration(s)")
+        else:
+            done = apply_migrations(conn)
+            print(f"{len(done)} migration(s) applied")
+        return 0
+    except Error as e:
+        print(f"✗ Migration failed: {e}")
+        return 1
+    finally:
+        conn.close()
+        close_pool()
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+-- 001_hot_path_indexes.sql
+-- Generated by index_advisor on 100,000 seeded service jobs (sqlite, 2026-10-18).
+--
+-- Workload latency before -> after (ms):
+--   case                                             p50               p95
+--   tech.get_jobs_for_technician          16.90 ->   6.96    19.13 ->   9.13
+--   tech.get_job_details                  10.38 ->   0.15    12.04 ->   0.17
+--   tech.get_complaints_for_job            8.99 ->   0.04     9.88 ->   0.05
+--   tech.get_parts_for_job                 9.28 ->   0.05     9.87 ->   0.06
+--   tech.get_total_parts_cost              9.26 ->   0.04     9.99 ->   0.04
+--   tech.add_complaint_for_job             0.06 ->   0.06     0.10 ->   0.12
+--   tech.add_parts_for_job                 0.09 ->   0.13     0.12 ->   0.46
+--   manager.get_all_technicians            1.62 ->   1.51     1.71 ->   1.68
+--   manager.get_all_customer_reps          0.36 ->   0.32     0.38 ->   0.46
+--   manager.get_techs_by_part             40.99 ->   2.35    49.96 ->   8.14
+--   manager.add_new_technician             0.07 ->   0.06     0.08 ->   0.07
+--   manager.delete_technician             19.42 ->   0.04    20.07 ->   0.05
+--   manager.add_new_customer_rep           0.05 ->   0.05     0.10 ->   0.06
+--   manager.delete_customer_rep           37.50 ->   0.04    40.70 ->   0.05
+--   customer.customer_login                0.05 ->   0.04     0.06 ->   0.05
+--   customer.get_customer_vehicles         7.90 ->   0.05     9.01 ->   0.07
+--   customer.view_service_status         201.35 ->   0.09   239.68 ->   0.19
+--   rep.technician_picklist                0.43 ->   0.72     0.55 ->   0.88
+--   rep.page_customers                     0.13 ->   0.22     0.17 ->   0.28
+--   rep.create_job_with_assignment         0.15 ->   0.39     0.24 ->   1.09
+--   rep.assign_technician_to_job           0.07 ->   0.25     0.13 ->   0.73
+
+-- delete_technician
+-- get_jobs_for_technician
+CREATE INDEX idx_done_by_techid_jobid ON Done_By (TechID, JobID);
+
+-- get_complaints_for_job
+CREATE INDEX idx_complaints_jobid ON complaints (JobID);
+
+-- get_job_details
+-- get_parts_for_job
+-- get_total_parts_cost
+CREATE INDEX idx_parts_jobid_part_no_quantity_price ON parts (JobID, Part_No, Quantity, Price);
+
+-- get_techs_by_part
+CREATE INDEX idx_done_by_jobid_techid ON Done_By (JobID, TechID);
+
+-- get_techs_by_part
+CREATE INDEX idx_parts_part_no_jobid ON parts (Part_No, JobID);
+
+-- delete_technician
+CREATE INDEX idx_assigns_techid ON assigns (TechID);
+
+-- delete_customer_rep
+CREATE INDEX idx_assigns_empid ON assigns (EmpID);
+
+-- delete_customer_rep
+CREATE INDEX idx_service_job_empid ON service_job (EmpID);
+
+-- delete_customer_rep
+CREATE INDEX idx_vehicle_empid ON vehicle (EmpID);
+
+-- delete_customer_rep
+CREATE INDEX idx_customers_empid ON customers (empID);
+
+-- get_customer_service_status
+CREATE INDEX idx_service_job_reg_no_start_date ON service_job (Reg_no, Start_date);
+
+-- get_customer_service_status
+-- get_customer_vehicles
+CREATE INDEX idx_vehicle_customerid_reg_no_make_model ON vehicle (CustomerID, Reg_No, Make, Model);
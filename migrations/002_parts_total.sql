@@ -0,0 +1,69 @@
+-- 002_parts_total.sql
+-- Denormalised parts cost per job, kept exact by triggers on parts, so job
+-- detail and cost lookups read one service_job row instead of summing parts.
+
+ALTER TABLE service_job ADD COLUMN parts_total INT NOT NULL DEFAULT 0;
+
+UPDATE service_job
+SET parts_total = (
+    SELECT COALESCE(SUM(parts.Quantity * parts.Price), 0)
+    FROM parts
+    WHERE parts.JobID = service_job.Service_ID
+);
+
+
+DELIMITER $$
+
+-- A NULL quantity contributes nothing, as it does to SUM(Quantity * Price)
+CREATE TRIGGER parts_total_after_insert
+AFTER INSERT ON parts
+FOR EACH ROW
+BEGIN
+    UPDATE service_job
+    SET parts_total = parts_total + COALESCE(NEW.Quantity, 0) * NEW.Price
+    WHERE Service_ID = NEW.JobID;
+END$$
+
+CREATE TRIGGER parts_total_after_update
+AFTER UPDATE ON parts
+FOR EACH ROW
+BEGIN
+    UPDATE service_job
+    SET parts_total = parts_total - COALESCE(OLD.Quantity, 0) * OLD.Price
+    WHERE Service_ID = OLD.JobID;
+    UPDATE service_job
+    SET parts_total = parts_total + COALESCE(NEW.Quantity, 0) * NEW.Price
+    WHERE Service_ID = NEW.JobID;
+END$$
+
+CREATE TRIGGER parts_total_after_delete
+AFTER DELETE ON parts
+FOR EACH ROW
+BEGIN
+    UPDATE service_job
+    SET parts_total = parts_total - COALESCE(OLD.Quantity, 0) * OLD.Price
+    WHERE Service_ID = OLD.JobID;
+END$$
+
+DELIMITER ;
+
+
+-- UpdateTotalJobCost used to add the parts sum onto Predicted_cost, so every
+-- call counted the parts again. It now recomputes parts_total from parts (a
+-- repair for rows changed with triggers disabled) and is safe to repeat.
+DROP PROCEDURE IF EXISTS UpdateTotalJobCost;
+
+DELIMITER $$
+
+CREATE PROCEDURE UpdateTotalJobCost(IN p_JobID INT)
+BEGIN
+    UPDATE service_job
+    SET parts_total = (
+        SELECT COALESCE(SUM(Quantity * Price), 0)
+        FROM parts
+        WHERE JobID = p_JobID
+    )
+    WHERE Service_ID = p_JobID;
+END$$
+
+DELIMITER ;
@@ -0,0 +1,114 @@
+-- 003_analytics_rollups.sql
+-- Daily and monthly revenue / duration rollups per technician and per
+-- service type for the Manager analytics panel. Triggers queue the start
+-- days of new and changed jobs in rollup_dirty_days; rollups.py recomputes
+-- just those days (and their months).
+--
+-- revenue       = Predicted_cost + parts_total of the jobs started that day
+-- duration_days = sum of predicted job lengths, over timed_jobs jobs that
+--                 have a predicted end date
+
+CREATE TABLE rollup_dirty_days (
+    day DATE NOT NULL PRIMARY KEY
+);
+
+CREATE TABLE rollup_tech_daily (
+    day DATE NOT NULL,
+    TechID VARCHAR(10) NOT NULL,
+    jobs INT NOT NULL,
+    revenue BIGINT NOT NULL,
+    duration_days BIGINT NOT NULL,
+    timed_jobs INT NOT NULL,
+    PRIMARY KEY (day, TechID)
+);
+
+CREATE TABLE rollup_service_daily (
+    day DATE NOT NULL,
+    Service_type VARCHAR(30) NOT NULL,
+    jobs INT NOT NULL,
+    revenue BIGINT NOT NULL,
+    duration_days BIGINT NOT NULL,
+    timed_jobs INT NOT NULL,
+    PRIMARY KEY (day, Service_type)
+);
+
+-- month is the first day of the month
+CREATE TABLE rollup_tech_monthly (
+    month DATE NOT NULL,
+    TechID VARCHAR(10) NOT NULL,
+    jobs INT NOT NULL,
+    revenue BIGINT NOT NULL,
+    duration_days BIGINT NOT NULL,
+    timed_jobs INT NOT NULL,
+    PRIMARY KEY (month, TechID)
+);
+
+CREATE TABLE rollup_service_monthly (
+    month DATE NOT NULL,
+    Service_type VARCHAR(30) NOT NULL,
+    jobs INT NOT NULL,
+    revenue BIGINT NOT NULL,
+    duration_days BIGINT NOT NULL,
+    timed_jobs INT NOT NULL,
+    PRIMARY KEY (month, Service_type)
+);
+
+-- Refreshing a day reads that day's jobs
+CREATE INDEX idx_service_job_start_date ON service_job (Start_date);
+
+
+DELIMITER $$
+
+CREATE TRIGGER rollup_job_after_insert
+AFTER INSERT ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day) VALUES (NEW.Start_date);
+END$$
+
+-- Also fires for parts changes, through the parts_total triggers
+CREATE TRIGGER rollup_job_after_update
+AFTER UPDATE ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day) VALUES (OLD.Start_date);
+    INSERT IGNORE INTO rollup_dirty_days (day) VALUES (NEW.Start_date);
+END$$
+
+CREATE TRIGGER rollup_job_after_delete
+AFTER DELETE ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day) VALUES (OLD.Start_date);
+END$$
+
+CREATE TRIGGER rollup_done_by_after_insert
+AFTER INSERT ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day)
+    SELECT Start_date FROM service_job WHERE Service_ID = NEW.JobID;
+END$$
+
+CREATE TRIGGER rollup_done_by_after_update
+AFTER UPDATE ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day)
+    SELECT Start_date FROM service_job WHERE Service_ID IN (OLD.JobID, NEW.JobID);
+END$$
+
+CREATE TRIGGER rollup_done_by_after_delete
+AFTER DELETE ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO rollup_dirty_days (day)
+    SELECT Start_date FROM service_job WHERE Service_ID = OLD.JobID;
+END$$
+
+DELIMITER ;
+
+
+-- Existing jobs are rolled up by the first refresh
+INSERT INTO rollup_dirty_days (day)
+SELECT DISTINCT Start_date FROM service_job;
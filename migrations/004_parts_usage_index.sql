@@ -0,0 +1,8 @@
+-- 004_parts_usage_index.sql
+-- "Find Techs by Part" sums Quantity over the parts rows of a part number
+-- list or prefix range; with Quantity in the index that range is read from
+-- the index alone. Replaces idx_parts_part_no_jobid from 001.
+
+CREATE INDEX idx_parts_part_no_jobid_quantity ON parts (Part_No, JobID, Quantity);
+
+DROP INDEX idx_parts_part_no_jobid ON parts;
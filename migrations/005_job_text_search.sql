@@ -0,0 +1,8 @@
+-- 005_job_text_search.sql
+-- Full-text indexes for the technician job search (job_search.py): the
+-- complaint and fix texts of complaints and the job description. On SQLite
+-- each becomes an FTS5 table of the same name kept in sync by triggers.
+
+CREATE FULLTEXT INDEX ft_complaints_text ON complaints (Complaints, Fixed);
+
+CREATE FULLTEXT INDEX ft_service_job_description ON service_job (Description);
@@ -0,0 +1,12 @@
+-- 006_typeahead_indexes.sql
+-- Prefix indexes for the rep view typeahead (typeahead.py): LIKE 'abc%'
+-- on customer name and email and a range on phone number are index range
+-- scans. Reg_No prefixes use the vehicle primary key and technicians are
+-- held in memory. On SQLite a prefix index becomes a NOCASE index so LIKE
+-- can use it (MySQL's default collation is already case-insensitive).
+
+CREATE INDEX idx_customers_name_prefix ON customers (Name(20));
+
+CREATE INDEX idx_customers_email_prefix ON customers (email_ID(20));
+
+CREATE INDEX idx_customers_phone ON customers (Phone_no);
@@ -0,0 +1,110 @@
+-- 007_job_change_log.sql
+-- Row-version tracking for delta sync (delta_sync.py). Every insert, update
+-- and delete on service_job, Done_By, parts and complaints appends the
+-- affected job to job_changes; change_id is the row version. Open job lists
+-- keep the highest change_id they have seen (their watermark) and on
+-- refresh re-read only the jobs changed after it.
+--
+-- Old entries are removed with delta_sync.prune_changes(); a list whose
+-- watermark is older than the oldest entry reloads in full.
+
+CREATE TABLE job_changes (
+    change_id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    JobID INT,
+    changed_at DATETIME NOT NULL
+);
+
+CREATE INDEX idx_job_changes_changed_at ON job_changes (changed_at);
+
+
+DELIMITER $$
+
+CREATE TRIGGER job_changes_service_job_after_insert
+AFTER INSERT ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.Service_ID, NOW());
+END$$
+
+-- Also fires for parts changes, through the parts_total triggers
+CREATE TRIGGER job_changes_service_job_after_update
+AFTER UPDATE ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.Service_ID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_service_job_after_delete
+AFTER DELETE ON service_job
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.Service_ID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_done_by_after_insert
+AFTER INSERT ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_done_by_after_update
+AFTER UPDATE ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_done_by_after_delete
+AFTER DELETE ON Done_By
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_parts_after_insert
+AFTER INSERT ON parts
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_parts_after_update
+AFTER UPDATE ON parts
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_parts_after_delete
+AFTER DELETE ON parts
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_complaints_after_insert
+AFTER INSERT ON complaints
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_complaints_after_update
+AFTER UPDATE ON complaints
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+    INSERT INTO job_changes (JobID, changed_at) VALUES (NEW.JobID, NOW());
+END$$
+
+CREATE TRIGGER job_changes_complaints_after_delete
+AFTER DELETE ON complaints
+FOR EACH ROW
+BEGIN
+    INSERT INTO job_changes (JobID, changed_at) VALUES (OLD.JobID, NOW());
+END$$
+
+DELIMITER ;
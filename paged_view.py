@@ -0,0 +1,211 @@
+import customtkinter as ctk
+from DB_connecrtors import stream_query
+from query_registry import sql
+from pagination import KeysetPager, fetch_page, DEFAULT_PAGE_SIZE, PAGE_SIZES
+
+# Page size menu entry that streams the whole listing into the table instead
+ALL_ROWS = "All"
+
+_TECHNICIAN_COLUMNS = [
+    ("technician_ID", "ID", 110),
+    ("Fname", "First Name", 130),
+    ("Name", "Last Name", 130),
+    ("Trained_For", "Trained For", 150),
+    ("Specialization", "Specialization", 150),
+    ("YOE", "Experience (yrs)", 120),
+]
+
+# DataTable columns of each query_registry.PAGED_LISTINGS listing
+LISTING_COLUMNS = {
+    "customers": [
+        ("Customer_ID", "ID", 110),
+        ("Name", "Name", 200),
+        ("email_ID", "Email", 250),
+        ("Phone_no", "Phone", 130),
+    ],
+    "technicians": _TECHNICIAN_COLUMNS,
+    "technicians_by_name": _TECHNICIAN_COLUMNS,
+    "customer_reps_by_name": [
+        ("Employee_ID", "Employee ID", 120),
+        ("Name", "Name", 220),
+        ("Phone_Number", "Phone", 140),
+        ("YOE", "Experience (yrs)", 120),
+    ],
+}
+
+class PagedListMixin:
+    """
+    Prev/next page controls for views that mix in AsyncViewMixin
+
+    open_listing() starts a listing at page 1; the bar then moves through it
+    with keyset pagination. Only one listing is active per view at a time.
+    Pages are shown in the view's DataTable (self.table); change events can
+    patch the page on screen through patch_page(). Views that also mix in
+    ExportMixin export the whole listing, not only the page shown.
+    """
+
+    def init_paging(self):
+        """Set up paging state (call before build_ui)"""
+        self.pager = None
+        self._page_title = ""
+        self._page_rows = None
+        self.page_size = DEFAULT_PAGE_SIZE
+
+    def build_pager_bar(self, parent):
+        """Create the page controls and return their frame"""
+        bar = ctk.CTkFrame(parent, fg_color="transparent")
+
+        self.prev_btn = ctk.CTkButton(bar, text="◀ Prev", width=80, state="disabled",
+                                      command=lambda: self.load_page("prev"))
+        self.prev_btn.pack(side="left", padx=5)
+
+        self.page_label = ctk.CTkLabel(bar, text="", width=90)
+        self.page_label.pack(side="left", padx=5)
+
+        self.next_btn = ctk.CTkButton(bar, text="Next ▶", width=80, state="disabled",
+                                      command=lambda: self.load_page("next"))
+        self.next_btn.pack(side="left", padx=5)
+
+        ctk.CTkLabel(bar, text="Rows per page:").pack(side="left", padx=(15, 5))
+        self.page_size_menu = ctk.CTkOptionMenu(
+            bar,
+            values=[str(n) for n in PAGE_SIZES] + [ALL_ROWS],
+            width=80,
+            command=self.change_page_size
+        )
+        self.page_size_menu.set(str(self.page_size))
+        self.page_size_menu.pack(side="left", padx=5)
+        return bar
+
+    def open_listing(self, listing, title):
+        """
+        Show page 1 of a listing
+
+        Args:
+            listing: Key of query_registry.PAGED_LISTINGS (and LISTING_COLUMNS)
+            title: Heading shown above each page
+        """
+        self._page_title = title
+        if self.page_size is None:
+            self._stream_listing(listing)
+            return
+        self.pager = KeysetPager(listing, self.page_size)
+        self.load_page("first")
+
+    def change_page_size(self, value):
+        """Page size changed - restart the active listing from page 1 (or stream all of it)"""
+        self.page_size = None if value == ALL_ROWS else int(value)
+        if self.pager is not None:
+            self.open_listing(self.pager.listing, self._page_title)
+
+    def load_page(self, direction):
+        """Fetch the first/next/prev page of the active listing in the background"""
+        pager = self.pager
+        if pager is None:
+            return
+        args = pager.request(direction)
+        if args is None:
+            return
+
+        self.run_async(
+            "list", fetch_page, *args,
+            on_done=lambda page: self._show_page(pager, direction, page),
+            busy_text="Loading page..."
+        )
+
+    def _show_page(self, pager, direction, page):
+        """Render a fetched page (Tk thread)"""
+        if pager is not self.pager:
+            # Another listing was opened meanwhile
+            return
+
+        if isinstance(page, str):
+            self.show_error(page)
+            return
+
+        rows = pager.apply(direction, page)
+        if rows is not None:
+            self._render_page(rows)
+
+        self._refresh_pager_bar()
+
+    def _stream_listing(self, listing):
+        """Show every row of a listing, streamed into the table batch by batch"""
+        pager = KeysetPager(listing, DEFAULT_PAGE_SIZE)
+        self.pager = pager
+        self._page_rows = []
+        self.table.set_rows(self._page_rows, title=self._page_heading(), source=pager,
+                            columns=LISTING_COLUMNS[listing], message="Loading...")
+        self._refresh_pager_bar()
+
+        def done(total):
+            if self.table.source is pager:
+                self.table.finish_append(message="No records found.")
+
+        def failed(error):
+            if self.table.source is pager:
+                self.table.finish_append()
+            self.show_error(error)
+
+        self.run_stream("list", lambda: stream_query(sql(f"all_{listing}")),
+                        on_batch=self.table.append_rows, on_done=done, on_error=failed,
+                        busy_text="Loading rows...")
+
+    def _render_page(self, rows, keep_view=False):
+        """Show a page of rows in the table"""
+        self._page_rows = rows
+        self.table.set_rows(rows, title=self._page_heading(),
+                            source=self.pager, columns=LISTING_COLUMNS[self.pager.listing], keep_view=keep_view)
+
+    def _page_heading(self):
+        if self.page_size is None:
+            return f"{self._page_title} - all rows"
+        return f"{self._page_title} - page {self.pager.page_number}"
+
+    def _page_on_screen(self):
+        """True if the table still shows the last rendered page"""
+        return self._page_rows is not None and self.table.source is self.pager
+
+    def export_source(self):
+        """Export every row of the listing on screen (falls back to the view's own export_source)"""
+        if self._page_on_screen():
+            listing = self.pager.listing
+            return listing, lambda columns: stream_query(sql(f"all_{listing}"), columns=columns)
+        return super().export_source()
+
+    def patch_page(self, listings, id_column, entity_id, row=None):
+        """
+        Apply an added / deleted row to the page on screen without a query
+
+        Args:
+            listings: Listings the change belongs to (other listings are left alone)
+            id_column: Column identifying the entity
+            entity_id: The changed entity; its row is removed from the page
+            row: The entity's new row (None for a delete); it is shown if its
+                 sort key falls within the page
+        """
+        pager = self.pager
+        if pager is None or pager.listing not in listings or not self._page_on_screen():
+            return
+
+        rows = [r for r in self._page_rows if str(r[id_column]) != str(entity_id)]
+        if row is not None:
+            key = pager.sort_key(row)
+            after_first = not rows or not pager.has_prev or key >= pager.sort_key(rows[0])
+            before_last = not rows or not pager.has_next or key <= pager.sort_key(rows[-1])
+            if after_first and before_last:
+                rows.append(row)
+                rows.sort(key=pager.sort_key)
+
+        if rows != self._page_rows:
+            self._render_page(rows, keep_view=True)
+
+    def _refresh_pager_bar(self):
+        """Sync the page label and button states with the pager"""
+        pager = self.pager
+        if self.page_size is None:
+            self.page_label.configure(text="All rows")
+        else:
+            self.page_label.configure(text=f"Page {pager.page_number}" if pager.page_number else "")
+        self.prev_btn.configure(state="normal" if pager.has_prev else "disabled")
+        self.next_btn.configure(state="normal" if pager.has_next else "disabled")
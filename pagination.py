@@ -0,0 +1,122 @@
+"""
+pagination.py - Keyset (seek) pagination for the list views.
+
+Pages are fetched with WHERE (sort keys) > (last row's keys) ... LIMIT n
+instead of OFFSET, so page N costs the same index seek as page 1 no matter
+how large the table grows. Listings are defined in query_registry.PAGED_LISTINGS.
+"""
+
+from query_registry import PAGED_LISTINGS, run_named
+
+DEFAULT_PAGE_SIZE = 50
+PAGE_SIZES = (25, 50, 100, 200)
+
+# Small, rarely-written staff listings whose pages are served from the
+# result cache (writes to their tables invalidate the cached pages)
+CACHED_LISTINGS = {"technicians", "technicians_by_name", "customer_reps_by_name"}
+
+def fetch_page(listing, page_size=DEFAULT_PAGE_SIZE, after=None, before=None):
+    """
+    Fetch one page of a listing
+
+    Args:
+        listing: Key of query_registry.PAGED_LISTINGS
+        after: Sort key tuple of the last row seen (next page)
+        before: Sort key tuple of the first row seen (previous page)
+
+    Returns:
+        - Dict {"rows": [...] in ascending order, "has_more": bool} where
+          has_more says whether another page exists in that direction
+        - Error string if failed
+    """
+    # Ask for one extra row to learn whether another page exists
+    limit = page_size + 1
+    cache = listing in CACHED_LISTINGS
+
+    if after is not None:
+        result = run_named(f"page_{listing}_after", (*after, limit), fetch=True, cache=cache)
+    elif before is not None:
+        result = run_named(f"page_{listing}_before", (*before, limit), fetch=True, cache=cache)
+    else:
+        result = run_named(f"page_{listing}_first", (limit,), fetch=True, cache=cache)
+
+    if isinstance(result, str):
+        return result
+
+    rows = list(result)
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if before is not None:
+        rows.reverse()
+
+    return {"rows": rows, "has_more": has_more}
+
+class KeysetPager:
+    """
+    Tracks the position of one paginated listing
+
+    Lives on the Tk thread: request() gives the arguments for fetch_page
+    (run on a worker), apply() folds the fetched page back in. Keeping the
+    two apart means a superseded fetch can never corrupt the position.
+    """
+
+    def __init__(self, listing, page_size=DEFAULT_PAGE_SIZE):
+        self.listing = listing
+        self.page_size = page_size
+        self.keys = PAGED_LISTINGS[listing][1]
+        self.page_number = 0
+        self.has_prev = False
+        self.has_next = False
+        self._first_key = None
+        self._last_key = None
+
+    def sort_key(self, row):
+        """A row's sort key tuple"""
+        return tuple(row[k] for k in self.keys)
+
+    def request(self, direction):
+        """
+        Arguments for fetch_page to move in a direction ("first", "next", "prev")
+
+        Returns:
+            Tuple of fetch_page positional args, or None if there is no page there
+        """
+        if direction == "next":
+            if not self.has_next:
+                return None
+            return (self.listing, self.page_size, self._last_key, None)
+        if direction == "prev":
+            if not self.has_prev:
+                return None
+            return (self.listing, self.page_size, None, self._first_key)
+        return (self.listing, self.page_size, None, None)
+
+    def apply(self, direction, page):
+        """Update the position from a fetched page and return its rows"""
+        rows = page["rows"]
+        if not rows and direction != "first":
+            # Rows vanished under us (deleted meanwhile) - stay where we are
+            if direction == "next":
+                self.has_next = False
+            else:
+                self.has_prev = False
+            return None
+
+        if direction == "first":
+            self.page_number = 1
+            self.has_prev = False
+            self.has_next = page["has_more"]
+        elif direction == "next":
+            self.page_number += 1
+            self.has_prev = True
+            self.has_next = page["has_more"]
+        else:
+            self.page_number = max(1, self.page_number - 1)
+            self.has_next = True
+            self.has_prev = page["has_more"]
+
+        if rows:
+            self._first_key = self.sort_key(rows[0])
+            self._last_key = self.sort_key(rows[-1])
+        return rows
@@ -1,230 +1,429 @@
-
 """
-populate_db.py — Populate vehicle_workshop_management with sample data.
+populate_db.py — Populate vehicle_workshop_management with data.
 
-- Connects to MySQL database.
+- Connects through DB_connecrtors (MySQL, or SQLite via --db / WORKSHOP_DB).
 - Truncates tables (deletes data only).
-- Inserts at least 6 valid rows into each table.
-- Runs quietly unless an error occurs.
+- Loads the sample rows by default, bulk-loads <table>.csv files from
+  --csv-dir (LOAD DATA LOCAL INFILE on MySQL), or streams synthetic data
+  for --generate JOBS straight into the loader (see datagen.py).
+- Bulk loading commits per chunk of rows with foreign key / unique checks
+  relaxed, and loads independent tables in parallel in foreign key order.
+- Reports progress and rows/s per table.
+
+CSV files have a header row naming the columns, \n line endings, and NULL
+written as \\N (LOAD DATA's default escaping).
 """
 
-import mysql.connector as mysql
+import argparse
+import csv
+import os
 import sys
-import getpass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import mysql.connector as mysql
+import DB_connecrtors
+from DB_connecrtors import initialize_connection_pool, get_connection, close_pool, pool_stats
+from datagen import SyntheticWorkshop
+
+# Rows per INSERT batch / commit
+CHUNK_ROWS = 5_000
+# Tables loaded at the same time (within one dependency level)
+LOAD_WORKERS = 4
+# Seconds between progress lines per table
+PROGRESS_INTERVAL = 2.0
+CSV_NULL = "\\N"
+
+TABLE_COLUMNS = {
+    "service_technician": ("technician_ID", "Fname", "Name", "Trained_For", "Specialization", "YOE"),
+    "customer_reps": ("Employee_ID", "Name", "Phone_Number", "YOE"),
+    "customers": ("Customer_ID", "Name", "email_ID", "Phone_no", "license_No", "Age", "First_Joined", "empID"),
+    "vehicle": ("Reg_No", "Make", "Model", "Year", "Chassis_No", "Body_type", "CustomerID", "EmpID"),
+    "service_job": ("Service_ID", "Start_Date", "Reg_No", "Service_type", "Description",
+                    "Predicted_End_date", "Predicted_Cost", "EmpID"),
+    "complaints": ("JobID", "Complaints", "Fixed"),
+    "parts": ("JobID", "Part_No", "Quantity", "Price"),
+    "needs": ("RegNum", "JobID"),
+    "Done_By": ("JobID", "TechID"),
+    "assigns": ("JobID", "EmpID", "TechID"),
+}
+
+# Foreign key dependency levels: a table only references tables in earlier
+# levels, so the tables of one level can be loaded in parallel
+LOAD_LEVELS = (
+    ("service_technician", "customer_reps"),
+    ("customers",),
+    ("vehicle",),
+    ("service_job",),
+    ("complaints", "parts", "needs", "Done_By", "assigns"),
+)
+
+def insert_statement(table):
+    """INSERT statement for one row of a table"""
+    columns = TABLE_COLUMNS[table]
+    marks = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({marks})"
+
+class LoadProgress:
+    """Thread-safe per-table row counters with throttled progress lines"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.tables = {}   # table -> [rows, started, last report]
+
+    def start(self, table):
+        with self._lock:
+            now = time.perf_counter()
+            self.tables[table] = [0, now, now]
+
+    def add(self, table, rows):
+        with self._lock:
+            entry = self.tables[table]
+            entry[0] += rows
+            now = time.perf_counter()
+            if now - entry[2] >= PROGRESS_INTERVAL:
+                entry[2] = now
+                print(f"    {table}: {entry[0]:,} rows ({entry[0] / (now - entry[1]):,.0f} rows/s)")
+
+    def finish(self, table):
+        with self._lock:
+            rows, started, _ = self.tables[table]
+            seconds = time.perf_counter() - started
+            rate = rows / seconds if seconds else 0.0
+            print(f"  ✓ {table}: {rows:,} rows in {seconds:.1f}s ({rate:,.0f} rows/s)")
 
-HOST = "localhost"
-USER = "root"
-DATABASE = "vehicle_workshop_management"
+    def total_rows(self):
+        with self._lock:
+            return sum(entry[0] for entry in self.tables.values())
+
+@contextmanager
+def relaxed_checks(conn, enabled=True):
+    """Turn off foreign key / unique checks on one connection for the block"""
+    if not enabled:
+        yield
+        return
+
+    sqlite = getattr(conn, "dialect", "mysql") == "sqlite"
+    cursor = conn.cursor()
+    try:
+        if sqlite:
+            cursor.execute("PRAGMA foreign_keys = OFF")
+        else:
+            cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+        yield
+    finally:
+        # Pooled connection - always restore the session before it goes back
+        if sqlite:
+            cursor.execute("PRAGMA foreign_keys = ON")
+        else:
+            cursor.execute("SET SESSION foreign_key_checks = 1, unique_checks = 1")
+        cursor.close()
+
+def bulk_insert(conn, table, rows, chunk_rows=CHUNK_ROWS, progress=None):
+    """
+    Insert rows with one executemany (a multi-row INSERT) and commit per chunk
+
+    Args:
+        rows: Any iterable of tuples in TABLE_COLUMNS order; consumed lazily
+    Returns:
+        Number of rows inserted
+    """
+    statement = insert_statement(table)
+    cursor = conn.cursor()
+    total = 0
+    chunk = []
+
+    def flush():
+        conn.start_transaction()
+        try:
+            cursor.executemany(statement, chunk)
+            conn.commit()
+        except mysql.Error:
+            conn.rollback()
+            raise
+        if progress:
+            progress.add(table, len(chunk))
 
-def connect_db():
-    """Connect to database with password prompt"""
     try:
-        password = getpass.getpass("Enter MySQL password for root: ")
-        return mysql.connect(
-            host=HOST, 
-            user=USER, 
-            password=password, 
-            database=DATABASE, 
-            autocommit=True
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                flush()
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            flush()
+            total += len(chunk)
+    finally:
+        cursor.close()
+    return total
+
+def read_csv_rows(path):
+    """Yield the data rows of a CSV file as tuples (\\N becomes None)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            yield tuple(None if value == CSV_NULL else value for value in row)
+
+def load_data_infile(table, path, progress=None):
+    """
+    Load a CSV file with LOAD DATA LOCAL INFILE (MySQL only)
+
+    Uses its own connection: local infile is only enabled for this load, not
+    on the application's pooled connections. The server must allow it too
+    (local_infile=ON).
+    """
+    path = os.path.abspath(path)
+    conn = mysql.connect(
+        autocommit=True,
+        allow_local_infile=True,
+        allow_local_infile_in_path=os.path.dirname(path),
+        **DB_connecrtors.db_config
+    )
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            "LINES TERMINATED BY '\\n' IGNORE 1 LINES "
+            f"({', '.join(TABLE_COLUMNS[table])})",
+            (path,)
         )
-    except mysql.Error as e:
-        print(f"Connection error: {e}")
-        sys.exit(1)
+        loaded = cursor.rowcount
+        if progress:
+            progress.add(table, loaded)
+        return loaded
+    finally:
+        cursor.close()
+        conn.close()
 
-def exec(cursor, query, params=None):
-    """Execute query with error handling"""
+def load_table(table, source, chunk_rows=CHUNK_ROWS, relax=True, progress=None):
+    """
+    Load one table from an iterable of rows or a CSV path
+
+    Returns:
+        Number of rows loaded
+    """
+    progress = progress or LoadProgress()
+    progress.start(table)
     try:
-        cursor.execute(query, params or ())
-    except mysql.Error as e:
-        print(f"Error executing: {query[:100]}...")
-        print(f"Error: {e}")
-        raise
+        if isinstance(source, str) and DB_connecrtors.dialect == "mysql":
+            return load_data_infile(table, source, progress)
+
+        rows = read_csv_rows(source) if isinstance(source, str) else source
+        conn = get_connection()
+        if not conn:
+            raise mysql.Error(msg=f"No database connection for {table}")
+        try:
+            with relaxed_checks(conn, relax):
+                return bulk_insert(conn, table, rows, chunk_rows, progress)
+        finally:
+            conn.close()
+    finally:
+        progress.finish(table)
+
+def load_tables(sources, workers=LOAD_WORKERS, chunk_rows=CHUNK_ROWS, relax=True):
+    """
+    Bulk-load several tables level by level in foreign key order
 
-def truncate_tables(cursor):
+    Args:
+        sources: Dict table -> iterable of row tuples, or path of a CSV file
+        workers: Tables of the same level loaded concurrently (capped by
+                 the connection pool size)
+    Returns:
+        Total number of rows loaded
+    """
+    progress = LoadProgress()
+    workers = max(1, min(workers, pool_stats().get("max_size", 1)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for level in LOAD_LEVELS:
+            tables = [t for t in level if t in sources]
+            futures = [
+                executor.submit(load_table, t, sources[t], chunk_rows, relax, progress)
+                for t in tables
+            ]
+            # Finish the whole level before any table that references it
+            for future in futures:
+                future.result()
+
+    total = progress.total_rows()
+    seconds = time.perf_counter() - progress.started
+    print(f"\nLoaded {total:,} rows in {seconds:.1f}s ({total / seconds if seconds else 0:,.0f} rows/s)")
+    return total
+
+def truncate_tables():
     """Clear all tables in correct order"""
     print("Clearing existing data...")
-    cursor.execute("SET FOREIGN_KEY_CHECKS = 0;")
-    tables = [
-        "assigns", "Done_By", "needs", "parts", "complaints",
-        "Service_Job", "vehicle", "customers", "customer_reps", "service_technician"
-    ]
-    for t in tables:
-        try:
-            exec(cursor, f"TRUNCATE TABLE {t};")
-            print(f"  Cleared {t}")
-        except mysql.Error as e:
-            print(f"  Warning: Could not truncate {t}: {e}")
-    cursor.execute("SET FOREIGN_KEY_CHECKS = 1;")
-
-def populate(cursor):
-    """Insert sample data into all tables"""
-    print("\nInserting sample data...")
-    
-    # 1. service_technician
-    print("  Inserting technicians...")
-    technicians = [
-        ("T001", "Rahul", "Menon", "Engine", "Petrol Engines", 5),
-        ("T002", "Amit", "Kumar", "Transmission", "Gearbox", 7),
-        ("T003", "Sneha", "Rao", "Electrical", "Diagnostics", 4),
-        ("T004", "Vijay", "Patel", "AC", "HVAC Systems", 6),
-        ("T005", "Arun", "Nair", "Suspension", "Wheel Alignment", 8),
-        ("T006", "Priya", "Shah", "Body", "Painting", 3)
-    ]
-    for t in technicians:
-        exec(cursor, "INSERT INTO service_technician (technician_ID, Fname, Name, Trained_For, Specialization, YOE) VALUES (%s,%s,%s,%s,%s,%s)", t)
-
-    # 2. customer_reps
-    print("  Inserting customer representatives...")
-    reps = [
-        ("E001", "Anjali Gupta", 9876543210, 4),
-        ("E002", "Karan Singh", 9123456789, 6),
-        ("E003", "Neha Sharma", 9811122233, 3),
-        ("E004", "Raj Patel", 9090909090, 5),
-        ("E005", "Deepa Iyer", 9000011111, 2),
-        ("E006", "Arvind Rao", 9888888888, 7)
-    ]
-    for r in reps:
-        exec(cursor, "INSERT INTO customer_reps (Employee_ID, Name, Phone_Number, YOE) VALUES (%s,%s,%s,%s)", r)
-
-    # 3. customers
-    print("  Inserting customers...")
-    customers = [
-        ("C001", "Aditya Varma", "aditya@example.com", "9999990001", "KL01234567891234", 29, "2021-01-10", "E001"),
-        ("C002", "Meera Thomas", None, "8888880002", "MH98765432109876", 34, "2022-03-15", "E002"),
-        ("C003", "Rohit Das", "rohit@example.com", None, "DL11112222333344", 45, "2020-07-23", "E003"),
-        ("C004", "Lakshmi Pillai", "lakshmi@example.com", "7777770003", "TN55556666777788", 25, "2023-05-02", "E004"),
-        ("C005", "Vikram Chauhan", "vikram@example.com", "6666660004", "GJ33334444555566", 39, "2019-11-18", "E005"),
-        ("C006", "Divya Reddy", None, "9555550005", "AP22223333444455", 27, "2021-09-27", "E006")
-    ]
-    for c in customers:
-        exec(cursor, "INSERT INTO customers (Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)", c)
-
-    # 4. vehicle
-    print("  Inserting vehicles...")
-    vehicles = [
-        ("KL01AB1234", "Hyundai", "i20", 2020, "CHS12345678901234", "Hatchback", "C001", "E001"),
-        ("MH02CD5678", "Maruti", "Baleno", 2019, "CHS98765432109876", "Hatchback", "C002", "E002"),
-        ("DL03EF9101", "Honda", "City", 2021, "CHS55554444333322", "Sedan", "C003", "E003"),
-        ("TN04GH1213", "Tata", "Nexon", 2022, "CHS11112222333344", "SUV", "C004", "E004"),
-        ("GJ05IJ1415", "Toyota", "Fortuner", 2020, "CHS99998888777766", "SUV", "C005", "E005"),
-        ("AP06KL1617", "Ford", "EcoSport", 2018, "CHS66667777888899", "SUV", "C006", "E006")
-    ]
-    for v in vehicles:
-        exec(cursor, "INSERT INTO vehicle (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)", v)
-
-    # 5. Service_Job
-    print("  Inserting service jobs...")
-    jobs = [
-        (1, "2024-01-05", "KL01AB1234", "Oil Change", "Routine oil change service", "2024-01-06", 2000, "E001"),
-        (2, "2024-02-10", "MH02CD5678", "Brake Service", "Brake pad replacement", "2024-02-12", 3500, "E002"),
-        (3, "2024-03-08", "DL03EF9101", "AC Repair", "AC not cooling properly", "2024-03-10", 4000, "E003"),
-        (4, "2024-04-01", "TN04GH1213", "Body Work", "Body painting and dent removal", "2024-04-05", 10000, "E004"),
-        (5, "2024-05-15", "GJ05IJ1415", "Transmission", "Transmission check and repair", "2024-05-18", 8000, "E005"),
-        (6, "2024-06-20", "AP06KL1617", "General Service", "Regular maintenance service", "2024-06-21", 1500, "E006")
-    ]
-    for j in jobs:
-        exec(cursor, """
-            INSERT INTO Service_Job 
-            (Service_ID, Start_Date, Reg_No, Service_type, Description, 
-             Predicted_End_date, Predicted_Cost, EmpID) 
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s)
-        """, j)
-
-    # 6. complaints
-    print("  Inserting complaints...")
-    complaints = [
-        (1, "Oil leakage noticed", "Fixed with new gasket"),
-        (2, "Brakes squeaking loudly", "Replaced brake pads"),
-        (3, "AC not cooling effectively", "Recharged refrigerant"),
-        (4, "Paint chipped on door", "Repainted door panel"),
-        (5, "Gear slip in 3rd gear", "Adjusted transmission"),
-        (6, "Minor rattling noise from engine", "Tightened loose components")
-    ]
-    for comp in complaints:
-        exec(cursor, "INSERT INTO complaints (JobID, Complaints, Fixed) VALUES (%s,%s,%s)", comp)
-
-    # 7. parts - FIXED with shorter part numbers
-    print("  Inserting parts...")
-    parts = [
-        (1, "P001", 1, 500),
-        (2, "P002", 2, 700),
-        (3, "P003", 1, 1200),
-        (4, "P004", 3, 400),
-        (5, "P005", 2, 3000),
-        (6, "P006", 1, 800)
-    ]
-    for p in parts:
-        exec(cursor, "INSERT INTO parts (JobID, Part_No, Quantity, Price) VALUES (%s,%s,%s,%s)", p)
-
-    # 8. needs
-    print("  Inserting vehicle-job relationships...")
-    needs = [
-        ("KL01AB1234", 1),
-        ("MH02CD5678", 2),
-        ("DL03EF9101", 3),
-        ("TN04GH1213", 4),
-        ("GJ05IJ1415", 5),
-        ("AP06KL1617", 6)
-    ]
-    for n in needs:
-        exec(cursor, "INSERT INTO needs (RegNum, JobID) VALUES (%s,%s)", n)
-
-    # 9. Done_By
-    print("  Inserting technician assignments...")
-    doneby = [
-        (1, "T001"),
-        (2, "T002"),
-        (3, "T003"),
-        (4, "T004"),
-        (5, "T005"),
-        (6, "T006")
-    ]
-    for d in doneby:
-        exec(cursor, "INSERT INTO Done_By (JobID, TechID) VALUES (%s,%s)", d)
-
-    # 10. assigns
-    print("  Inserting assignment records...")
-    assigns = [
-        (1, "E001", "T001"),
-        (2, "E002", "T002"),
-        (3, "E003", "T003"),
-        (4, "E004", "T004"),
-        (5, "E005", "T005"),
-        (6, "E006", "T006")
-    ]
-    for a in assigns:
-        exec(cursor, "INSERT INTO assigns (JobID, EmpID, TechID) VALUES (%s,%s,%s)", a)
-
-def main():
+    conn = get_connection()
+    if not conn:
+        raise mysql.Error(msg="No database connection")
+
+    sqlite = getattr(conn, "dialect", "mysql") == "sqlite"
+    cursor = conn.cursor()
+    try:
+        with relaxed_checks(conn):
+            for level in reversed(LOAD_LEVELS):
+                for t in level:
+                    try:
+                        cursor.execute(f"DELETE FROM {t}" if sqlite else f"TRUNCATE TABLE {t}")
+                        print(f"  Cleared {t}")
+                    except mysql.Error as e:
+                        print(f"  Warning: Could not truncate {t}: {e}")
+    finally:
+        cursor.close()
+        conn.close()
+
+def sample_data():
+    """The fixed sample rows, per table"""
+    return {
+        "service_technician": [
+            ("T001", "Rahul", "Menon", "Engine", "Petrol Engines", 5),
+            ("T002", "Amit", "Kumar", "Transmission", "Gearbox", 7),
+            ("T003", "Sneha", "Rao", "Electrical", "Diagnostics", 4),
+            ("T004", "Vijay", "Patel", "AC", "HVAC Systems", 6),
+            ("T005", "Arun", "Nair", "Suspension", "Wheel Alignment", 8),
+            ("T006", "Priya", "Shah", "Body", "Painting", 3)
+        ],
+        "customer_reps": [
+            ("E001", "Anjali Gupta", 9876543210, 4),
+            ("E002", "Karan Singh", 9123456789, 6),
+            ("E003", "Neha Sharma", 9811122233, 3),
+            ("E004", "Raj Patel", 9090909090, 5),
+            ("E005", "Deepa Iyer", 9000011111, 2),
+            ("E006", "Arvind Rao", 9888888888, 7)
+        ],
+        "customers": [
+            ("C001", "Aditya Varma", "aditya@example.com", "9999990001", "KL01234567891234", 29, "2021-01-10", "E001"),
+            ("C002", "Meera Thomas", None, "8888880002", "MH98765432109876", 34, "2022-03-15", "E002"),
+            ("C003", "Rohit Das", "rohit@example.com", None, "DL11112222333344", 45, "2020-07-23", "E003"),
+            ("C004", "Lakshmi Pillai", "lakshmi@example.com", "7777770003", "TN55556666777788", 25, "2023-05-02", "E004"),
+            ("C005", "Vikram Chauhan", "vikram@example.com", "6666660004", "GJ33334444555566", 39, "2019-11-18", "E005"),
+            ("C006", "Divya Reddy", None, "9555550005", "AP22223333444455", 27, "2021-09-27", "E006")
+        ],
+        "vehicle": [
+            ("KL01AB1234", "Hyundai", "i20", 2020, "CHS12345678901234", "Hatchback", "C001", "E001"),
+            ("MH02CD5678", "Maruti", "Baleno", 2019, "CHS98765432109876", "Hatchback", "C002", "E002"),
+            ("DL03EF9101", "Honda", "City", 2021, "CHS55554444333322", "Sedan", "C003", "E003"),
+            ("TN04GH1213", "Tata", "Nexon", 2022, "CHS11112222333344", "SUV", "C004", "E004"),
+            ("GJ05IJ1415", "Toyota", "Fortuner", 2020, "CHS99998888777766", "SUV", "C005", "E005"),
+            ("AP06KL1617", "Ford", "EcoSport", 2018, "CHS66667777888899", "SUV", "C006", "E006")
+        ],
+        "service_job": [
+            (1, "2024-01-05", "KL01AB1234", "Oil Change", "Routine oil change service", "2024-01-06", 2000, "E001"),
+            (2, "2024-02-10", "MH02CD5678", "Brake Service", "Brake pad replacement", "2024-02-12", 3500, "E002"),
+            (3, "2024-03-08", "DL03EF9101", "AC Repair", "AC not cooling properly", "2024-03-10", 4000, "E003"),
+            (4, "2024-04-01", "TN04GH1213", "Body Work", "Body painting and dent removal", "2024-04-05", 10000, "E004"),
+            (5, "2024-05-15", "GJ05IJ1415", "Transmission", "Transmission check and repair", "2024-05-18", 8000, "E005"),
+            (6, "2024-06-20", "AP06KL1617", "General Service", "Regular maintenance service", "2024-06-21", 1500, "E006")
+        ],
+        "complaints": [
+            (1, "Oil leakage noticed", "Fixed with new gasket"),
+            (2, "Brakes squeaking loudly", "Replaced brake pads"),
+            (3, "AC not cooling effectively", "Recharged refrigerant"),
+            (4, "Paint chipped on door", "Repainted door panel"),
+            (5, "Gear slip in 3rd gear", "Adjusted transmission"),
+            (6, "Minor rattling noise from engine", "Tightened loose components")
+        ],
+        "parts": [
+            (1, "P001", 1, 500),
+            (2, "P002", 2, 700),
+            (3, "P003", 1, 1200),
+            (4, "P004", 3, 400),
+            (5, "P005", 2, 3000),
+            (6, "P006", 1, 800)
+        ],
+        "needs": [
+            ("KL01AB1234", 1),
+            ("MH02CD5678", 2),
+            ("DL03EF9101", 3),
+            ("TN04GH1213", 4),
+            ("GJ05IJ1415", 5),
+            ("AP06KL1617", 6)
+        ],
+        "Done_By": [
+            (1, "T001"),
+            (2, "T002"),
+            (3, "T003"),
+            (4, "T004"),
+            (5, "T005"),
+            (6, "T006")
+        ],
+        "assigns": [
+            (1, "E001", "T001"),
+            (2, "E002", "T002"),
+            (3, "E003", "T003"),
+            (4, "E004", "T004"),
+            (5, "E005", "T005"),
+            (6, "E006", "T006")
+        ],
+    }
+
+def csv_sources(directory):
+    """Map each table to <directory>/<table>.csv for the files that exist"""
+    sources = {}
+    for table in TABLE_COLUMNS:
+        path = os.path.join(directory, f"{table}.csv")
+        if os.path.exists(path):
+            sources[table] = path
+    return sources
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Populate the workshop database")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--csv-dir", help="bulk-load <table>.csv files from this directory")
+    parser.add_argument("--generate", type=int, metavar="JOBS",
+                        help="load synthetic data for this many service jobs (see datagen.py)")
+    parser.add_argument("--seed", type=int, default=42, help="seed for --generate")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="rows per INSERT batch and commit")
+    parser.add_argument("--workers", type=int, default=LOAD_WORKERS, help="tables loaded in parallel")
+    parser.add_argument("--keep-checks", action="store_true", help="don't relax foreign key / unique checks")
+    parser.add_argument("--no-truncate", action="store_true", help="append instead of clearing the tables first")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
     print("="*60)
     print("Vehicle Workshop Management - Database Population Script")
     print("="*60)
-    
-    conn = connect_db()
-    cur = conn.cursor()
-    
+
+    if not initialize_connection_pool(args.db):
+        sys.exit(1)
+
     try:
-        truncate_tables(cur)
-        populate(cur)
+        if args.csv_dir:
+            sources = csv_sources(args.csv_dir)
+            if not sources:
+                print(f"✗ No <table>.csv files found in {args.csv_dir}")
+                sys.exit(1)
+        elif args.generate:
+            sources = SyntheticWorkshop(args.generate, args.seed).tables()
+        else:
+            sources = sample_data()
+
+        if not args.no_truncate:
+            truncate_tables()
+
+        print("\nLoading data...")
+        load_tables(sources, args.workers, args.chunk_rows, relax=not args.keep_checks)
+
         print("\n" + "="*60)
-        print("✓ Sample data inserted successfully!")
+        print("✓ Data loaded successfully!")
         print("="*60)
-        print("\nData Summary:")
-        print("  - 6 Service Technicians")
-        print("  - 6 Customer Representatives")
-        print("  - 6 Customers")
-        print("  - 6 Vehicles")
-        print("  - 6 Service Jobs")
-        print("  - 6 Complaints")
-        print("  - 6 Parts")
         print("\nYou can now run your GUI application.")
         print("="*60)
     except Exception as e:
         print(f"\n✗ Population failed: {e}")
         sys.exit(1)
     finally:
-        cur.close()
-        conn.close()
+        close_pool()
 
 if __name__ == "__main__":
     try:
@@ -234,4 +433,4 @@ if __name__ == "__main__":
         sys.exit(0)
     except Exception as e:
         print(f"\n✗ Unexpected error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
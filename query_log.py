@@ -0,0 +1,230 @@
+"""
+query_log.py - Per-statement timing and the slow-query log.
+
+Every statement run through DB_connecrtors / query_registry is timed and
+folded into in-memory stats keyed by its normalised SQL (literals and
+placeholders replaced by ?). Statements slower than SLOW_QUERY_MS are also
+appended to a rotating JSONL file together with the shape of their
+parameters, the view function that issued them, and - once per normalised
+statement - the EXPLAIN FORMAT=JSON plan.
+"""
+
+import inspect
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from logging.handlers import RotatingFileHandler
+
+SLOW_QUERY_MS = 200
+SLOW_LOG_PATH = os.path.join("logs", "slow_queries.jsonl")
+SLOW_LOG_MAX_BYTES = 5 * 1024 * 1024
+SLOW_LOG_BACKUPS = 5
+
+# Capture EXPLAIN FORMAT=JSON for slow statements (one extra round trip the
+# first time each normalised statement is slow)
+EXPLAIN_SLOW_QUERIES = True
+
+# Frames in these modules are plumbing, not the caller we want to report
+_PLUMBING_MODULES = {
+    "query_log", "DB_connecrtors", "query_registry", "pagination",
+    "async_ui", "paged_view", "concurrent.futures.thread", "threading",
+}
+
+_EXPLAINABLE = re.compile(r"^\s*(?:SELECT|WITH|INSERT|REPLACE|UPDATE|DELETE)\b", re.IGNORECASE)
+
+_stats = {}         # normalised sql -> {"count", "total_ms", "max_ms", "rows", "slow"}
+_explained = set()  # normalised statements whose plan was already captured
+_captures = []      # sample dicts of active capture() blocks
+_lock = threading.Lock()
+_logger = None
+
+def configure(threshold_ms=None, path=None, max_bytes=None, backups=None, explain=None):
+    """
+    Change slow-query settings at runtime (None keeps the current value)
+
+    A new path / rotation size takes effect on the next slow statement.
+    """
+    global SLOW_QUERY_MS, SLOW_LOG_PATH, SLOW_LOG_MAX_BYTES, SLOW_LOG_BACKUPS
+    global EXPLAIN_SLOW_QUERIES, _logger
+
+    with _lock:
+        if threshold_ms is not None:
+            SLOW_QUERY_MS = threshold_ms
+        if explain is not None:
+            EXPLAIN_SLOW_QUERIES = explain
+        if path is not None or max_bytes is not None or backups is not None:
+            SLOW_LOG_PATH = path or SLOW_LOG_PATH
+            SLOW_LOG_MAX_BYTES = max_bytes or SLOW_LOG_MAX_BYTES
+            SLOW_LOG_BACKUPS = backups if backups is not None else SLOW_LOG_BACKUPS
+            _close_logger()
+
+def normalize_sql(query):
+    """Collapse whitespace and replace literals/placeholders with ? so variants group together"""
+    text = re.sub(r"'(?:[^'\\]|\\.)*'", "?", query)
+    text = re.sub(r"%s|\b\d+(?:\.\d+)?\b", "?", text)
+    text = re.sub(r"\(\s*\?(?:\s*,\s*\?)+\s*\)", "(?+)", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+def param_shape(params):
+    """Types of the parameters, never their values (keeps customer data out of the log)"""
+    if params is None:
+        return []
+    if isinstance(params, dict):
+        return {k: type(v).__name__ for k, v in params.items()}
+    return [type(v).__name__ for v in params]
+
+def find_caller():
+    """"module.function" of the first frame outside the database plumbing"""
+    frame = inspect.currentframe()
+    try:
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if module not in _PLUMBING_MODULES:
+                return f"{module}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return "<unknown>"
+    finally:
+        del frame
+
+def record(query, params, elapsed, rows, conn=None, name=None):
+    """
+    Account one executed statement; log it if it was slow
+
+    Args:
+        query: SQL text as executed
+        params: Parameters it ran with (only their shape is logged)
+        elapsed: Wall time in seconds
+        rows: Rows returned (reads) or affected (writes)
+        conn: Connection the statement ran on, used for EXPLAIN (optional)
+        name: Registered query name when run through query_registry
+    """
+    ms = elapsed * 1000
+    normalized = normalize_sql(query)
+    slow = ms >= SLOW_QUERY_MS
+
+    with _lock:
+        entry = _stats.get(normalized)
+        if entry is None:
+            entry = _stats[normalized] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "slow": 0}
+        entry["count"] += 1
+        entry["total_ms"] += ms
+        entry["max_ms"] = max(entry["max_ms"], ms)
+        entry["rows"] += max(rows or 0, 0)
+        for samples in _captures:
+            samples.setdefault(normalized, {"query": query, "params": params, "name": name})
+        if not slow:
+            return
+        entry["slow"] += 1
+        explain = EXPLAIN_SLOW_QUERIES and conn is not None and normalized not in _explained
+        if explain:
+            _explained.add(normalized)
+
+    event = {
+        "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "ms": round(ms, 2),
+        "rows": rows,
+        "sql": normalized,
+        "name": name,
+        "params": param_shape(params),
+        "caller": find_caller(),
+    }
+    if explain:
+        event["plan"] = explain_plan(conn, query, params)
+
+    try:
+        _get_logger().info(json.dumps(event, default=str))
+    except Exception as e:
+        print(f"Slow query log error: {e}")
+
+def explain_plan(conn, query, params):
+    """EXPLAIN FORMAT=JSON of a statement on conn (EXPLAIN QUERY PLAN on SQLite), or an error description"""
+    if not _EXPLAINABLE.match(query):
+        return None
+    cursor = None
+    try:
+        cursor = conn.cursor()
+        if getattr(conn, "dialect", "mysql") == "sqlite":
+            cursor.execute("EXPLAIN QUERY PLAN " + query, params)
+            return {"sqlite_plan": [row[3] for row in cursor.fetchall()]}
+        cursor.execute("EXPLAIN FORMAT=JSON " + query, params)
+        row = cursor.fetchone()
+        cursor.fetchall()
+        return json.loads(row[0]) if row else None
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        if cursor:
+            cursor.close()
+
+@contextmanager
+def capture():
+    """
+    Collect one executed sample per normalised statement while the block runs
+
+    Yields a dict: normalised sql -> {"query", "params", "name"}. Unlike the
+    slow log this keeps real parameter values, so only use it on test data
+    (index_advisor EXPLAINs the samples).
+    """
+    samples = {}
+    with _lock:
+        _captures.append(samples)
+    try:
+        yield samples
+    finally:
+        with _lock:
+            _captures.remove(samples)
+
+def query_stats():
+    """
+    Timing per normalised statement, slowest total first
+
+    Returns:
+        List of dicts: sql, count, total_ms, avg_ms, max_ms, rows, slow
+    """
+    with _lock:
+        items = [(sql, dict(entry)) for sql, entry in _stats.items()]
+    report = []
+    for sql, entry in items:
+        entry["sql"] = sql
+        entry["avg_ms"] = entry["total_ms"] / entry["count"]
+        report.append(entry)
+    report.sort(key=lambda e: e["total_ms"], reverse=True)
+    return report
+
+def reset_stats():
+    """Forget collected timings and captured plans"""
+    with _lock:
+        _stats.clear()
+        _explained.clear()
+
+def _get_logger():
+    global _logger
+    with _lock:
+        if _logger is None:
+            directory = os.path.dirname(SLOW_LOG_PATH)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            handler = RotatingFileHandler(SLOW_LOG_PATH, maxBytes=SLOW_LOG_MAX_BYTES,
+                                          backupCount=SLOW_LOG_BACKUPS, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger = logging.getLogger("workshop.slow_queries")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            for old in list(logger.handlers):
+                logger.removeHandler(old)
+                old.close()
+            logger.addHandler(handler)
+            _logger = logger
+        return _logger
+
+def _close_logger():
+    global _logger
+    if _logger is not None:
+        for handler in list(_logger.handlers):
+            _logger.removeHandler(handler)
+            handler.close()
+        _logger = None
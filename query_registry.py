@@ -0,0 +1,668 @@
+"""
+query_registry.py - Central registry of named SQL statements.
+
+- Every statement the views issue lives here under a name.
+- run_named() executes them through server-side prepared statements that are
+  prepared once per pooled connection and reused afterwards.
+- warm_up() prepares everything in the background at startup and
+  validate_registry() checks the SQL against information_schema so schema
+  drift is reported at launch instead of at click time.
+"""
+
+import re
+import threading
+import time
+import weakref
+import query_log
+from mysql.connector import Error
+import DB_connecrtors
+from DB_connecrtors import get_connection, run_query, cached_fetch, note_write, pool_stats
+
+QUERIES = {
+    # ---------- Service technician view ----------
+    "get_jobs_for_technician": """
+    SELECT
+        sj.Service_ID,
+        sj.Reg_No,
+        v.Make,
+        v.Model,
+        sj.Service_type,
+        sj.Start_Date,
+        sj.Predicted_End_date,
+        sj.Predicted_Cost
+    FROM service_job sj
+    JOIN Done_By db ON sj.Service_ID = db.JobID
+    JOIN vehicle v ON sj.Reg_No = v.Reg_No
+    WHERE db.TechID = %s
+    ORDER BY sj.Start_Date DESC
+    """,
+
+    "get_job_details": """
+    SELECT
+        sj.Service_ID,
+        sj.Reg_No,
+        v.Make,
+        v.Model,
+        v.Year,
+        v.Chassis_No,
+        v.Body_type,
+        sj.Service_type,
+        sj.Description,
+        sj.Start_Date,
+        sj.Predicted_End_date,
+        sj.Predicted_Cost,
+        c.Customer_ID,
+        c.Name as Customer_Name,
+        c.Phone_no,
+        c.email_ID,
+        sj.parts_total AS Total_Parts_Cost
+    FROM service_job sj
+    JOIN vehicle v ON sj.Reg_No = v.Reg_No
+    JOIN customers c ON v.CustomerID = c.Customer_ID
+    WHERE sj.Service_ID = %s
+    """,
+
+    "add_complaint_for_job": """
+    INSERT INTO complaints (JobID, Complaints, Fixed)
+    VALUES (%s, %s, NULL)
+    """,
+
+    "get_complaints_for_job": """
+    SELECT Complaints, Fixed
+    FROM complaints
+    WHERE JobID = %s
+    """,
+
+    "add_parts_for_job": """
+    INSERT INTO parts (JobID, Part_No, Quantity, Price)
+    VALUES (%s, %s, %s, %s)
+    """,
+
+    "get_parts_for_job": """
+    SELECT Part_No, Quantity, Price, (Quantity * Price) as Total
+    FROM parts
+    WHERE JobID = %s
+    """,
+
+    # parts_total is kept exact by the triggers on parts (migration 002)
+    "get_total_parts_cost": """
+    SELECT parts_total as Total_Cost
+    FROM service_job
+    WHERE Service_ID = %s
+    """,
+
+    # ---------- Manager view ----------
+    "add_new_technician": """
+    INSERT INTO service_technician (technician_ID, Fname, Name, Trained_For, Specialization, YOE)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    """,
+
+    "add_new_customer_rep": """
+    INSERT INTO customer_reps (Employee_ID, Name, Phone_Number, YOE)
+    VALUES (%s, %s, %s, %s)
+    """,
+
+    "get_all_technicians": """
+    SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE
+    FROM service_technician
+    ORDER BY Fname, Name
+    """,
+
+    "get_all_customer_reps": """
+    SELECT Employee_ID, Name, Phone_Number, YOE
+    FROM customer_reps
+    ORDER BY Name
+    """,
+
+    "delete_technician": "DELETE FROM service_technician WHERE technician_ID = %s",
+
+    "delete_customer_rep": "DELETE FROM customer_reps WHERE Employee_ID = %s",
+
+
+    # Analytics read the monthly rollups only (maintained by rollups.py);
+    # months are first-of-month dates, both bounds inclusive
+    "analytics_by_technician": """
+    SELECT
+        r.TechID,
+        st.Fname,
+        st.Name,
+        SUM(r.jobs) AS jobs,
+        SUM(r.revenue) AS revenue,
+        SUM(r.duration_days) AS duration_days,
+        SUM(r.timed_jobs) AS timed_jobs
+    FROM rollup_tech_monthly r
+    LEFT JOIN service_technician st ON st.technician_ID = r.TechID
+    WHERE r.month >= %s AND r.month <= %s
+    GROUP BY r.TechID, st.Fname, st.Name
+    ORDER BY revenue DESC
+    """,
+
+    "analytics_by_service_type": """
+    SELECT
+        Service_type,
+        SUM(jobs) AS jobs,
+        SUM(revenue) AS revenue,
+        SUM(duration_days) AS duration_days,
+        SUM(timed_jobs) AS timed_jobs
+    FROM rollup_service_monthly
+    WHERE month >= %s AND month <= %s
+    GROUP BY Service_type
+    ORDER BY revenue DESC
+    """,
+
+    "analytics_by_month": """
+    SELECT
+        month,
+        SUM(jobs) AS jobs,
+        SUM(revenue) AS revenue,
+        SUM(duration_days) AS duration_days,
+        SUM(timed_jobs) AS timed_jobs
+    FROM rollup_service_monthly
+    WHERE month >= %s AND month <= %s
+    GROUP BY month
+    ORDER BY month
+    """,
+
+    # ---------- Customer view ----------
+    "customer_login": "SELECT Customer_ID, Name, email_ID FROM customers WHERE Customer_ID = %s",
+
+    "get_customer_vehicles": "SELECT Reg_No, Make, Model, Year, Body_type, Chassis_No FROM vehicle WHERE CustomerID = %s",
+
+    "register_customer_self": """
+    INSERT INTO customers (Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID)
+    VALUES (%s, %s, %s, %s, %s, %s, CURDATE(), NULL)
+    """,
+
+    "get_customer_service_status": """
+    SELECT
+        sj.Service_ID,
+        sj.Reg_No,
+        v.Make,
+        v.Model,
+        sj.Description,
+        sj.Start_date,
+        sj.Predicted_End_Date,
+        sj.Predicted_cost
+    FROM service_job sj
+    JOIN vehicle v ON sj.Reg_No = v.Reg_No
+    WHERE v.CustomerID = %s
+    ORDER BY sj.Start_date DESC
+    """,
+
+    # ---------- Customer rep view ----------
+    "technician_picklist": "SELECT technician_ID, Fname, Name, Specialization, YOE FROM service_technician",
+
+    "add_customer": """
+    INSERT INTO customers (Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID)
+    VALUES (%s, %s, %s, %s, %s, %s, CURDATE(), %s)
+    """,
+
+    "add_vehicle": """
+    INSERT INTO vehicle (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """,
+
+    "create_service_job": """
+    INSERT INTO service_job (Service_ID, Start_Date, Reg_No, Service_type,
+                        Description, Predicted_End_date, Predicted_Cost, EmpID)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    """,
+
+    "add_job_need": "INSERT INTO needs (RegNum, JobID) VALUES (%s, %s)",
+
+    "assign_done_by": "INSERT INTO Done_By (JobID, TechID) VALUES (%s, %s)",
+
+    # The rep who booked the job is recorded as the one assigning it
+    "assign_audit": """
+    INSERT INTO assigns (JobID, EmpID, TechID)
+    SELECT Service_ID, EmpID, %s FROM service_job WHERE Service_ID = %s
+    """,
+}
+
+# ---------- Keyset-paginated listings ----------
+# name: (SELECT ... FROM ..., sort key columns). The key must be unique (end
+# it with the primary key) and backed by an index so every page is a seek.
+PAGED_LISTINGS = {
+    "customers": (
+        "SELECT Customer_ID, Name, email_ID, Phone_no FROM customers",
+        ("Customer_ID",)
+    ),
+    "technicians": (
+        "SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE FROM service_technician",
+        ("technician_ID",)
+    ),
+    "technicians_by_name": (
+        "SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE FROM service_technician",
+        ("Fname", "Name", "technician_ID")
+    ),
+    "customer_reps_by_name": (
+        "SELECT Employee_ID, Name, Phone_Number, YOE FROM customer_reps",
+        ("Name", "Employee_ID")
+    ),
+}
+
+def _add_keyset_queries(name, select, keys):
+    """Register the first/after/before page statements (and the whole listing) for one listing"""
+    columns = ", ".join(keys)
+    marks = ", ".join(["%s"] * len(keys))
+    ascending = ", ".join(keys)
+    descending = ", ".join(f"{k} DESC" for k in keys)
+
+    QUERIES[f"page_{name}_first"] = f"{select} ORDER BY {ascending} LIMIT %s"
+    QUERIES[f"page_{name}_after"] = (
+        f"{select} WHERE ({columns}) > ({marks}) ORDER BY {ascending} LIMIT %s"
+    )
+    # Walk backwards from the first row of the current page, newest first
+    QUERIES[f"page_{name}_before"] = (
+        f"{select} WHERE ({columns}) < ({marks}) ORDER BY {descending} LIMIT %s"
+    )
+    # Every row in page order, streamed rather than paged
+    QUERIES[f"all_{name}"] = f"{select} ORDER BY {ascending}"
+
+for _name, (_select, _keys) in PAGED_LISTINGS.items():
+    _add_keyset_queries(_name, _select, _keys)
+
+# ---------- Technicians by part ----------
+# Semi-join: the matching parts rows are grouped per job first (index range
+# on parts(Part_No, JobID)), then joined to Done_By(JobID, TechID), so each
+# technician/job pair is counted once however many matching parts it used.
+_TECHS_BY_PARTS = """
+    SELECT
+        st.technician_ID,
+        st.Fname,
+        st.Name,
+        COUNT(DISTINCT u.JobID) AS jobs,
+        SUM(u.quantity) AS quantity,
+        MAX(sj.Start_date) AS last_used
+    FROM (
+        SELECT p.JobID, SUM(COALESCE(p.Quantity, 0)) AS quantity
+        FROM parts p
+        WHERE {predicate}
+        GROUP BY p.JobID
+    ) u
+    JOIN Done_By db ON db.JobID = u.JobID
+    JOIN service_technician st ON st.technician_ID = db.TechID
+    JOIN service_job sj ON sj.Service_ID = u.JobID
+    GROUP BY st.technician_ID, st.Fname, st.Name
+    ORDER BY jobs DESC, last_used DESC
+"""
+
+# Part lists are padded to the next of these sizes, so a handful of
+# prepared statements serve every list length
+PART_LIST_SIZES = (1, 4, 16, 64)
+
+for _size in PART_LIST_SIZES:
+    QUERIES[f"techs_by_parts_{_size}"] = _TECHS_BY_PARTS.format(
+        predicate=f"p.Part_No IN ({', '.join(['%s'] * _size)})"
+    )
+
+# Prefix patterns such as "BRKPAD-%". MySQL turns a LIKE with a constant
+# prefix into an index range by itself; a hand-built upper bound would be
+# wrong there, as utf8mb4_0900_ai_ci doesn't sort by code point. Params: (LIKE pattern,)
+QUERIES["techs_by_part_prefix"] = _TECHS_BY_PARTS.format(
+    predicate="p.Part_No LIKE %s ESCAPE '!'"
+)
+# SQLite only uses its BINARY parts index for an explicit range, whose upper
+# bound (code point successor of the prefix) is exact in BINARY order.
+# Params: (range low, range high, LIKE pattern)
+QUERIES["techs_by_part_prefix_sqlite"] = _TECHS_BY_PARTS.format(
+    predicate="p.Part_No >= %s AND p.Part_No < %s AND p.Part_No LIKE %s ESCAPE '!'"
+)
+
+# ---------- Job bundles ----------
+# A job with its vehicle and customer, complaints and parts in one round
+# trip: one UNION ALL of three row shapes told apart by "section" (NULL
+# where a shape has no such column). Parts totals are summed by the caller.
+_JOB_BUNDLE = """
+    SELECT
+        'job' AS section,
+        sj.Service_ID AS JobID,
+        sj.Reg_No,
+        v.Make,
+        v.Model,
+        v.Year,
+        v.Chassis_No,
+        v.Body_type,
+        sj.Service_type,
+        sj.Description,
+        sj.Start_Date,
+        sj.Predicted_End_date,
+        sj.Predicted_Cost,
+        c.Customer_ID,
+        c.Name AS Customer_Name,
+        c.Phone_no,
+        c.email_ID,
+        NULL AS Complaints,
+        NULL AS Fixed,
+        NULL AS Part_No,
+        NULL AS Quantity,
+        NULL AS Price
+    FROM service_job sj
+    JOIN vehicle v ON sj.Reg_No = v.Reg_No
+    JOIN customers c ON v.CustomerID = c.Customer_ID
+    WHERE sj.Service_ID {match}
+    UNION ALL
+    SELECT 'complaint', JobID, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+           NULL, NULL, NULL, NULL, Complaints, Fixed, NULL, NULL, NULL
+    FROM complaints
+    WHERE JobID {match}
+    UNION ALL
+    SELECT 'part', JobID, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+           NULL, NULL, NULL, NULL, NULL, NULL, Part_No, Quantity, Price
+    FROM parts
+    WHERE JobID {match}
+"""
+
+QUERIES["get_job_bundle"] = _JOB_BUNDLE.format(match="= %s")
+
+# Batches of job IDs are padded to the next of these sizes
+JOB_BATCH_SIZES = (4, 16, 64)
+
+for _size in JOB_BATCH_SIZES:
+    QUERIES[f"get_job_bundles_{_size}"] = _JOB_BUNDLE.format(
+        match=f"IN ({', '.join(['%s'] * _size)})"
+    )
+
+# ---------- Delta sync ----------
+# The job lists restricted to a batch of changed jobs (delta_sync.py)
+_CHANGED_LISTS = {
+    "get_jobs_for_technician": "WHERE db.TechID = %s",
+    "get_customer_service_status": "WHERE v.CustomerID = %s",
+}
+
+for _name, _where in _CHANGED_LISTS.items():
+    for _size in JOB_BATCH_SIZES:
+        QUERIES[f"{_name}_changed_{_size}"] = QUERIES[_name].replace(
+            _where, f"{_where} AND sj.Service_ID IN ({', '.join(['%s'] * _size)})"
+        )
+
+# ---------- Exports ----------
+# Whole tables streamed to a file by export.py. Only primary-key orders: a
+# sort the server has to materialise would defeat streaming millions of rows.
+EXPORT_QUERIES = {
+    "jobs": """
+    SELECT sj.Service_ID, sj.Reg_No, v.Make, v.Model, v.CustomerID, sj.Service_type, sj.Description,
+           sj.Start_Date, sj.Predicted_End_date, sj.Predicted_Cost, sj.parts_total, sj.EmpID
+    FROM service_job sj
+    JOIN vehicle v ON v.Reg_No = sj.Reg_No
+    ORDER BY sj.Service_ID
+    """,
+    "parts_usage": """
+    SELECT p.JobID, sj.Start_Date, p.Part_No, p.Quantity, p.Price, p.Quantity * p.Price AS Total
+    FROM parts p
+    JOIN service_job sj ON sj.Service_ID = p.JobID
+    """,
+    "complaints": "SELECT JobID, Complaints, Fixed FROM complaints",
+    "customers": """
+    SELECT Customer_ID, Name, email_ID, Phone_no, license_No, Age, First_Joined, empID
+    FROM customers ORDER BY Customer_ID
+    """,
+    "vehicles": """
+    SELECT Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID
+    FROM vehicle ORDER BY Reg_No
+    """,
+    "technicians": """
+    SELECT technician_ID, Fname, Name, Trained_For, Specialization, YOE
+    FROM service_technician ORDER BY technician_ID
+    """,
+    "customer_reps": "SELECT Employee_ID, Name, Phone_Number, YOE FROM customer_reps ORDER BY Employee_ID",
+}
+
+for _name, _query in EXPORT_QUERIES.items():
+    QUERIES[f"export_{_name}"] = _query
+
+# Statement handle no longer known to the server - re-prepare on the same connection
+STALE_STATEMENT = 1243
+# The connection itself is gone (server restart, network) - retry on another one
+CONNECTION_LOST = (2006, 2013)
+
+# Prepared cursors per physical connection: {connection: {query name: cursor}}
+# Keyed weakly so a connection dropped by the pool takes its cursors with it
+_prepared = weakref.WeakKeyDictionary()
+_prepared_lock = threading.Lock()
+
+def sql(name):
+    """Get the SQL text of a registered query (raises KeyError if unknown)"""
+    return QUERIES[name]
+
+def _raw_connection(conn):
+    """Underlying connection of a pooled connection wrapper"""
+    return getattr(conn, "_cnx", conn)
+
+def _prepared_cursor(conn, name):
+    """Get the prepared cursor for a query on this connection, preparing it once"""
+    raw = _raw_connection(conn)
+    with _prepared_lock:
+        cursors = _prepared.setdefault(raw, {})
+    cursor = cursors.get(name)
+    if cursor is None:
+        cursor = conn.cursor(prepared=True, dictionary=True)
+        cursors[name] = cursor
+    return cursor
+
+def _forget_prepared(conn, name):
+    """Drop a cached prepared cursor (e.g. after the server lost the statement)"""
+    raw = _raw_connection(conn)
+    with _prepared_lock:
+        cursor = _prepared.get(raw, {}).pop(name, None)
+    if cursor is not None:
+        try:
+            cursor.close()
+        except Error:
+            pass
+
+def _execute_prepared(conn, name, params, fetch):
+    """Execute a named statement on conn, re-preparing once if the handle went stale"""
+    for attempt in (1, 2):
+        cursor = _prepared_cursor(conn, name)
+        try:
+            started = time.perf_counter()
+            cursor.execute(QUERIES[name], params or ())
+            result = cursor.fetchall() if fetch else True
+            rows = len(result) if fetch else cursor.rowcount
+            query_log.record(QUERIES[name], params, time.perf_counter() - started, rows, conn, name)
+            return result
+        except Error as e:
+            # SQL errors (constraints, syntax) are not retried, and a lost
+            # connection is the caller's to replace
+            _forget_prepared(conn, name)
+            if attempt == 2 or e.errno != STALE_STATEMENT:
+                raise
+
+def run_named(name, params=None, fetch=False, cache=False, ttl=None):
+    """
+    Run a registered query through a server-side prepared statement
+
+    cache/ttl opt a read into the DB_connecrtors result cache (see run_query).
+
+    Same contract as run_query:
+        - List of dict rows if fetch=True and successful
+        - True if fetch=False and successful
+        - Error string if failed
+    """
+    if fetch and cache:
+        key = ("named", name, tuple(params) if params else ())
+        return cached_fetch(key, QUERIES[name],
+                            lambda: run_named(name, params, fetch=True), ttl)
+
+    for attempt in (1, 2):
+        conn = get_connection()
+        if not conn:
+            return "Failed to connect to database"
+
+        try:
+            result = _execute_prepared(conn, name, params, fetch)
+            if not fetch:
+                conn.commit()
+                note_write(QUERIES[name])
+            return result
+
+        except Error as e:
+            if e.errno in CONNECTION_LOST:
+                # Nothing was committed on the dead session; drop it from the
+                # pool and run once more on a fresh connection
+                try:
+                    conn.disconnect()
+                except Error:
+                    pass
+                if attempt == 1:
+                    continue
+            else:
+                conn.rollback()
+            print(f"Query Error ({name}): {e}")
+            return str(e)
+
+        finally:
+            conn.close()
+
+# ---------- schema validation ----------
+
+_SQL_KEYWORDS = {
+    "where", "join", "on", "order", "group", "left", "right", "inner", "outer",
+    "limit", "set", "values", "select", "having", "union", "as",
+}
+
+def _table_aliases(query):
+    """Map alias (and table name) -> table for every table the query touches"""
+    aliases = {}
+    pattern = r"\b(?:FROM|JOIN|INTO|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?"
+    for table, alias in re.findall(pattern, query, re.IGNORECASE):
+        aliases[table.lower()] = table
+        if alias and alias.lower() not in _SQL_KEYWORDS:
+            aliases[alias.lower()] = table
+    return aliases
+
+def _referenced_columns(query, aliases):
+    """Yield (table, column) pairs the query references that can be resolved statically"""
+    # alias.column references
+    for alias, column in re.findall(r"\b(\w+)\.(\w+)\b", query):
+        table = aliases.get(alias.lower())
+        if table:
+            yield table, column
+
+    # INSERT INTO table (col, col, ...)
+    for table, columns in re.findall(r"INSERT\s+INTO\s+(\w+)\s*\(([^)]*)\)", query, re.IGNORECASE):
+        for column in columns.split(","):
+            yield table, column.strip()
+
+    # Unqualified columns are only unambiguous when a single table is involved
+    tables = set(aliases.values())
+    if len(tables) == 1:
+        table = tables.pop()
+        for column in re.findall(r"\b(\w+)\s*(?:=|<|>)\s*%s", query):
+            yield table, column
+        select = re.search(r"SELECT\s+(.*?)\s+FROM\b", query, re.IGNORECASE | re.DOTALL)
+        if select:
+            for item in select.group(1).split(","):
+                item = re.split(r"\s+as\s+", item.strip(), flags=re.IGNORECASE)[0]
+                if re.fullmatch(r"\w+", item):
+                    yield table, item
+
+# (table, column) pairs of the connected database, per backend dialect
+_SCHEMA_COLUMNS = {
+    "mysql": "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+             "WHERE TABLE_SCHEMA = DATABASE()",
+    "sqlite": "SELECT m.name AS TABLE_NAME, p.name AS COLUMN_NAME "
+              "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+              "WHERE m.type = 'table'",
+}
+
+def validate_registry():
+    """
+    Check every registered query against the database schema (information_schema
+    on MySQL, sqlite_master on SQLite)
+
+    Table names are compared exactly (they are case sensitive on Linux
+    servers); column names case-insensitively, like MySQL does.
+
+    Returns:
+        List of problem strings (empty if everything resolves), or an error
+        string if the schema could not be read
+    """
+    rows = run_query(_SCHEMA_COLUMNS[DB_connecrtors.dialect], fetch=True)
+    if isinstance(rows, str):
+        return rows
+
+    schema = {}
+    for r in rows:
+        schema.setdefault(r["TABLE_NAME"], set()).add(r["COLUMN_NAME"].lower())
+
+    problems = []
+    for name, query in QUERIES.items():
+        aliases = _table_aliases(query)
+        for table in sorted(set(aliases.values())):
+            if table not in schema:
+                problems.append(f"{name}: unknown table '{table}'")
+
+        for table, column in _referenced_columns(query, aliases):
+            if table in schema and column.lower() not in schema[table]:
+                problems.append(f"{name}: unknown column '{table}.{column}'")
+
+    # De-duplicate while keeping order
+    return list(dict.fromkeys(problems))
+
+def _check_unparameterized(conn, name):
+    """Have the server parse a statement without running it (text-protocol PREPARE)"""
+    cursor = conn.cursor()
+    try:
+        if getattr(conn, "dialect", "mysql") == "sqlite":
+            cursor.execute("EXPLAIN " + QUERIES[name])
+            cursor.fetchall()
+        else:
+            cursor.execute("PREPARE registry_check FROM %s", (QUERIES[name],))
+            cursor.execute("DEALLOCATE PREPARE registry_check")
+    finally:
+        cursor.close()
+
+def warm_up(connections=None):
+    """
+    Validate the registry and prepare every statement on the pooled connections
+
+    Parameterized statements are prepared on each connection without being
+    executed (a prepared cursor given no parameters only prepares). The few
+    statements without parameters are full-table reads, so they are only
+    parsed by the server here and get prepared on first use.
+
+    The connections are checked out together so each one is visited; by
+    default that is the ones already open (the pool's min_size). Connections
+    the pool opens later prepare their statements lazily on first use.
+    Meant to run on the background executor right after the pool is created.
+
+    Returns:
+        List of problem strings (schema mismatches and statements the server
+        rejected)
+    """
+    problems = validate_registry()
+    if isinstance(problems, str):
+        problems = [f"Schema validation skipped: {problems}"]
+
+    if connections is None:
+        connections = max(pool_stats().get("size", 0), 1)
+
+    held = []
+    failed = set()
+    try:
+        for i in range(connections):
+            conn = get_connection()
+            if not conn:
+                break
+            held.append(conn)
+            for name, query in QUERIES.items():
+                if name in failed:
+                    continue
+                try:
+                    if "%s" in query:
+                        _prepared_cursor(conn, name).execute(query)
+                    elif i == 0:
+                        _check_unparameterized(conn, name)
+                except Error as e:
+                    failed.add(name)
+                    _forget_prepared(conn, name)
+                    problems.append(f"{name}: rejected by server ({e})")
+    finally:
+        for conn in held:
+            conn.close()
+
+    for p in problems:
+        print(f"⚠ {p}")
+    return problems
@@ -0,0 +1,164 @@
+"""
+reconcile.py - Nightly, set-based reconciliation of job cost totals.
+
+Recomputes service_job.parts_total from parts for every job (or an id
+range) with one grouped UPDATE ... JOIN per chunk of jobs, instead of one
+CALL UpdateTotalJobCost round trip per job. Chunks follow the primary key
+and each is its own short transaction, so locks are held for one chunk at
+a time. Only rows whose stored total differs are written, so a second run
+changes nothing.
+
+    python reconcile.py                         # MySQL, whole table
+    python reconcile.py --db sqlite:workshop.db --chunk-jobs 2000
+    python reconcile.py --from-id 1000000 --dry-run
+
+Predicted_cost is the booked estimate and is never derived from parts since
+migration 002; a job's expected total is Predicted_cost + parts_total.
+"""
+
+import argparse
+import sys
+import time
+
+import DB_connecrtors
+from DB_connecrtors import initialize_connection_pool, close_pool, transaction
+
+# Jobs per chunk / transaction
+CHUNK_JOBS = 5_000
+# Seconds between progress lines
+PROGRESS_INTERVAL = 2.0
+
+# Jobs [lo, hi) - the parts sums are grouped once per chunk, not per job
+_RECONCILE_SQL = {
+    "mysql": """
+    UPDATE service_job sj
+    LEFT JOIN (
+        SELECT JobID, SUM(Quantity * Price) AS total
+        FROM parts
+        WHERE JobID >= %s AND JobID < %s
+        GROUP BY JobID
+    ) p ON p.JobID = sj.Service_ID
+    SET sj.parts_total = COALESCE(p.total, 0)
+    WHERE sj.Service_ID >= %s AND sj.Service_ID < %s
+      AND sj.parts_total <> COALESCE(p.total, 0)
+    """,
+    # SQLite can't outer-join the target of an UPDATE; UPDATE ... FROM a
+    # grouped outer join is the same single statement
+    "sqlite": """
+    UPDATE service_job
+    SET parts_total = t.total
+    FROM (
+        SELECT sj.Service_ID AS id, COALESCE(SUM(p.Quantity * p.Price), 0) AS total
+        FROM service_job sj
+        LEFT JOIN parts p ON p.JobID = sj.Service_ID AND p.JobID >= %s AND p.JobID < %s
+        WHERE sj.Service_ID >= %s AND sj.Service_ID < %s
+        GROUP BY sj.Service_ID
+    ) t
+    WHERE service_job.Service_ID = t.id
+      AND service_job.parts_total <> t.total
+    """,
+}
+
+# Same comparison without writing, for --dry-run
+_DRIFT_SQL = """
+SELECT COUNT(*) AS drifted
+FROM service_job sj
+LEFT JOIN (
+    SELECT JobID, SUM(Quantity * Price) AS total
+    FROM parts
+    WHERE JobID >= %s AND JobID < %s
+    GROUP BY JobID
+) p ON p.JobID = sj.Service_ID
+WHERE sj.Service_ID >= %s AND sj.Service_ID < %s
+  AND sj.parts_total <> COALESCE(p.total, 0)
+"""
+
+# First id after the next chunk_jobs jobs (None when the chunk reaches the end)
+_CHUNK_END_SQL = """
+SELECT Service_ID FROM service_job
+WHERE Service_ID >= %s
+ORDER BY Service_ID
+LIMIT 1 OFFSET %s
+"""
+
+_BOUNDS_SQL = """
+SELECT MIN(Service_ID) AS first_id, MAX(Service_ID) AS last_id, COUNT(*) AS jobs
+FROM service_job
+WHERE Service_ID >= %s AND Service_ID <= %s
+"""
+
+def reconcile_parts_totals(chunk_jobs=CHUNK_JOBS, from_id=None, to_id=None, dry_run=False, progress=True):
+    """
+    Recompute service_job.parts_total chunk by chunk
+
+    Args:
+        chunk_jobs: Jobs per UPDATE / transaction
+        from_id, to_id: Optional inclusive Service_ID range (default all jobs)
+        dry_run: Only count the jobs whose total is wrong
+        progress: Print throttled progress lines
+    Returns:
+        (jobs scanned, jobs corrected - or found drifted with dry_run)
+    Raises:
+        mysql.connector.Error if a chunk fails (earlier chunks stay committed)
+    """
+    low = from_id if from_id is not None else -2**31
+    high = to_id if to_id is not None else 2**31 - 1
+    statement = _DRIFT_SQL if dry_run else _RECONCILE_SQL[DB_connecrtors.dialect]
+
+    with transaction() as tx:
+        bounds = tx.execute(_BOUNDS_SQL, (low, high), fetch=True)[0]
+    total_jobs = bounds["jobs"] or 0
+    if not total_jobs:
+        return 0, 0
+
+    started = last_report = time.perf_counter()
+    scanned = fixed = 0
+    lo = bounds["first_id"]
+    while lo is not None and lo <= high:
+        with transaction() as tx:
+            rows = tx.execute(_CHUNK_END_SQL, (lo, chunk_jobs), fetch=True)
+            hi = rows[0]["Service_ID"] if rows else None
+            # The last chunk is closed by the range end instead
+            end = min(hi, high + 1) if hi is not None else high + 1
+            if dry_run:
+                fixed += tx.execute(statement, (lo, end, lo, end), fetch=True)[0]["drifted"]
+            else:
+                fixed += max(tx.execute(statement, (lo, end, lo, end)), 0)
+        scanned = min(scanned + chunk_jobs, total_jobs)
+        lo = hi
+
+        now = time.perf_counter()
+        if progress and (now - last_report >= PROGRESS_INTERVAL or lo is None or lo > high):
+            last_report = now
+            rate = scanned / (now - started) if now > started else 0
+            eta = (total_jobs - scanned) / rate if rate else 0
+            print(f"  {scanned:,}/{total_jobs:,} jobs ({scanned / total_jobs:.0%}), "
+                  f"{fixed:,} {'drifted' if dry_run else 'corrected'}, {rate:,.0f} jobs/s, ETA {eta:.0f}s")
+
+    return scanned, fixed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reconcile service_job.parts_total with parts")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--chunk-jobs", type=int, default=CHUNK_JOBS, help="jobs per transaction")
+    parser.add_argument("--from-id", type=int, help="first Service_ID to reconcile")
+    parser.add_argument("--to-id", type=int, help="last Service_ID to reconcile")
+    parser.add_argument("--dry-run", action="store_true", help="count drifted jobs without changing them")
+    args = parser.parse_args(argv)
+
+    if not initialize_connection_pool(args.db):
+        return 1
+    try:
+        started = time.perf_counter()
+        scanned, fixed = reconcile_parts_totals(args.chunk_jobs, args.from_id, args.to_id, args.dry_run)
+        verb = "drifted" if args.dry_run else "corrected"
+        print(f"✓ {scanned:,} jobs checked, {fixed:,} {verb} in {time.perf_counter() - started:.1f}s")
+        return 0
+    except Exception as e:
+        print(f"✗ Reconciliation failed: {e}")
+        return 1
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    sys.exit(main())
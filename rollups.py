@@ -0,0 +1,141 @@
+"""
+rollups.py - Incremental maintenance of the analytics rollup tables.
+
+Triggers (migration 003) queue the start day of every new or changed job
+in rollup_dirty_days. refresh_rollups() takes those days a chunk at a time
+and, in one transaction per chunk, recomputes the daily rows per technician
+and per service type from that day's jobs only, then the monthly rows of
+the affected months from the daily rows. The Manager analytics panel reads
+the monthly tables, so it never aggregates raw jobs.
+
+    python rollups.py                     # refresh queued days (MySQL)
+    python rollups.py --db sqlite:workshop.db --rebuild
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+
+from DB_connecrtors import initialize_connection_pool, close_pool, transaction, run_query
+
+# Dirty days recomputed per transaction
+CHUNK_DAYS = 100
+
+# One row per (day, technician, job) first, so a technician listed twice on
+# a job in Done_By still counts the job once
+_TECH_DAILY_SQL = """
+INSERT INTO rollup_tech_daily (day, TechID, jobs, revenue, duration_days, timed_jobs)
+SELECT day, TechID, COUNT(*), SUM(revenue), COALESCE(SUM(duration), 0), COUNT(duration)
+FROM (
+    SELECT sj.Start_date AS day, db.TechID AS TechID, sj.Service_ID,
+           MAX(COALESCE(sj.Predicted_cost, 0) + sj.parts_total) AS revenue,
+           MAX(DATEDIFF(sj.Predicted_End_Date, sj.Start_date)) AS duration
+    FROM service_job sj
+    JOIN Done_By db ON db.JobID = sj.Service_ID
+    WHERE sj.Start_date IN ({days}) AND db.TechID IS NOT NULL
+    GROUP BY sj.Start_date, db.TechID, sj.Service_ID
+) j
+GROUP BY day, TechID
+"""
+
+_SERVICE_DAILY_SQL = """
+INSERT INTO rollup_service_daily (day, Service_type, jobs, revenue, duration_days, timed_jobs)
+SELECT Start_date, COALESCE(Service_type, 'Unspecified'), COUNT(*),
+       SUM(COALESCE(Predicted_cost, 0) + parts_total),
+       COALESCE(SUM(DATEDIFF(Predicted_End_Date, Start_date)), 0),
+       COUNT(Predicted_End_Date)
+FROM service_job
+WHERE Start_date IN ({days})
+GROUP BY Start_date, COALESCE(Service_type, 'Unspecified')
+"""
+
+# (monthly table, daily table, key column)
+_MONTHLY = (
+    ("rollup_tech_monthly", "rollup_tech_daily", "TechID"),
+    ("rollup_service_monthly", "rollup_service_daily", "Service_type"),
+)
+
+def _month_bounds(day):
+    """First day of day's month and of the next month"""
+    first = day.replace(day=1)
+    following = date(first.year + 1, 1, 1) if first.month == 12 else date(first.year, first.month + 1, 1)
+    return first, following
+
+def pending_days():
+    """Number of days waiting to be refreshed"""
+    rows = run_query("SELECT COUNT(*) AS days FROM rollup_dirty_days", fetch=True)
+    return rows[0]["days"] if isinstance(rows, list) and rows else 0
+
+def refresh_rollups(chunk_days=CHUNK_DAYS, progress=False):
+    """
+    Recompute the rollups of every queued day
+
+    A day re-queued by a concurrent write while it is being refreshed is
+    picked up again by the next refresh.
+
+    Returns:
+        Number of days refreshed
+    Raises:
+        mysql.connector.Error if a chunk fails (earlier chunks stay committed)
+    """
+    refreshed = 0
+    started = time.perf_counter()
+    while True:
+        with transaction() as tx:
+            rows = tx.execute("SELECT day FROM rollup_dirty_days ORDER BY day LIMIT %s", (chunk_days,), fetch=True)
+            if not rows:
+                break
+            days = [row["day"] for row in rows]
+            marks = ", ".join(["%s"] * len(days))
+
+            tx.execute(f"DELETE FROM rollup_dirty_days WHERE day IN ({marks})", days)
+            tx.execute(f"DELETE FROM rollup_tech_daily WHERE day IN ({marks})", days)
+            tx.execute(f"DELETE FROM rollup_service_daily WHERE day IN ({marks})", days)
+            tx.execute(_TECH_DAILY_SQL.format(days=marks), days)
+            tx.execute(_SERVICE_DAILY_SQL.format(days=marks), days)
+
+            for first, following in sorted({_month_bounds(d) for d in days}):
+                for monthly, daily, key in _MONTHLY:
+                    tx.execute(f"DELETE FROM {monthly} WHERE month = %s", (first,))
+                    tx.execute(
+                        f"INSERT INTO {monthly} (month, {key}, jobs, revenue, duration_days, timed_jobs) "
+                        f"SELECT %s, {key}, SUM(jobs), SUM(revenue), SUM(duration_days), SUM(timed_jobs) "
+                        f"FROM {daily} WHERE day >= %s AND day < %s GROUP BY {key}",
+                        (first, first, following)
+                    )
+        refreshed += len(days)
+        if progress:
+            rate = refreshed / (time.perf_counter() - started)
+            print(f"  {refreshed:,} days refreshed (through {days[-1]}), {rate:,.0f} days/s")
+    return refreshed
+
+def rebuild_rollups(chunk_days=CHUNK_DAYS, progress=False):
+    """Queue every day that has jobs and refresh (repairs rollups after triggers were bypassed)"""
+    with transaction() as tx:
+        tx.execute("INSERT IGNORE INTO rollup_dirty_days (day) SELECT DISTINCT Start_date FROM service_job")
+    return refresh_rollups(chunk_days, progress)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh the analytics rollups")
+    parser.add_argument("--db", help="backend URL (see DB_connecrtors.DATABASE_URL_ENV); default MySQL")
+    parser.add_argument("--rebuild", action="store_true", help="recompute every day, not just queued ones")
+    parser.add_argument("--chunk-days", type=int, default=CHUNK_DAYS, help="days per transaction")
+    args = parser.parse_args(argv)
+
+    if not initialize_connection_pool(args.db):
+        return 1
+    try:
+        started = time.perf_counter()
+        refresh = rebuild_rollups if args.rebuild else refresh_rollups
+        days = refresh(args.chunk_days, progress=True)
+        print(f"✓ {days:,} days refreshed in {time.perf_counter() - started:.1f}s")
+        return 0
+    except Exception as e:
+        print(f"✗ Rollup refresh failed: {e}")
+        return 1
+    finally:
+        close_pool()
+
+if __name__ == "__main__":
+    sys.exit(main())
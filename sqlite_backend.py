@@ -0,0 +1,605 @@
+"""
+sqlite_backend.py - Embedded SQLite backend for local runs and benchmarks.
+
+Connections returned by SQLiteDatabase.connect() speak the subset of the
+mysql.connector API that DB_connecrtors and query_registry use (dictionary /
+prepared cursors, start_transaction, in_transaction, ping ...), so the pool,
+run_query, stream_query, transaction() and run_named work unchanged:
+- %s placeholders are rewritten to ?, and bare column references in the
+  select list get an alias so result keys keep the spelling the query used
+  (MySQL behaviour; SQLite would return the declared column name).
+- INSERT IGNORE becomes INSERT OR IGNORE.
+- REGEXP_LIKE, CHAR_LENGTH, CURDATE, NOW, CONCAT and DATEDIFF are provided
+  as SQL functions, DATE/DATETIME columns come back as date/datetime objects.
+- sqlite3 errors are re-raised as the matching mysql.connector errors.
+
+translate_schema() turns Commands.sql into SQLite DDL: inline INDEX clauses
+become CREATE INDEX statements, FULLTEXT indexes become FTS5 tables kept in
+sync by triggers, IF ... SIGNAL triggers become WHEN/RAISE triggers and
+stored procedures/functions are skipped (reported back).
+"""
+
+import datetime
+import functools
+import itertools
+import os
+import re
+import sqlite3
+from mysql.connector import errors as mysql_errors
+
+DIALECT = "sqlite"
+
+# Bundled schema (same file the MySQL database is created from)
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Commands.sql")
+
+_memory_ids = itertools.count(1)
+
+sqlite3.register_adapter(datetime.date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime.datetime, lambda d: d.isoformat(" "))
+
+def _convert(parse):
+    def convert(raw):
+        try:
+            return parse(raw.decode())
+        except ValueError:
+            return raw.decode()
+    return convert
+
+sqlite3.register_converter("DATE", _convert(datetime.date.fromisoformat))
+sqlite3.register_converter("DATETIME", _convert(datetime.datetime.fromisoformat))
+sqlite3.register_converter("TIMESTAMP", _convert(datetime.datetime.fromisoformat))
+
+# ---------- errors ----------
+
+def _mysql_error(e):
+    """Equivalent mysql.connector exception for a sqlite3 one"""
+    if isinstance(e, sqlite3.IntegrityError):
+        cls = mysql_errors.IntegrityError
+    elif isinstance(e, sqlite3.ProgrammingError):
+        cls = mysql_errors.ProgrammingError
+    elif isinstance(e, sqlite3.OperationalError):
+        cls = mysql_errors.OperationalError
+    else:
+        cls = mysql_errors.DatabaseError
+    return cls(msg=str(e))
+
+# ---------- query translation ----------
+
+def _scan(sql):
+    """Yield (char, in_quotes) for each character of sql"""
+    quote = None
+    for ch in sql:
+        if quote:
+            yield ch, True
+            if ch == quote:
+                quote = None
+        else:
+            if ch in ("'", '"', "`"):
+                quote = ch
+                yield ch, True
+            else:
+                yield ch, False
+
+def _replace_placeholders(sql):
+    """%s -> ?, %% -> % (outside string literals); backticks -> double quotes"""
+    out = []
+    pending_percent = False
+    for ch, quoted in _scan(sql):
+        if ch == "`":
+            out.append('"')
+            continue
+        if pending_percent:
+            pending_percent = False
+            if ch == "s":
+                out.append("?")
+                continue
+            if ch == "%":
+                out.append("%")
+                continue
+            out.append("%")
+        if ch == "%" and not quoted:
+            pending_percent = True
+            continue
+        out.append(ch)
+    if pending_percent:
+        out.append("%")
+    return "".join(out)
+
+def _split_top_level(text):
+    """Split on commas that are not inside parentheses or quotes"""
+    parts, depth, start = [], 0, 0
+    for i, (ch, quoted) in enumerate(_scan(text)):
+        if quoted:
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+def _alias_select_columns(sql):
+    """Give bare column references in the outer select list an explicit alias"""
+    match = re.match(r"\s*SELECT\s+(DISTINCT\s+)?", sql, re.IGNORECASE)
+    if not match:
+        return sql
+
+    # Find the outer FROM (depth 0, outside quotes)
+    depth = 0
+    start = match.end()
+    end = None
+    for i, (ch, quoted) in enumerate(_scan(sql)):
+        if i < start or quoted:
+            continue
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif (depth == 0 and re.match(r"FROM\b", sql[i:i + 5], re.IGNORECASE)
+              and not (sql[i - 1].isalnum() or sql[i - 1] == "_")):
+            end = i
+            break
+    if end is None:
+        return sql
+
+    items = []
+    for item in _split_top_level(sql[start:end]):
+        column = re.fullmatch(r"\s*(?:\w+\.)?(\w+)\s*", item)
+        if column:
+            item = f'{item.rstrip()} AS "{column.group(1)}" '
+        items.append(item)
+    return sql[:start] + ",".join(items) + sql[end:]
+
+def _translate_dml(sql):
+    """MySQL-only DML spellings -> SQLite"""
+    return re.sub(r"^(\s*)INSERT\s+IGNORE\b", r"\1INSERT OR IGNORE", sql, flags=re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1024)
+def translate_query(sql, with_params=True):
+    """MySQL statement text -> SQLite statement text (cached)"""
+    if with_params:
+        sql = _replace_placeholders(sql)
+    else:
+        sql = sql.replace("`", '"')
+    return _alias_select_columns(_translate_dml(sql))
+
+def _placeholder_count(sql):
+    return sum(1 for ch, quoted in _scan(sql) if ch == "?" and not quoted)
+
+# ---------- schema translation ----------
+
+def _strip_comments(text):
+    """Remove -- comments outside string literals"""
+    lines = []
+    for line in text.splitlines():
+        quote = None
+        for i, ch in enumerate(line):
+            if quote:
+                if ch == quote:
+                    quote = None
+            elif ch in ("'", '"'):
+                quote = ch
+            elif line.startswith("--", i):
+                line = line[:i]
+                break
+        lines.append(line)
+    return "\n".join(lines)
+
+def split_statements(text):
+    """Split a MySQL script into statements, honouring DELIMITER changes"""
+    statements = []
+    delimiter = ";"
+    current = []
+    for line in _strip_comments(text).splitlines():
+        directive = re.match(r"\s*DELIMITER\s+(\S+)\s*$", line, re.IGNORECASE)
+        if directive:
+            delimiter = directive.group(1)
+            continue
+        current.append(line)
+        joined = "\n".join(current)
+        if joined.rstrip().endswith(delimiter):
+            statement = joined.rstrip()[:-len(delimiter)].strip()
+            if statement:
+                statements.append(statement)
+            current = []
+    rest = "\n".join(current).strip()
+    if rest:
+        statements.append(rest)
+    return statements
+
+_INLINE_INDEX = re.compile(
+    r",\s*(UNIQUE\s+|FULLTEXT\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)", re.IGNORECASE
+)
+
+def _index_columns(columns):
+    """
+    MySQL prefix-length columns -> NOCASE columns: Name(10) -> Name COLLATE NOCASE
+
+    Prefix indexes serve LIKE 'abc%' lookups, which compare case-insensitively
+    like MySQL's default collation; SQLite only uses an index for them if
+    the index is NOCASE.
+    """
+    return re.sub(r"(\w+)\s*\(\s*\d+\s*\)", r"\1 COLLATE NOCASE", columns)
+
+def _fulltext_index(name, table, columns):
+    """
+    FULLTEXT index -> external-content FTS5 table named after the index
+
+    The FTS table stores only the inverted index; its rowids are the rowids
+    of the indexed table and triggers keep it in step with every write.
+    Search queries MATCH against the FTS table and join back on rowid.
+    """
+    cols = [c.strip().strip("`") for c in _index_columns(columns).split(",")]
+    listed = ", ".join(cols)
+    new = ", ".join(f"new.{c}" for c in cols)
+    old = ", ".join(f"old.{c}" for c in cols)
+    remove = f"INSERT INTO {name} ({name}, rowid, {listed}) VALUES ('delete', old.rowid, {old})"
+    add = f"INSERT INTO {name} (rowid, {listed}) VALUES (new.rowid, {new})"
+    return [
+        f"CREATE VIRTUAL TABLE {name} USING fts5({listed}, content='{table}', "
+        f"content_rowid='rowid', tokenize='porter unicode61')",
+        f"CREATE TRIGGER {name}_after_insert AFTER INSERT ON {table} BEGIN {add}; END",
+        f"CREATE TRIGGER {name}_after_delete AFTER DELETE ON {table} BEGIN {remove}; END",
+        f"CREATE TRIGGER {name}_after_update AFTER UPDATE OF {listed} ON {table} "
+        f"BEGIN {remove}; {add}; END",
+        # Index the rows already there
+        f"INSERT INTO {name} ({name}) VALUES ('rebuild')",
+    ]
+
+def _translate_create_table(statement):
+    table = re.match(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?`?(\w+)`?", statement, re.IGNORECASE).group(1)
+    extra = []
+
+    def collect(match):
+        kind = (match.group(1) or "").strip().upper()
+        if kind == "FULLTEXT":
+            extra.extend(_fulltext_index(match.group(2), table, match.group(3)))
+        else:
+            unique = "UNIQUE " if kind == "UNIQUE" else ""
+            extra.append(f"CREATE {unique}INDEX IF NOT EXISTS {match.group(2)} "
+                         f"ON {table} ({_index_columns(match.group(3))})")
+        return ""
+
+    body = _INLINE_INDEX.sub(collect, statement)
+    # Table options (ENGINE=..., CHARSET=...) after the closing parenthesis
+    body = body[:body.rindex(")") + 1]
+    # Only an INTEGER PRIMARY KEY (the rowid) is assigned automatically
+    body = re.sub(r"\b(?:TINY|SMALL|MEDIUM|BIG)?INT(?:EGER)?\b(?=[^,]*\bAUTO_INCREMENT\b)", "INTEGER",
+                  body, flags=re.IGNORECASE)
+    body = re.sub(r"\bAUTO_INCREMENT\b", "", body, flags=re.IGNORECASE)
+    body = re.sub(r"\bUNSIGNED\b", "", body, flags=re.IGNORECASE)
+    body = re.sub(r"\bON\s+UPDATE\s+CURRENT_TIMESTAMP(?:\(\d*\))?", "", body, flags=re.IGNORECASE)
+    return [body] + extra
+
+_SIGNAL_BODY = re.compile(
+    r"^\s*BEGIN\s+IF\s+(?P<cond>.+?)\s+THEN\s+SIGNAL\s+SQLSTATE\s+'\w+'\s+"
+    r"SET\s+MESSAGE_TEXT\s*=\s*'(?P<msg>(?:[^']|'')*)'\s*;\s*END\s+IF\s*;\s*END\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+
+def _translate_trigger(statement):
+    head = re.match(
+        r"(CREATE\s+TRIGGER\s+(?:IF\s+NOT\s+EXISTS\s+)?\w+\s+(?:BEFORE|AFTER)\s+"
+        r"(?:INSERT|UPDATE|DELETE)\s+ON\s+`?\w+`?\s+FOR\s+EACH\s+ROW)\s+(.*)$",
+        statement, re.IGNORECASE | re.DOTALL
+    )
+    if not head:
+        return None
+    prefix, body = head.group(1), head.group(2).strip()
+
+    signal = _SIGNAL_BODY.match(body)
+    if signal:
+        return f"{prefix} WHEN {signal.group('cond')} BEGIN SELECT RAISE(ABORT, '{signal.group('msg')}'); END"
+
+    if re.match(r"BEGIN\b", body, re.IGNORECASE):
+        inner = re.sub(r"^BEGIN\b|\bEND$", "", body, flags=re.IGNORECASE).strip()
+    else:
+        inner = body
+    statements = [part.strip() for part in inner.split(";") if part.strip()]
+    if any(re.match(r"(?:IF|DECLARE|SIGNAL|SET|WHILE|LOOP|REPEAT|CASE)\b", part, re.IGNORECASE)
+           for part in statements):
+        # Procedural trigger bodies have no SQLite equivalent
+        return None
+    return f"{prefix} BEGIN {'; '.join(_translate_dml(part) for part in statements)}; END"
+
+def translate_schema(text):
+    """
+    Translate a MySQL DDL/DML script to SQLite
+
+    Returns:
+        (statements, skipped) - SQLite statements to run in order, and a
+        description of each MySQL statement that has no SQLite equivalent
+    """
+    statements, skipped = [], []
+    for statement in split_statements(text):
+        first = " ".join(statement.split()[:3]).upper()
+
+        if re.match(r"CREATE\s+(?:DEFINER\s*=\s*\S+\s+)?(?:PROCEDURE|FUNCTION)\b", statement, re.IGNORECASE):
+            name = re.search(r"(?:PROCEDURE|FUNCTION)\s+`?(\w+)", statement, re.IGNORECASE).group(1)
+            skipped.append(f"routine {name}")
+        elif re.match(r"DROP\s+(?:PROCEDURE|FUNCTION)\b|USE\b|SET\b|CREATE\s+DATABASE\b|"
+                      r"DROP\s+DATABASE\b|LOCK\b|UNLOCK\b|CALL\b", statement, re.IGNORECASE):
+            continue
+        elif first.startswith("CREATE TABLE"):
+            statements.extend(_translate_create_table(statement))
+        elif first.startswith("CREATE TRIGGER"):
+            trigger = _translate_trigger(statement)
+            if trigger:
+                statements.append(trigger)
+            else:
+                skipped.append("trigger " + statement.split()[2])
+        elif re.match(r"CREATE\s+FULLTEXT\s+INDEX\b", statement, re.IGNORECASE):
+            m = re.match(r"CREATE\s+FULLTEXT\s+INDEX\s+`?(\w+)`?\s+ON\s+`?(\w+)`?\s*\(([^)]*)\)",
+                         statement, re.IGNORECASE)
+            statements.extend(_fulltext_index(m.group(1), m.group(2), m.group(3)))
+        elif re.match(r"CREATE\s+(?:UNIQUE\s+)?INDEX\b", statement, re.IGNORECASE):
+            statements.append(_index_columns(statement))
+        elif re.match(r"DROP\s+INDEX\s+\w+\s+ON\b", statement, re.IGNORECASE):
+            # SQLite index names are schema-wide: no ON <table>
+            name = re.match(r"DROP\s+INDEX\s+`?(\w+)", statement, re.IGNORECASE).group(1)
+            statements.append(f"DROP INDEX IF EXISTS {name}")
+        elif re.match(r"ALTER\s+TABLE\s+\w+\s+ADD\s+(?:UNIQUE\s+)?(?:INDEX|KEY)\b", statement, re.IGNORECASE):
+            m = re.match(r"ALTER\s+TABLE\s+`?(\w+)`?\s+ADD\s+(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)",
+                         statement, re.IGNORECASE)
+            unique = "UNIQUE " if m.group(2) else ""
+            statements.append(f"CREATE {unique}INDEX IF NOT EXISTS {m.group(3)} "
+                              f"ON {m.group(1)} ({_index_columns(m.group(4))})")
+        else:
+            statements.append(_translate_dml(statement.replace("`", '"')))
+    return statements, skipped
+
+# ---------- SQL functions ----------
+
+def _regexp_like(value, pattern, flags=""):
+    if value is None or pattern is None:
+        return None
+    return 1 if re.search(pattern, str(value), re.IGNORECASE if "i" in (flags or "") else 0) else 0
+
+def _char_length(value):
+    return None if value is None else len(str(value))
+
+def _concat(*values):
+    return None if any(v is None for v in values) else "".join(str(v) for v in values)
+
+def _datediff(end, start):
+    if end is None or start is None:
+        return None
+    return (datetime.date.fromisoformat(str(end)[:10]) - datetime.date.fromisoformat(str(start)[:10])).days
+
+def _register_functions(raw):
+    raw.create_function("REGEXP_LIKE", 2, _regexp_like, deterministic=True)
+    raw.create_function("REGEXP_LIKE", 3, _regexp_like, deterministic=True)
+    raw.create_function("CHAR_LENGTH", 1, _char_length, deterministic=True)
+    raw.create_function("CONCAT", -1, _concat, deterministic=True)
+    raw.create_function("DATEDIFF", 2, _datediff, deterministic=True)
+    raw.create_function("CURDATE", 0, lambda: datetime.date.today().isoformat())
+    raw.create_function("NOW", 0, lambda: datetime.datetime.now().isoformat(" ", "seconds"))
+
+# ---------- connections ----------
+
+class SQLiteCursor:
+    """mysql.connector-style cursor over a sqlite3 cursor"""
+
+    def __init__(self, connection, dictionary=False, prepared=False):
+        self._connection = connection
+        self._cursor = connection._raw.cursor()
+        self._dictionary = dictionary
+        self._prepared = prepared
+        self._columns = None
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def column_names(self):
+        return self._columns or ()
+
+    @property
+    def with_rows(self):
+        return self._cursor.description is not None
+
+    def execute(self, query, params=None):
+        sql = translate_query(query, params is not None or self._prepared)
+        try:
+            if params is None and self._prepared and _placeholder_count(sql):
+                # Like a MySQL prepared cursor without parameters: compile only
+                self._cursor.execute("EXPLAIN " + sql, (None,) * _placeholder_count(sql))
+                self._cursor.fetchall()
+                self._columns = None
+                return
+            self._cursor.execute(sql, tuple(params) if params else ())
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+        self._columns = [d[0] for d in self._cursor.description] if self._cursor.description else None
+
+    def executemany(self, query, rows):
+        try:
+            self._cursor.executemany(translate_query(query, True), [tuple(r) for r in rows])
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+        self._columns = None
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip(self._columns, row))
+
+    def fetchone(self):
+        return self._row(self._fetch(self._cursor.fetchone))
+
+    def fetchmany(self, size=1):
+        return [self._row(r) for r in self._fetch(self._cursor.fetchmany, size)]
+
+    def fetchall(self):
+        return [self._row(r) for r in self._fetch(self._cursor.fetchall)]
+
+    def _fetch(self, method, *args):
+        try:
+            return method(*args)
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+
+    def close(self):
+        self._cursor.close()
+
+class SQLiteConnection:
+    """mysql.connector-style connection over a sqlite3 connection (autocommit mode)"""
+
+    dialect = DIALECT
+    unread_result = False
+
+    def __init__(self, raw):
+        self._raw = raw
+
+    @property
+    def in_transaction(self):
+        return self._raw.in_transaction
+
+    @property
+    def autocommit(self):
+        return not self._raw.in_transaction
+
+    def cursor(self, dictionary=False, prepared=False, buffered=None, **_):
+        return SQLiteCursor(self, dictionary=dictionary, prepared=prepared)
+
+    def start_transaction(self, **_):
+        try:
+            self._raw.execute("BEGIN")
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+
+    def commit(self):
+        if self._raw.in_transaction:
+            try:
+                self._raw.commit()
+            except sqlite3.Error as e:
+                raise _mysql_error(e) from e
+
+    def rollback(self):
+        if self._raw.in_transaction:
+            self._raw.rollback()
+
+    def reset_session(self):
+        self.rollback()
+
+    def ping(self, reconnect=False, **_):
+        try:
+            self._raw.execute("SELECT 1").fetchone()
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+
+    def is_connected(self):
+        try:
+            self.ping()
+            return True
+        except mysql_errors.Error:
+            return False
+
+    def close(self):
+        self._raw.close()
+
+    disconnect = close
+
+class SQLiteDatabase:
+    """
+    One SQLite database file (or private in-memory database)
+
+    An in-memory database lives in SQLite's shared cache and is kept alive by
+    a keeper connection, so pooled connections can come and go. Shared-cache
+    locks fail instead of waiting, so max_connections is 1 for it; file
+    databases use WAL and allow several concurrent readers.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.memory = path in ("", ":memory:")
+        if self.memory:
+            self._target = f"file:workshop_mem_{os.getpid()}_{next(_memory_ids)}?mode=memory&cache=shared"
+            self.max_connections = 1
+        else:
+            self._target = path
+            self.max_connections = 10
+        self.path = path
+        self._keeper = self._connect_raw() if self.memory else None
+        if not self.memory:
+            self._keeper_setup()
+
+    def _keeper_setup(self):
+        raw = self._connect_raw()
+        try:
+            raw.execute("PRAGMA journal_mode=WAL")
+        finally:
+            raw.close()
+
+    def _connect_raw(self):
+        raw = sqlite3.connect(
+            self._target,
+            uri=self.memory,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        raw.execute("PRAGMA foreign_keys = ON")
+        raw.execute("PRAGMA busy_timeout = 5000")
+        if not self.memory:
+            raw.execute("PRAGMA synchronous = NORMAL")
+        _register_functions(raw)
+        return raw
+
+    def connect(self, **_):
+        """New connection (used as the ConnectionPool connect factory)"""
+        try:
+            return SQLiteConnection(self._connect_raw())
+        except sqlite3.Error as e:
+            raise _mysql_error(e) from e
+
+    def has_schema(self):
+        """True if the workshop tables already exist"""
+        raw = self._connect_raw()
+        try:
+            row = raw.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'service_job'"
+            ).fetchone()
+            return row[0] > 0
+        finally:
+            raw.close()
+
+    def load_schema(self, schema_file=SCHEMA_FILE):
+        """
+        Create the tables (and sample rows) from a MySQL script
+
+        Returns:
+            List of skipped MySQL objects (procedures, functions, procedural triggers)
+        """
+        with open(schema_file, encoding="utf-8") as f:
+            statements, skipped = translate_schema(f.read())
+
+        raw = self._connect_raw()
+        try:
+            raw.execute("BEGIN")
+            for statement in statements:
+                try:
+                    raw.execute(statement)
+                except sqlite3.Error as e:
+                    raw.rollback()
+                    raise _mysql_error(sqlite3.DatabaseError(f"{e} in: {statement[:80]}")) from e
+            raw.commit()
+        finally:
+            raw.close()
+        return skipped
+
+    def close(self):
+        if self._keeper is not None:
+            self._keeper.close()
+            self._keeper = None
@@ -0,0 +1,110 @@
+import csv
+import gzip
+import threading
+import time
+
+import pytest
+
+import export_view
+from async_ui import AsyncViewMixin
+from export_view import ExportMixin
+
+from DB_connecrtors import initialize_connection_pool, close_pool, stream_query
+from query_registry import sql
+from export import export_rows
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    assert initialize_connection_pool(f"sqlite:{tmp_path_factory.mktemp('db') / 'workshop.db'}")
+    yield
+    close_pool()
+
+def read_csv(path):
+    with gzip.open(path, "rt", newline="") as f:
+        return list(csv.reader(f))
+
+def test_empty_result_keeps_csv_header(database, tmp_path):
+    path = str(tmp_path / "customers.csv.gz")
+    columns = []
+    rows = stream_query(sql("export_customers").replace("ORDER BY", "WHERE 1 = 0 ORDER BY"), columns=columns)
+
+    assert export_rows(rows, path, columns=columns) == 0
+    assert read_csv(path) == [["Customer_ID", "Name", "email_ID", "Phone_no", "license_No",
+                               "Age", "First_Joined", "empID"]]
+
+def test_rows_follow_header(database, tmp_path):
+    path = str(tmp_path / "reps.csv.gz")
+    columns = []
+
+    written = export_rows(stream_query(sql("export_customer_reps"), columns=columns), path, columns=columns)
+
+    lines = read_csv(path)
+    assert lines[0] == ["Employee_ID", "Name", "Phone_Number", "YOE"]
+    assert len(lines) == written + 1 and written > 0
+
+def test_cancel_mid_stream_leaves_no_file(tmp_path):
+    path = tmp_path / "jobs.csv.gz"
+    stop = threading.Event()
+
+    def rows():
+        for i in range(1000):
+            if i == 500:
+                stop.set()
+            yield {"Service_ID": i}
+
+    assert export_rows(rows(), str(path), stop=stop) is None
+    assert list(tmp_path.iterdir()) == []
+
+class FakeView(ExportMixin, AsyncViewMixin):
+    """A view without Tk: after() callbacks are run by pump()"""
+
+    def __init__(self):
+        self.init_async()
+        self.output = self.Output()
+        self._after = []
+
+    class Output:
+        text = ""
+
+        def delete(self, *args):
+            self.text = ""
+
+        def insert(self, _index, text):
+            self.text += text
+
+    def bind(self, *args, **kwargs):
+        pass
+
+    def after(self, _ms, func, *args):
+        self._after.append((func, args))
+
+    def pump(self, until, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            if self._after:
+                func, args = self._after.pop(0)
+                func(*args)
+            time.sleep(0.001)
+
+def test_cancelled_export_is_reported(tmp_path, monkeypatch):
+    path = tmp_path / "jobs.csv.gz"
+    monkeypatch.setattr(export_view.filedialog, "asksaveasfilename", lambda **kwargs: str(path))
+    started, resume = threading.Event(), threading.Event()
+
+    def rows(columns):
+        for i in range(100_000):
+            if i == 100:
+                started.set()
+                resume.wait(10)
+            yield {"Service_ID": i}
+
+    view = FakeView()
+    view.start_export("jobs", rows)
+    assert started.wait(10)
+    view.cancel_pending()
+    resume.set()
+    view.pump(lambda: view.output.text)
+
+    assert view.output.text.startswith("Export cancelled")
+    assert not view._tasks
+    assert list(tmp_path.iterdir()) == []
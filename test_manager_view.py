@@ -0,0 +1,33 @@
+import pytest
+
+import DB_connecrtors
+import ManagerView
+from DB_connecrtors import initialize_connection_pool, close_pool, run_query
+from query_registry import sql
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    assert initialize_connection_pool(f"sqlite:{tmp_path_factory.mktemp('db') / 'workshop.db'}")
+    # Job 101 is T001's and job 102 is T003's in the sample data
+    assert run_query("INSERT INTO parts (JobID, Part_No, Quantity, Price) VALUES "
+                     "(101, 'BRK9-X1', 1, 100), (102, 'PADZ-77', 2, 100), (103, 'BRK:', 1, 100)") is True
+    yield
+    close_pool()
+
+@pytest.mark.parametrize("pattern, tech_id", [("BRK9%", "T001"), ("padz*", "T003")])
+def test_prefix_ending_in_9_or_z_finds_technicians(database, pattern, tech_id):
+    found = ManagerView.get_techs_by_part(pattern)
+
+    assert [row["technician_ID"] for row in found] == [tech_id]
+
+@pytest.mark.parametrize("pattern, like", [("BRK9%", "BRK9%"), ("padz*", "PADZ%"), ("A_B%", "A!_B%")])
+def test_mysql_prefix_is_a_plain_like(monkeypatch, pattern, like):
+    calls = []
+    monkeypatch.setattr(DB_connecrtors, "dialect", "mysql")
+    monkeypatch.setattr(ManagerView, "run_named", lambda name, params, fetch: calls.append((name, params)) or [])
+
+    ManagerView.get_techs_by_part(pattern)
+
+    # No hand-built range: its bound would sort below the prefix in utf8mb4_0900_ai_ci
+    assert calls == [("techs_by_part_prefix", (like,))]
+    assert ">=" not in sql("techs_by_part_prefix")
@@ -0,0 +1,43 @@
+import pytest
+
+import DB_connecrtors
+import typeahead
+from DB_connecrtors import initialize_connection_pool, close_pool, run_query
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    assert initialize_connection_pool(f"sqlite:{tmp_path_factory.mktemp('db') / 'workshop.db'}")
+    # No jobs, so neither is among the hot keys - both need a database lookup
+    assert run_query("INSERT INTO customers (Customer_ID, Name, Phone_no, license_No, Age, First_Joined, empID) "
+                     "VALUES ('CUST09', 'Neha Iyer', '9912345678', 'DL09876543210987', 31, '2024-02-01', 'E01')") is True
+    assert run_query("INSERT INTO vehicle (Reg_No, Make, Model, Year, Chassis_No, Body_type, CustomerID, EmpID) "
+                     "VALUES ('KA09MN4321', 'Kia', 'Seltos', 2023, 'CHASSISNO99999999', 'SUV', 'CUST09', 'E01')") is True
+    typeahead.clear_hot_keys()
+    yield
+    typeahead.clear_hot_keys()
+    close_pool()
+
+@pytest.mark.parametrize("text, kind, entity_id", [
+    ("99", "customer", "CUST09"),
+    ("cust09", "customer", "CUST09"),
+    ("ka09", "vehicle", "KA09MN4321"),
+])
+def test_prefix_ending_in_9_finds_rows(database, text, kind, entity_id):
+    found = typeahead.suggest(text)
+
+    assert {"kind": kind, "id": entity_id} in [{"kind": s["kind"], "id": s["id"]} for s in found]
+
+def test_mysql_key_prefixes_use_like(monkeypatch):
+    queries = []
+    monkeypatch.setattr(DB_connecrtors, "dialect", "mysql")
+    monkeypatch.setattr(typeahead, "run_query", lambda query, params, fetch: queries.append((query, params)) or [])
+
+    typeahead._lookup_database("98", 10)
+    typeahead._lookup_database("ka09", 10)
+
+    # A code point bound (':' after '9') sorts below the prefix in utf8mb4_0900_ai_ci
+    (phone_query, phone_params), (key_query, key_params) = queries
+    assert "Phone_no LIKE %s ESCAPE '!'" in phone_query and phone_params[:2] == ["98%", 10]
+    assert "Customer_ID LIKE %s ESCAPE '!'" in key_query and "Reg_No LIKE %s ESCAPE '!'" in key_query
+    assert key_params[-4:] == ["KA09%", 10, "KA09%", 10]
+    assert ">=" not in phone_query + key_query
@@ -0,0 +1,357 @@
+"""
+typeahead.py - Prefix suggestions for customers, vehicles and technicians.
+
+Suggestions for what a rep has typed so far come from an in-memory sorted
+index of hot keys first:
+- every technician (first name, last name, full name, ID),
+- the customers and vehicles of the most recent HOT_JOBS jobs (name and
+  each word of it, phone, email, ID, Reg_No),
+- anything a database lookup or a write in this process has shown since
+  (writes arrive as change events, see events.py).
+
+The index is refreshed incrementally: only jobs newer than the last one
+seen are read, and it grows as lookups promote rows into it. A prefix goes
+to the database (migration 006's prefix indexes, or the vehicle primary
+key) only when memory can't fill the suggestion list; a lookup that comes
+back short is remembered as complete for a while, so typing further on the
+same prefix is answered from memory alone.
+"""
+
+import bisect
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import DB_connecrtors
+from DB_connecrtors import run_query
+from query_registry import run_named
+from events import subscribe, TechnicianAdded, TechnicianDeleted, CustomerAdded, VehicleAdded
+
+MIN_PREFIX = 2
+SUGGESTION_LIMIT = 10
+# Jobs whose customers and vehicles are loaded up front
+HOT_JOBS = 20_000
+# Seconds between incremental refreshes (checked on lookup)
+REFRESH_INTERVAL = 30.0
+# Prefixes whose database lookup came back short, and for how long that holds
+COMPLETE_PREFIXES = 512
+COMPLETE_TTL = 60.0
+
+CUSTOMER, VEHICLE, TECHNICIAN = "customer", "vehicle", "technician"
+
+# Vehicles and owners of the newest jobs above a Service_ID
+_HOT_SQL = """
+SELECT DISTINCT v.Reg_No, v.Make, v.Model, c.Customer_ID, c.Name, c.Phone_no, c.email_ID
+FROM (
+    SELECT Reg_no FROM service_job WHERE Service_ID > %s
+    ORDER BY Service_ID DESC LIMIT %s
+) j
+JOIN vehicle v ON v.Reg_No = j.Reg_no
+JOIN customers c ON c.Customer_ID = v.CustomerID
+"""
+
+# "Starts with" on the phone, ID and Reg_No indexes. MySQL makes a LIKE with
+# a constant prefix an index range itself, and utf8mb4_0900_ai_ci doesn't
+# sort by code point - a hand-built bound (':' after '9') would fall below
+# the prefix. SQLite uses these BINARY indexes only for an explicit range,
+# where the code point successor is exact.
+_STARTS_WITH = {
+    "mysql": "{column} LIKE %s ESCAPE '!'",
+    "sqlite": "{column} >= %s AND {column} < %s",
+}
+
+_CUSTOMER_COLUMNS = "'customer' AS kind, Customer_ID AS id, Name, Phone_no, email_ID, NULL AS Make, NULL AS Model"
+
+def _lookups(starts_with):
+    """One branch per kind of key; each is an index range scan capped at LIMIT"""
+    return {
+        "name": f"SELECT {_CUSTOMER_COLUMNS} FROM customers WHERE Name LIKE %s ESCAPE '!' LIMIT %s",
+        "email": f"SELECT {_CUSTOMER_COLUMNS} FROM customers WHERE email_ID LIKE %s ESCAPE '!' LIMIT %s",
+        "phone": f"SELECT {_CUSTOMER_COLUMNS} FROM customers "
+                 f"WHERE {starts_with.format(column='Phone_no')} LIMIT %s",
+        "customer_id": f"SELECT {_CUSTOMER_COLUMNS} FROM customers "
+                       f"WHERE {starts_with.format(column='Customer_ID')} LIMIT %s",
+        "reg_no": "SELECT 'vehicle' AS kind, Reg_No AS id, CustomerID AS Name, NULL AS Phone_no, "
+                  f"NULL AS email_ID, Make, Model FROM vehicle WHERE {starts_with.format(column='Reg_No')} LIMIT %s",
+    }
+
+_LOOKUPS = {dialect: _lookups(starts_with) for dialect, starts_with in _STARTS_WITH.items()}
+
+def _normalize(text):
+    return " ".join((text or "").lower().split())
+
+def _successor(prefix):
+    """Smallest string greater than every string starting with prefix"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+def _like_prefix(prefix):
+    """LIKE pattern for 'starts with prefix' (! escapes the wildcards)"""
+    return re.sub(r"([!%_])", r"!\1", prefix) + "%"
+
+def _starts_with_params(prefix):
+    """Params of a _STARTS_WITH test for the active backend"""
+    if DB_connecrtors.dialect == "sqlite":
+        return [prefix, _successor(prefix)]
+    return [_like_prefix(prefix)]
+
+class PrefixIndex:
+    """
+    Sorted (key, entity) pairs searched with bisect
+
+    An entity is a (kind, id) pair with a display label and a few search
+    keys; re-adding an entity replaces its keys. Thread-safe.
+    """
+
+    def __init__(self):
+        self._pairs = []
+        self._entities = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entities)
+
+    def add(self, kind, entity_id, label, keys):
+        self.add_many([(kind, entity_id, label, keys)])
+
+    def add_many(self, items):
+        """Index (kind, id, label, keys) items; a large batch is merged with one sort"""
+        items = list(items)
+        with self._lock:
+            added = []
+            for kind, entity_id, label, keys in items:
+                entity = (kind, entity_id)
+                keys = {_normalize(k) for k in keys if k}
+                old = self._entities.get(entity)
+                self._entities[entity] = (label, keys)
+                if old is not None:
+                    if old[1] == keys:
+                        continue
+                    self._remove_keys(entity, old[1])
+                added.extend((key, entity) for key in keys)
+            if len(added) > 64:
+                self._pairs.extend(added)
+                self._pairs.sort()
+            else:
+                for pair in added:
+                    bisect.insort(self._pairs, pair)
+
+    def remove(self, kind, entity_id):
+        entity = (kind, entity_id)
+        with self._lock:
+            old = self._entities.pop(entity, None)
+            if old is not None:
+                self._remove_keys(entity, old[1])
+
+    def _remove_keys(self, entity, keys):
+        for key in keys:
+            i = bisect.bisect_left(self._pairs, (key, entity))
+            if i < len(self._pairs) and self._pairs[i] == (key, entity):
+                del self._pairs[i]
+
+    def ids(self, kind):
+        """IDs of every entity of a kind"""
+        with self._lock:
+            return [entity_id for k, entity_id in self._entities if k == kind]
+
+    def lookup(self, prefix, limit=SUGGESTION_LIMIT):
+        """
+        Entities with a key starting with prefix, in key order
+
+        Returns:
+            List of {"kind", "id", "label"} dicts (at most limit)
+        """
+        prefix = _normalize(prefix)
+        found = []
+        seen = set()
+        with self._lock:
+            i = bisect.bisect_left(self._pairs, (prefix,))
+            while i < len(self._pairs) and len(found) < limit:
+                key, entity = self._pairs[i]
+                if not key.startswith(prefix):
+                    break
+                if entity not in seen:
+                    seen.add(entity)
+                    found.append({"kind": entity[0], "id": entity[1], "label": self._entities[entity][0]})
+                i += 1
+        return found
+
+_index = PrefixIndex()
+_state_lock = threading.Lock()
+# Highest Service_ID whose vehicle and customer are indexed (None = not loaded)
+_watermark = None
+_refreshed_at = 0.0
+# Prefix -> time its database lookup came back short
+_complete = OrderedDict()
+
+def _customer_item(customer_id, name, phone=None, email=None):
+    words = (name or "").split()
+    return (CUSTOMER, customer_id, f"{name} | {phone or '-'} | {email or '-'} ({customer_id})",
+            [name, phone, email, customer_id] + words[1:])
+
+def _vehicle_item(reg_no, make, model, customer_id):
+    return (VEHICLE, reg_no, f"{reg_no} | {make} {model} (owner {customer_id})", [reg_no])
+
+def _technician_item(t):
+    return (TECHNICIAN, t["technician_ID"], f"{t['Fname']} {t['Name']} - {t['Specialization']} ({t['technician_ID']})",
+            [t["Fname"], t["Name"], f"{t['Fname']} {t['Name']}", t["technician_ID"]])
+
+def _row_items(row):
+    """Index items of one row of _HOT_SQL or _LOOKUPS"""
+    if row.get("kind") == VEHICLE:
+        return [_vehicle_item(row["id"], row["Make"], row["Model"], row["Name"])]
+    if row.get("kind") == CUSTOMER:
+        return [_customer_item(row["id"], row["Name"], row["Phone_no"], row["email_ID"])]
+    return [_vehicle_item(row["Reg_No"], row["Make"], row["Model"], row["Customer_ID"]),
+            _customer_item(row["Customer_ID"], row["Name"], row["Phone_no"], row["email_ID"])]
+
+def _load_technicians():
+    """Replace the indexed technicians with the current ones (a few hundred rows)"""
+    techs = run_named("technician_picklist", fetch=True, cache=True)
+    if isinstance(techs, str):
+        return
+    _index.add_many(_technician_item(t) for t in techs)
+    current = {t["technician_ID"] for t in techs}
+    for tech_id in set(_index.ids(TECHNICIAN)) - current:
+        _index.remove(TECHNICIAN, tech_id)
+
+def refresh_hot_keys(force=False):
+    """
+    Load the hot keys, or add the ones of jobs created since the last refresh
+
+    The first call indexes the customers and vehicles of the newest HOT_JOBS
+    jobs; later calls read only jobs above the watermark. Technicians are
+    re-read each time (the picklist is cached and invalidated on writes).
+    """
+    global _watermark, _refreshed_at
+    with _state_lock:
+        if not force and _watermark is not None and time.monotonic() - _refreshed_at < REFRESH_INTERVAL:
+            return
+        _refreshed_at = time.monotonic()
+
+        # Read the watermark first: a job created meanwhile is read again
+        # next time rather than missed
+        latest = run_query("SELECT MAX(Service_ID) AS last_id FROM service_job", fetch=True)
+        after = _watermark if _watermark is not None else -2**31
+        rows = run_query(_HOT_SQL, (after, HOT_JOBS), fetch=True)
+        if isinstance(latest, str) or isinstance(rows, str):
+            return
+        _index.add_many(item for row in rows for item in _row_items(row))
+        if latest and latest[0]["last_id"] is not None:
+            _watermark = latest[0]["last_id"]
+        elif _watermark is None:
+            _watermark = after
+
+    _load_technicians()
+
+def note_customer(customer_id, name, phone=None, email=None):
+    """Index a customer written by this process (no database read)"""
+    _index.add(*_customer_item(customer_id, name, phone or None, email or None))
+
+def note_vehicle(reg_no, make, model, customer_id):
+    """Index a vehicle written by this process (no database read)"""
+    _index.add(*_vehicle_item(reg_no, make, model, customer_id))
+
+# Writes made in this process are indexed as they are published
+subscribe(TechnicianAdded, lambda event: _index.add(*_technician_item(event.row)))
+subscribe(TechnicianDeleted, lambda event: _index.remove(TECHNICIAN, event.tech_id))
+subscribe(CustomerAdded, lambda event: note_customer(
+    event.row["Customer_ID"], event.row["Name"], event.row["Phone_no"], event.row["email_ID"]))
+subscribe(VehicleAdded, lambda event: note_vehicle(
+    event.row["Reg_No"], event.row["Make"], event.row["Model"], event.row["CustomerID"]))
+
+def _known_complete(prefix):
+    """True if a shorter (or equal) prefix's database lookup returned everything"""
+    now = time.monotonic()
+    with _state_lock:
+        for stale in [p for p, at in _complete.items() if now - at > COMPLETE_TTL]:
+            del _complete[stale]
+        for i in range(len(prefix), MIN_PREFIX - 1, -1):
+            if prefix[:i] in _complete:
+                _complete.move_to_end(prefix[:i])
+                return True
+    return False
+
+def _mark_complete(prefix):
+    with _state_lock:
+        _complete[prefix] = time.monotonic()
+        _complete.move_to_end(prefix)
+        while len(_complete) > COMPLETE_PREFIXES:
+            _complete.popitem(last=False)
+
+def _lookup_database(prefix, limit):
+    """
+    Prefix lookups through the indexes, indexed into memory as they return
+
+    Returns:
+        True if no lookup was cut off by the limit (memory now holds every match)
+    Raises:
+        RuntimeError with the error string if the query fails
+    """
+    branches, params = [], []
+    if prefix.isdigit():
+        branches.append("phone")
+        params += _starts_with_params(prefix) + [limit]
+    else:
+        like = _like_prefix(prefix)
+        branches += ["name", "email"]
+        params += [like, limit, like, limit]
+    key = prefix.replace(" ", "").upper()
+    if key.isalnum():
+        # IDs and registration numbers are stored upper-case
+        branches += ["customer_id", "reg_no"]
+        params += _starts_with_params(key) + [limit] + _starts_with_params(key) + [limit]
+
+    lookups = _LOOKUPS[DB_connecrtors.dialect]
+    query = " UNION ALL ".join(
+        f"SELECT '{name}' AS branch, b{i}.* FROM ({lookups[name]}) b{i}"
+        for i, name in enumerate(branches)
+    )
+    rows = run_query(query, params, fetch=True)
+    if isinstance(rows, str):
+        raise RuntimeError(rows)
+
+    counts = dict.fromkeys(branches, 0)
+    for row in rows:
+        counts[row["branch"]] += 1
+    _index.add_many(item for row in rows for item in _row_items(row))
+    return all(n < limit for n in counts.values())
+
+def suggest(text, limit=SUGGESTION_LIMIT):
+    """
+    Suggestions for a partly typed customer name / phone / email / ID,
+    Reg_No or technician name
+
+    Returns:
+        - List of {"kind", "id", "label"} dicts, at most limit, in key order
+        - Error string if a database lookup failed
+    """
+    prefix = _normalize(text)
+    if len(prefix) < MIN_PREFIX:
+        return []
+
+    try:
+        refresh_hot_keys()
+        found = _index.lookup(prefix, limit)
+        if len(found) >= limit or _known_complete(prefix):
+            return found
+
+        if _lookup_database(prefix, limit):
+            _mark_complete(prefix)
+        return _index.lookup(prefix, limit)
+
+    except Exception as e:
+        print(f"Error looking up suggestions: {e}")
+        return str(e)
+
+def clear_hot_keys():
+    """Forget everything held in memory (the next lookup reloads the hot keys)"""
+    global _index, _watermark
+    with _state_lock:
+        _index = PrefixIndex()
+        _watermark = None
+        _complete.clear()
+
+def hot_key_stats():
+    """Entities held in memory and the job watermark (for diagnostics)"""
+    return {"entities": len(_index), "watermark": _watermark, "complete_prefixes": len(_complete)}